@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import math
 import os
 from pathlib import Path
 import sys
@@ -120,6 +121,66 @@ def build_parser() -> argparse.ArgumentParser:
             "size and available CPUs)"
         ),
     )
+    learning.add_argument(
+        "--worker-backend",
+        choices=("thread", "process"),
+        default="thread",
+        help=(
+            "Population evaluation backend; 'process' runs genetic members in "
+            "worker processes to use every core (default: thread)"
+        ),
+    )
+    learning.add_argument(
+        "--batched-updates",
+        action="store_true",
+        help=(
+            "genetic_dqn only: run every member's due replay update of a tick "
+            "as one stacked backward pass"
+        ),
+    )
+    learning.add_argument(
+        "--decision-interval",
+        type=int,
+        default=1,
+        help=(
+            "Physics ticks each policy decision is held for; rewards and "
+            "lap/collision events are accumulated across the held ticks"
+        ),
+    )
+    learning.add_argument(
+        "--actors",
+        type=int,
+        default=1,
+        help=(
+            "Standalone DQN only: parallel actor environments feeding the "
+            "one replay memory (default: 1)"
+        ),
+    )
+    learning.add_argument(
+        "--learner-thread",
+        action="store_true",
+        help=(
+            "Standalone DQN only: run gradient updates on a background thread "
+            "so simulation and rendering never wait on backprop"
+        ),
+    )
+    learning.add_argument(
+        "--replay-ratio",
+        type=float,
+        help=(
+            "Gradient updates per environment decision for --learner-thread "
+            "(default: one per DQN train interval)"
+        ),
+    )
+    learning.add_argument(
+        "--publish-interval",
+        type=int,
+        default=4,
+        help=(
+            "Learner updates between weight publishes to the acting policy "
+            "(default: 4)"
+        ),
+    )
     learning.add_argument(
         "--generations",
         type=int,
@@ -158,6 +219,13 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Do not save --checkpoint on exit (S still saves interactively)",
     )
+    learning.add_argument(
+        "--autosave-generations",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Write --checkpoint in the background every N generations (0 disables)",
+    )
     learning.add_argument(
         "--gif",
         type=Path,
@@ -209,8 +277,28 @@ def _run_learning(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
         parser.error("--initial-laps cannot exceed --max-laps")
     if args.workers is not None and args.workers <= 0:
         parser.error("--workers must be positive")
+    if args.decision_interval <= 0:
+        parser.error("--decision-interval must be positive")
+    if args.worker_backend == "process" and args.algorithm != "genetic":
+        parser.error("--worker-backend process requires --algorithm genetic")
+    if args.batched_updates and args.algorithm != "genetic_dqn":
+        parser.error("--batched-updates requires --algorithm genetic_dqn")
+    if args.actors > 1 and args.algorithm not in ("dqn", "double_dqn"):
+        parser.error("--actors above 1 requires --algorithm dqn or double_dqn")
+    if args.learner_thread and args.algorithm not in ("dqn", "double_dqn"):
+        parser.error("--learner-thread requires --algorithm dqn or double_dqn")
+    if args.replay_ratio is not None and not (
+        math.isfinite(args.replay_ratio) and args.replay_ratio > 0.0
+    ):
+        parser.error("--replay-ratio must be finite and positive")
+    if args.publish_interval <= 0:
+        parser.error("--publish-interval must be positive")
     if args.generations is not None and args.generations <= 0:
         parser.error("--generations must be positive")
+    if args.autosave_generations < 0:
+        parser.error("--autosave-generations must be non-negative")
+    if args.autosave_generations and not args.checkpoint:
+        parser.error("--autosave-generations requires --checkpoint")
 
     from .src.learning_game import DrivingLearningGame
     from .src.environment import DrivingEnv
@@ -218,6 +306,15 @@ def _run_learning(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
 
     if args.max_laps > DrivingEnv.MAX_LAP_TARGET:
         parser.error(f"--max-laps cannot exceed {DrivingEnv.MAX_LAP_TARGET}")
+    if args.decision_interval > DrivingEnv.MAX_DECISION_INTERVAL:
+        parser.error(
+            "--decision-interval cannot exceed "
+            f"{DrivingEnv.MAX_DECISION_INTERVAL}"
+        )
+    if not 1 <= args.actors <= LearningRuntimeConfig.MAX_ACTOR_COUNT:
+        parser.error(
+            f"--actors must be in [1, {LearningRuntimeConfig.MAX_ACTOR_COUNT}]"
+        )
 
     runtime = LearningRuntimeConfig(
         algorithm=args.algorithm,
@@ -235,6 +332,15 @@ def _run_learning(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
         mutation_rate=args.mutation_rate,
         mutation_std=args.mutation_std,
         parallel_workers=args.workers,
+        worker_backend=args.worker_backend,
+        batched_updates=args.batched_updates,
+        decision_interval=args.decision_interval,
+        learner_thread=args.learner_thread,
+        replay_ratio=args.replay_ratio,
+        publish_interval=args.publish_interval,
+        actor_count=args.actors,
+        autosave_generations=args.autosave_generations,
+        autosave_path=args.checkpoint,
     )
     session = DrivingLearningSession(
         runtime,
@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 import math
+import os
 
 import numpy as np
 
 from .math2d import Vec2, clamp
 from .terrain import Terrain, TerrainKind, terrain
+from .track_field import ClearanceField
+
+
+_TERRAIN_KINDS = tuple(TerrainKind)
+
+
+def _point_segment_distance(point: Vec2, start: Vec2, end: Vec2) -> float:
+    segment = end - start
+    length_squared = segment.length_squared()
+    along = clamp((point - start).dot(segment) / length_squared, 0.0, 1.0)
+    return (point - (start + segment * along)).length()
 
 
 @dataclass(frozen=True, slots=True)
@@ -84,6 +96,18 @@ class Circuit:
     _segment_lengths_squared_array: np.ndarray = field(
         init=False, repr=False, compare=False
     )
+    _projection_arrays: tuple[np.ndarray, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _clearance_field: ClearanceField | None = field(
+        init=False, repr=False, compare=False
+    )
+    _hint_windows: tuple[tuple[int, ...], ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _hint_radii_squared: tuple[float, ...] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if len(self.points) < 3:
@@ -146,6 +170,38 @@ class Circuit:
         object.__setattr__(
             self, "_segment_lengths_squared_array", lengths_squared_array
         )
+        # Batched projection reuses the scalar loop's Python-float geometry
+        # column by column, keeping every row bit-identical to ``project``.
+        projection_arrays = tuple(
+            np.asarray(column, dtype=np.float64)
+            for column in zip(
+                *(
+                    (
+                        start.x,
+                        start.y,
+                        segment.x,
+                        segment.y,
+                        length_squared,
+                        tangent.x,
+                        tangent.y,
+                        traversed,
+                        lengths[index],
+                    )
+                    for index, (
+                        start,
+                        segment,
+                        length_squared,
+                        tangent,
+                        traversed,
+                    ) in enumerate(projection_segments)
+                )
+            )
+        )
+        for array in projection_arrays:
+            array.setflags(write=False)
+        object.__setattr__(self, "_projection_arrays", projection_arrays)
+        object.__setattr__(self, "_clearance_field", None)
+        self._build_hint_windows()
         if not isinstance(self.runoff, TerrainKind):
             raise ValueError("Circuit runoff must be a TerrainKind")
         if any(not isinstance(sector, SurfaceSector) for sector in self.sectors):
@@ -171,15 +227,95 @@ class Circuit:
     def collision_radius(self) -> float:
         return self.track_width * 0.5 + self.runoff_width
 
-    def project(self, position: Vec2) -> TrackProjection:
+    def _build_hint_windows(self) -> None:
+        """Precompute when a segment hint alone decides the projection.
+
+        A hint's window is the segment and its two neighbours.  If the hinted
+        segment is the nearest of its window and the point lies closer to it
+        than half its gap to every segment outside the window, the triangle
+        inequality puts every outside segment strictly farther away, so
+        scanning the window is exact.
+        """
+
+        count = len(self.points)
+        windows = []
+        radii_squared = []
+        for index in range(count):
+            window = tuple(sorted({(index - 1) % count, index, (index + 1) % count}))
+            start = self.points[index]
+            end = self.points[(index + 1) % count]
+            gap = math.inf
+            for other in range(count):
+                if other in window:
+                    continue
+                other_start = self.points[other]
+                other_end = self.points[(other + 1) % count]
+                # Non-adjacent edges of a simple polygon do not cross, so
+                # their separation is attained at one of the four endpoints.
+                gap = min(
+                    gap,
+                    _point_segment_distance(start, other_start, other_end),
+                    _point_segment_distance(end, other_start, other_end),
+                    _point_segment_distance(other_start, start, end),
+                    _point_segment_distance(other_end, start, end),
+                )
+            radius = max(0.0, gap * 0.5 * (1.0 - 1e-9) - 1e-9)
+            windows.append(window)
+            radii_squared.append(radius * radius)
+        object.__setattr__(self, "_hint_windows", tuple(windows))
+        object.__setattr__(self, "_hint_radii_squared", tuple(radii_squared))
+
+    def project(self, position: Vec2, hint: int | None = None) -> TrackProjection:
+        """Project *position* onto the center line.
+
+        *hint* is an optional segment index, usually the previous tick's
+        ``segment_index``.  When the position is provably nearest to the
+        hinted window only those segments are scanned; otherwise the clearance
+        field's per-cell candidate index narrows the search.  Results are
+        identical to a full scan, including the lowest-index tie break.
+        """
+
         if not all(math.isfinite(value) for value in (position.x, position.y)):
             raise ValueError("Projected position must be finite")
-        best: tuple[float, float, float, Vec2, float, int, float] | None = None
         position_x, position_y = position.x, position.y
+        if hint is not None:
+            if (
+                isinstance(hint, bool)
+                or not isinstance(hint, int)
+                or not 0 <= hint < len(self._projection_segments)
+            ):
+                raise ValueError("Projection hint must be a valid segment index")
+            projection = self._project_segments(
+                position_x, position_y, self._hint_windows[hint]
+            )
+            if (
+                projection[5] == hint
+                and projection[0] < self._hint_radii_squared[hint]
+            ):
+                return self._projection_result(projection)
+        candidates = self.clearance_field().candidate_segments_at(
+            position_x, position_y
+        )
+        return self._projection_result(
+            self._project_segments(
+                position_x,
+                position_y,
+                range(len(self._projection_segments))
+                if candidates is None
+                else candidates,
+            )
+        )
 
-        for index, (start, segment, length_squared, tangent, traversed) in enumerate(
-            self._projection_segments
-        ):
+    def _project_segments(
+        self, position_x: float, position_y: float, indices: Iterable[int]
+    ) -> tuple[float, float, float, Vec2, float, int, float]:
+        """Scan *indices* in ascending order, keeping the first strict minimum."""
+
+        best: tuple[float, float, float, Vec2, float, int, float] | None = None
+        for index in indices:
+            start, segment, length_squared, tangent, traversed = (
+                self._projection_segments[index]
+            )
             along = 0.0
             if length_squared > 1e-12:
                 along = clamp(
@@ -208,6 +344,11 @@ class Circuit:
                 )
 
         assert best is not None
+        return best
+
+    def _projection_result(
+        self, best: tuple[float, float, float, Vec2, float, int, float]
+    ) -> TrackProjection:
         (
             distance_squared,
             nearest_x,
@@ -226,6 +367,31 @@ class Circuit:
             segment_index=index,
         )
 
+    def distances_to_centerline_array(self, positions: np.ndarray) -> np.ndarray:
+        """Array form of :meth:`distances_to_centerline` for ``(N, 2)`` input.
+
+        The per-segment arithmetic is the scalar loop's, so every reading is
+        bit-identical to ``project(position).distance``.
+        """
+
+        values = np.asarray(positions, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != 2:
+            raise ValueError("Projected positions must have shape (N, 2)")
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Projected positions must be finite")
+        start_x, start_y, segment_x, segment_y, length_squared = (
+            self._projection_arrays[:5]
+        )
+        position_x = values[:, 0:1]
+        position_y = values[:, 1:2]
+        along = (
+            (position_x - start_x) * segment_x + (position_y - start_y) * segment_y
+        ) / length_squared
+        np.clip(along, 0.0, 1.0, out=along)
+        delta_x = position_x - (start_x + segment_x * along)
+        delta_y = position_y - (start_y + segment_y * along)
+        return np.sqrt(np.min(delta_x * delta_x + delta_y * delta_y, axis=1))
+
     def distances_to_centerline(
         self, positions: Sequence[Vec2]
     ) -> tuple[float, ...]:
@@ -247,21 +413,9 @@ class Circuit:
             for point in points
         ):
             raise ValueError("Projected positions must be finite Vec2 values")
-        values = np.asarray(
-            [(point.x, point.y) for point in points], dtype=np.float64
-        )
-        deltas = values[:, None, :] - self._segment_starts_array[None, :, :]
-        along = np.einsum(
-            "nsi,si->ns", deltas, self._segment_vectors_array
-        ) / self._segment_lengths_squared_array[None, :]
-        np.clip(along, 0.0, 1.0, out=along)
-        nearest = (
-            self._segment_starts_array[None, :, :]
-            + along[:, :, None] * self._segment_vectors_array[None, :, :]
+        distances = self.distances_to_centerline_array(
+            np.asarray([(point.x, point.y) for point in points], dtype=np.float64)
         )
-        offsets = values[:, None, :] - nearest
-        squared = np.einsum("nsi,nsi->ns", offsets, offsets)
-        distances = np.sqrt(np.min(squared, axis=1))
         return tuple(float(value) for value in distances)
 
     def road_kind_at_progress(self, progress: float) -> TerrainKind:
@@ -270,8 +424,145 @@ class Circuit:
                 return sector.kind
         return TerrainKind.ASPHALT
 
+    def clearance_field(
+        self, *, cache_dir: str | os.PathLike[str] | None = None
+    ) -> ClearanceField:
+        """Return the lazily rasterized centerline distance field.
+
+        The first call builds the raster (or loads it from *cache_dir* when a
+        file with a matching geometry digest exists); later calls reuse it.
+        """
+
+        if self._clearance_field is None:
+            object.__setattr__(
+                self,
+                "_clearance_field",
+                ClearanceField.build(self, cache_dir=cache_dir),
+            )
+        return self._clearance_field
+
+    def clearances(self, positions: np.ndarray, threshold: float) -> np.ndarray:
+        """Return centerline distances for ``(N, 2)`` positions.
+
+        Readings are table lookups except near *threshold*, where the exact
+        segment distance is used, so ``reading >= threshold`` always agrees
+        with :meth:`distances_to_centerline_array`.
+        """
+
+        return self.clearance_field().distances_at(positions, threshold)
+
+    def barrier_exit_distances(
+        self, origins: np.ndarray, directions: np.ndarray
+    ) -> np.ndarray:
+        """Return where each ray first reaches ``collision_radius`` clearance.
+
+        The drivable region is the union of one capsule per centerline
+        segment.  A ray meets each convex capsule in one interval, so the
+        barrier contact is the end of the chain of overlapping intervals that
+        starts at the origin.  Origins already on or beyond the barrier
+        return ``0``.  *directions* must be unit vectors.
+        """
+
+        origin_values = np.asarray(origins, dtype=np.float64)
+        direction_values = np.asarray(directions, dtype=np.float64)
+        if (
+            origin_values.ndim != 2
+            or origin_values.shape[1] != 2
+            or direction_values.shape != origin_values.shape
+        ):
+            raise ValueError("Ray origins and directions must have shape (N, 2)")
+        if not (
+            np.all(np.isfinite(origin_values)) and np.all(np.isfinite(direction_values))
+        ):
+            raise ValueError("Ray origins and directions must be finite")
+        (
+            start_x,
+            start_y,
+            segment_x,
+            segment_y,
+            _length_squared,
+            tangent_x,
+            tangent_y,
+            _traversed,
+            segment_length,
+        ) = self._projection_arrays
+        radius = self.collision_radius
+        direction_x = direction_values[:, 0:1]
+        direction_y = direction_values[:, 1:2]
+        relative_x = origin_values[:, 0:1] - start_x
+        relative_y = origin_values[:, 1:2] - start_y
+
+        def slab(
+            offset: np.ndarray, rate: np.ndarray, low: float | np.ndarray, high: float
+        ) -> tuple[np.ndarray, np.ndarray]:
+            moving = np.abs(rate) > 1e-12
+            safe_rate = np.where(moving, rate, 1.0)
+            first = (low - offset) / safe_rate
+            second = (high - offset) / safe_rate
+            resting = (low <= offset) & (offset <= high)
+            enter = np.where(
+                moving, np.minimum(first, second), np.where(resting, -np.inf, np.inf)
+            )
+            exit_ = np.where(
+                moving, np.maximum(first, second), np.where(resting, np.inf, -np.inf)
+            )
+            return enter, exit_
+
+        along_enter, along_exit = slab(
+            relative_x * tangent_x + relative_y * tangent_y,
+            direction_x * tangent_x + direction_y * tangent_y,
+            0.0,
+            segment_length,
+        )
+        across_enter, across_exit = slab(
+            relative_y * tangent_x - relative_x * tangent_y,
+            direction_y * tangent_x - direction_x * tangent_y,
+            -radius,
+            radius,
+        )
+        enter = np.maximum(along_enter, across_enter)
+        exit_ = np.minimum(along_exit, across_exit)
+        missed = enter > exit_
+        enter[missed] = np.inf
+        exit_[missed] = -np.inf
+        for cap_x, cap_y in (
+            (relative_x, relative_y),
+            (relative_x - segment_x, relative_y - segment_y),
+        ):
+            half_b = direction_x * cap_x + direction_y * cap_y
+            discriminant = half_b * half_b - (
+                cap_x * cap_x + cap_y * cap_y - radius * radius
+            )
+            crossing = discriminant >= 0.0
+            root = np.sqrt(np.where(crossing, discriminant, 0.0))
+            enter = np.where(crossing, np.minimum(enter, -half_b - root), enter)
+            exit_ = np.where(crossing, np.maximum(exit_, -half_b + root), exit_)
+
+        # Walk the chain of capsule intervals covering the ray from its
+        # origin; each pass extends every unfinished ray past one more overlap.
+        reach = np.zeros(origin_values.shape[0], dtype=np.float64)
+        while True:
+            covering = (enter < reach[:, None]) & (exit_ > reach[:, None])
+            extended = np.max(np.where(covering, exit_, reach[:, None]), axis=1)
+            if np.array_equal(extended, reach):
+                return reach
+            reach = extended
+
     def terrain_at(self, position: Vec2) -> Terrain:
-        projection = self.project(position)
+        if not all(math.isfinite(value) for value in (position.x, position.y)):
+            raise ValueError("Projected position must be finite")
+        half_width = self.track_width * 0.5
+        field = self.clearance_field()
+        if field.distance_at(position.x, position.y, half_width) > half_width:
+            return terrain(self.runoff)
+        code = field.road_kind_code_at(position.x, position.y)
+        if code >= 0:
+            return terrain(_TERRAIN_KINDS[code])
+        return self.terrain_for_projection(self.project(position))
+
+    def terrain_for_projection(self, projection: TrackProjection) -> Terrain:
+        """Return the surface for a position whose projection is known."""
+
         if projection.distance <= self.track_width * 0.5:
             return terrain(self.road_kind_at_progress(projection.progress))
         return terrain(self.runoff)
@@ -4,16 +4,26 @@ from __future__ import annotations
 
 from bisect import bisect_right
 from collections import deque
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from enum import IntEnum
 import math
 import random
+from types import MappingProxyType
+from typing import NamedTuple
+
+import numpy as np
 
 from .circuits import Circuit, TrackProjection, get_circuit
 from .math2d import Vec2, clamp, wrap_angle
-from .terrain import TerrainKind
-from .vehicle import CarBuild, DriverControls, Vehicle
+from .terrain import Terrain, TerrainKind
+from .vehicle import (
+    CarBuild,
+    DriverControls,
+    Vehicle,
+    VehicleState,
+    VehicleTelemetry,
+)
 
 
 class DrivingAction(IntEnum):
@@ -37,13 +47,163 @@ ACTION_CONTROLS = {
 }
 
 
+class _StepSnapshot(NamedTuple):
+    """Values captured at the end of one tick for the step info mapping."""
+
+    circuit: str
+    terrain: str
+    on_road: bool
+    progress: float
+    episode_lap_progress: float
+    max_episode_lap_progress: float
+    episode_target_progress: float
+    max_episode_target_progress: float
+    laps: int
+    lap_target: int
+    lap_completed: bool
+    lap_target_completed: bool
+    checkpoint_advanced: bool
+    next_lap_checkpoint: int
+    current_lap_time: float
+    last_lap_time: float | None
+    best_lap_time: float | None
+    lap_time_reference: float
+    lap_time_bonus: float
+    episode_lap_time_bonus_total: float
+    lap_time_bonus_valid: bool
+    lap_candidate_valid: bool
+    lap_origin_progress: float
+    random_start_curriculum: bool
+    curriculum_unlocked: bool
+    curriculum_lap_completed: bool
+    spawn_mode: str
+    spawn_progress: float
+    collided: bool
+    collision_started: bool
+    impact_speed: float
+    heading_alignment: float
+    forward_clearance: float
+    usable_clearance: float
+    previous_usable_clearance: float
+    clearance_delta: float
+    green_ray_fraction: float
+    wall_closing: bool
+    clearance_motion_ratio: float
+    wall_contact_active: bool
+    wall_contact_steps: int
+    recent_collision_entries: int
+    steps_since_collision: int
+    collision_looped: bool
+    collision_recovery_active: bool
+    collision_recovery_steps: int
+    collision_recovery_clean_steps: int
+    collision_recoveries: int
+    collision_pressure: float
+    stagnation_steps: int
+    stagnated: bool
+    truncation_reason: str | None
+    decision_ticks: int
+    reward_terms: dict[str, float]
+    telemetry: VehicleTelemetry
+    episode_lap_times: list[float]
+    episode_lap_count: int
+
+
+# Snapshot fields served as-is; everything else comes from the expanded dict.
+_SNAPSHOT_INFO_INDEX = {
+    name: index
+    for index, name in enumerate(_StepSnapshot._fields)
+    if name not in {"reward_terms", "episode_lap_times", "episode_lap_count"}
+}
+
+
+class StepInfo(Mapping[str, object]):
+    """Read-only step info for the ``training`` info level.
+
+    Keys backed by the tick snapshot are answered directly.  The first
+    request for any other key expands the snapshot into the same dict the
+    ``full`` level returns, so every key remains available on demand.
+    """
+
+    # The per-tick fields read by population training and evaluation.
+    TRAINING_KEYS = (
+        "progress",
+        "episode_lap_progress",
+        "episode_target_progress",
+        "max_episode_target_progress",
+        "laps",
+        "lap_target",
+        "lap_completed",
+        "lap_target_completed",
+        "curriculum_lap_completed",
+        "episode_best_lap_time",
+        "episode_mean_lap_time",
+        "episode_lap_time_bonus_total",
+        "collided",
+        "collision_started",
+        "impact_speed",
+        "wall_contact_active",
+        "collision_looped",
+        "collision_recoveries",
+        "stagnated",
+        "truncation_reason",
+        "decision_ticks",
+    )
+
+    __slots__ = ("_snapshot", "_env_type", "_expanded")
+
+    def __init__(self, snapshot: _StepSnapshot, env_type: type[DrivingEnv]):
+        self._snapshot = snapshot
+        self._env_type = env_type
+        self._expanded: dict[str, object] | None = None
+
+    def __getitem__(self, key: str) -> object:
+        index = _SNAPSHOT_INFO_INDEX.get(key)
+        if index is not None:
+            return self._snapshot[index]
+        if key == "episode_best_lap_time" or key == "episode_mean_lap_time":
+            lap_times = self._snapshot.episode_lap_times[
+                : self._snapshot.episode_lap_count
+            ]
+            if not lap_times:
+                return None
+            if key == "episode_best_lap_time":
+                return min(lap_times)
+            return sum(lap_times) / len(lap_times)
+        return self.to_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"StepInfo({self.training_dict()!r})"
+
+    def training_dict(self) -> dict[str, object]:
+        """Return a mutable dict holding only :attr:`TRAINING_KEYS`."""
+
+        return {key: self[key] for key in self.TRAINING_KEYS}
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the full info dict, expanding the snapshot on first use."""
+
+        if self._expanded is None:
+            self._expanded = self._env_type._step_info_dict(self._snapshot)
+        return self._expanded
+
+
+_EMPTY_INFO: Mapping[str, object] = MappingProxyType({})
+
+
 @dataclass(frozen=True, slots=True)
 class StepResult:
     observation: tuple[float, ...]
     reward: float
     terminated: bool
     truncated: bool
-    info: dict[str, object]
+    info: Mapping[str, object]
 
     def __iter__(self):
         yield self.observation
@@ -76,9 +236,9 @@ class SensorRay:
     """One immutable track-clearance ray used by the driving policy.
 
     ``angle`` is an absolute world-space angle in radians.  ``distance`` and
-    ``endpoint`` describe the first sampled barrier contact, or the full ray
-    when ``hit`` is false.  The normalized distance is the exact value placed
-    in the neural-network observation.
+    ``endpoint`` describe the first barrier contact found by the environment's
+    sensor engine, or the full ray when ``hit`` is false.  The normalized
+    distance is the exact value placed in the neural-network observation.
     """
 
     angle: float
@@ -90,6 +250,38 @@ class SensorRay:
     hit: bool
 
 
+@dataclass(frozen=True, slots=True)
+class DrivingEnvSnapshot:
+    """Immutable capture of one :class:`DrivingEnv` simulation instant.
+
+    Produced by :meth:`DrivingEnv.snapshot` and consumed by
+    :meth:`DrivingEnv.restore` and :meth:`DrivingEnv.fork`.  It holds the
+    vehicle, lap, collision, curriculum and random-generator state plus the
+    pose-keyed projection and sensor caches, so restoring never re-runs a
+    reset, a projection or a ray fan.  Mutable containers are stored as
+    tuples; one snapshot can therefore seed any number of branches.
+    """
+
+    circuit: Circuit
+    build: CarBuild
+    fixed_dt: float
+    max_steps: int
+    random_start_curriculum: bool
+    sensor_engine: str
+    info_level: str
+    decision_interval: int
+    vehicle_state: tuple[float, ...]
+    vehicle_telemetry: VehicleTelemetry
+    random_state: tuple[object, ...]
+    episode: tuple[object, ...]
+    episode_lap_times: tuple[float, ...]
+    lap_trajectory: tuple[LapPose, ...]
+    best_laps: tuple[tuple[str, LapRecord], ...]
+    collision_entry_steps: tuple[int, ...]
+    reward_terms: tuple[tuple[str, float], ...]
+    caches: tuple[object, ...]
+
+
 class DrivingEnv:
     """Fixed-step track environment with observable physics and shaped reward."""
 
@@ -101,11 +293,18 @@ class DrivingEnv:
     LAP_TIME_BONUS_MAX = 150.0
     LAP_TIME_MINIMUM_RATIO = 0.75
     MAX_LAP_TARGET = 12
+    MAX_DECISION_INTERVAL = 30
     MAX_LAP_PROGRESS_STEP = 0.075
     BEST_LAP_EPSILON = 1e-9
     SENSOR_MAX_DISTANCE = 150.0
     SENSOR_SAMPLE_STEP = 6.0
     SENSOR_REFINEMENT_STEPS = 4
+    # ``sampled`` marches and bisects each ray; ``analytic`` intersects it with
+    # the barrier capsules in one pass and reports the exact contact.
+    SENSOR_ENGINES = ("sampled", "analytic")
+    # ``full`` builds the diagnostic info dict every tick, ``training`` returns
+    # a lazily expanded :class:`StepInfo`, and ``none`` an empty mapping.
+    INFO_LEVELS = ("full", "training", "none")
     STAGNATION_GRACE_STEPS = 90
     STAGNATION_LIMIT_STEPS = 240
     STAGNATION_PROGRESS_DISTANCE = 0.04
@@ -152,6 +351,59 @@ class DrivingEnv:
         math.pi / 2,
     )
 
+    # Immutable per-episode attributes copied verbatim by snapshots.  The
+    # order defines DrivingEnvSnapshot.episode and must stay append-only.
+    _SNAPSHOT_ATTRIBUTES = (
+        "seed",
+        "steps",
+        "laps",
+        "collisions",
+        "current_lap_time",
+        "last_lap_time",
+        "previous_progress",
+        "last_projection",
+        "_lap_target",
+        "_curriculum_unlocked",
+        "_spawn_mode",
+        "_spawn_progress",
+        "_lap_origin_progress",
+        "_episode_lap_progress",
+        "_max_episode_lap_progress",
+        "_episode_target_progress",
+        "_max_episode_target_progress",
+        "_last_curriculum_lap_completed",
+        "_last_lap_target_completed",
+        "_episode_lap_time_bonus_total",
+        "_last_lap_time_bonus",
+        "_last_lap_time_bonus_valid",
+        "_record_interval",
+        "_next_record_time",
+        "_next_lap_checkpoint",
+        "_lap_candidate_armed",
+        "_collision_contact",
+        "_lap_progress",
+        "_stagnation_steps",
+        "_wall_contact_active",
+        "_wall_contact_steps",
+        "_recent_collision_entries",
+        "_steps_since_collision",
+        "_collision_recovery_active",
+        "_collision_recovery_steps",
+        "_collision_recovery_clean_steps",
+        "_collision_recoveries",
+        "_collision_pressure",
+        "_collision_looped",
+        "_last_truncation_reason",
+        "_usable_clearance",
+        "_previous_usable_clearance",
+        "_clearance_delta",
+        "_green_ray_fraction",
+        "_wall_closing",
+        "_clearance_motion_ratio",
+        "_step_projection_hits",
+        "_step_projection_misses",
+    )
+
     OBSERVATION_LABELS = (
         "speed",
         "longitudinal_speed",
@@ -181,6 +433,9 @@ class DrivingEnv:
         max_steps: int = 60 * 180,
         random_start_curriculum: bool = False,
         lap_target: int = 1,
+        sensor_engine: str = "sampled",
+        info_level: str = "full",
+        decision_interval: int = 1,
     ):
         if not 0.0 < fixed_dt <= 0.1:
             raise ValueError("fixed_dt must be in the (0, 0.1] interval")
@@ -189,7 +444,13 @@ class DrivingEnv:
         if not isinstance(random_start_curriculum, bool):
             raise ValueError("random_start_curriculum must be a boolean")
         self._validate_lap_target(lap_target)
+        self._validate_sensor_engine(sensor_engine)
+        self._validate_info_level(info_level)
+        self._validate_decision_interval(decision_interval)
         self.circuit = get_circuit(circuit) if isinstance(circuit, str) else circuit
+        self.sensor_engine = sensor_engine
+        self.info_level = info_level
+        self.decision_interval = decision_interval
         self.vehicle = Vehicle(build)
         self.fixed_dt = fixed_dt
         self.max_steps = max_steps
@@ -252,6 +513,18 @@ class DrivingEnv:
         # A pose-derived key makes movement and circuit swaps self-invalidating.
         self._sensor_ray_cache_key: tuple[object, ...] | None = None
         self._sensor_ray_cache: tuple[SensorRay, ...] = ()
+        # One tick asks for the projection and terrain of the same pose from
+        # the physics step, the barrier check, and the observation.  The same
+        # pose-keyed scheme lets each distinct pose be projected once.
+        self._projection_cache_key: tuple[object, ...] | None = None
+        self._projection_cache: TrackProjection | None = None
+        self._terrain_cache: Terrain | None = None
+        self._projection_cache_hits = 0
+        self._projection_cache_misses = 0
+        # Published statistics only count lookups made while stepping, so
+        # read-only observation and telemetry calls leave telemetry unchanged.
+        self._step_projection_hits = 0
+        self._step_projection_misses = 0
         self.reset(seed=seed)
 
     def reset(self, *, seed: int | None = None) -> tuple[float, ...]:
@@ -280,7 +553,7 @@ class DrivingEnv:
         self._lap_progress = 0.0
         self._next_lap_checkpoint = 0
         self._lap_candidate_armed = True
-        self.last_projection = self.circuit.project(position)
+        self.last_projection = self._project(position)
         self.previous_progress = self.last_projection.progress
         self._stagnation_steps = 0
         self._wall_contact_active = False
@@ -348,6 +621,35 @@ class DrivingEnv:
             )
         return value
 
+    @classmethod
+    def _validate_sensor_engine(cls, value: object) -> str:
+        if value not in cls.SENSOR_ENGINES:
+            raise ValueError(
+                f"sensor_engine must be one of {', '.join(cls.SENSOR_ENGINES)}"
+            )
+        return value
+
+    @classmethod
+    def _validate_info_level(cls, value: object) -> str:
+        if value not in cls.INFO_LEVELS:
+            raise ValueError(
+                f"info_level must be one of {', '.join(cls.INFO_LEVELS)}"
+            )
+        return value
+
+    @classmethod
+    def _validate_decision_interval(cls, value: object) -> int:
+        if (
+            isinstance(value, bool)
+            or not isinstance(value, int)
+            or not 1 <= value <= cls.MAX_DECISION_INTERVAL
+        ):
+            raise ValueError(
+                "decision_interval must be an integer in "
+                f"[1, {cls.MAX_DECISION_INTERVAL}]"
+            )
+        return value
+
     @property
     def lap_target(self) -> int:
         """Number of valid loops required to finish a learning evaluation."""
@@ -426,6 +728,89 @@ class DrivingEnv:
         self._curriculum_unlocked = value
         self._lap_target = lap_target
 
+    def snapshot(self) -> DrivingEnvSnapshot:
+        """Capture the complete simulation state as an immutable value."""
+
+        vehicle = self.vehicle
+        return DrivingEnvSnapshot(
+            circuit=self.circuit,
+            build=vehicle.build,
+            fixed_dt=self.fixed_dt,
+            max_steps=self.max_steps,
+            random_start_curriculum=self.random_start_curriculum,
+            sensor_engine=self.sensor_engine,
+            info_level=self.info_level,
+            decision_interval=self.decision_interval,
+            vehicle_state=vehicle.state.values(),
+            vehicle_telemetry=vehicle.last_telemetry,
+            random_state=self.random.getstate(),
+            episode=tuple(getattr(self, name) for name in self._SNAPSHOT_ATTRIBUTES),
+            episode_lap_times=tuple(self._episode_lap_times),
+            lap_trajectory=tuple(self._current_lap_trajectory),
+            best_laps=tuple(self._best_laps.items()),
+            collision_entry_steps=tuple(self._collision_entry_steps),
+            reward_terms=tuple(self.last_reward_terms.items()),
+            caches=(
+                self._sensor_ray_cache_key,
+                self._sensor_ray_cache,
+                self._projection_cache_key,
+                self._projection_cache,
+                self._terrain_cache,
+            ),
+        )
+
+    def restore(self, snapshot: DrivingEnvSnapshot) -> None:
+        """Return this environment to the instant captured by *snapshot*.
+
+        Every piece of simulation state is replaced, including the circuit,
+        car build and random generator, so the next ``step`` or ``reset``
+        behaves exactly as it would have on the captured environment.
+        """
+
+        if not isinstance(snapshot, DrivingEnvSnapshot):
+            raise TypeError("restore() requires a DrivingEnvSnapshot")
+        self.circuit = snapshot.circuit
+        self.fixed_dt = snapshot.fixed_dt
+        self.max_steps = snapshot.max_steps
+        self.random_start_curriculum = snapshot.random_start_curriculum
+        self.sensor_engine = snapshot.sensor_engine
+        self.info_level = snapshot.info_level
+        self.decision_interval = snapshot.decision_interval
+        self.vehicle.set_build(snapshot.build)
+        self.vehicle.state = VehicleState.from_values(snapshot.vehicle_state)
+        self.vehicle.load_telemetry(snapshot.vehicle_telemetry)
+        self.random.setstate(snapshot.random_state)
+        for name, value in zip(self._SNAPSHOT_ATTRIBUTES, snapshot.episode):
+            setattr(self, name, value)
+        self._episode_lap_times = list(snapshot.episode_lap_times)
+        self._current_lap_trajectory = list(snapshot.lap_trajectory)
+        self._best_laps = dict(snapshot.best_laps)
+        self._collision_entry_steps = deque(snapshot.collision_entry_steps)
+        self.last_reward_terms = dict(snapshot.reward_terms)
+        (
+            self._sensor_ray_cache_key,
+            self._sensor_ray_cache,
+            self._projection_cache_key,
+            self._projection_cache,
+            self._terrain_cache,
+        ) = snapshot.caches
+
+    def fork(self) -> "DrivingEnv":
+        """Return an independent copy without constructing or resetting one.
+
+        The copy shares only immutable values (circuit, build, projections
+        and sensor rays) with this environment.  Subclasses that add their
+        own mutable state must extend this method.
+        """
+
+        clone = object.__new__(type(self))
+        clone.vehicle = Vehicle(self.vehicle.build)
+        clone.random = random.Random()
+        clone._projection_cache_hits = 0
+        clone._projection_cache_misses = 0
+        clone.restore(self.snapshot())
+        return clone
+
     @property
     def best_lap_record(self) -> LapRecord | None:
         """Return the current circuit's fastest in-session lap, if available."""
@@ -468,7 +853,7 @@ class DrivingEnv:
         self._lap_progress = 0.0
         self._episode_lap_progress = 0.0
         self._next_lap_checkpoint = 0
-        projection = self.circuit.project(self.vehicle.state.position)
+        projection = self._project(self.vehicle.state.position)
         distance_from_origin = abs(projection.progress - self._lap_origin_progress)
         exactly_on_origin = min(
             distance_from_origin, 1.0 - distance_from_origin
@@ -524,10 +909,52 @@ class DrivingEnv:
         heading = wrap_angle(before.heading + heading_delta * blend)
         return LapPose(target, position, heading)
 
+    def _projection_hint(self) -> int | None:
+        """Segment of the last committed projection, used to seed searches."""
+
+        if self.last_projection is None:
+            return None
+        return self.last_projection.segment_index
+
+    def _project(self, position: Vec2, hint: int | None = None) -> TrackProjection:
+        """Project *position*, reusing the result while the pose is unchanged."""
+
+        cache_key = (id(self.circuit), position.x, position.y)
+        if cache_key == self._projection_cache_key:
+            self._projection_cache_hits += 1
+            assert self._projection_cache is not None
+            return self._projection_cache
+        self._projection_cache_misses += 1
+        projection = self.circuit.project(
+            position, self._projection_hint() if hint is None else hint
+        )
+        self._projection_cache_key = cache_key
+        self._projection_cache = projection
+        self._terrain_cache = None
+        return projection
+
+    def _terrain_at(self, position: Vec2) -> Terrain:
+        """Surface under *position*, derived from its cached projection."""
+
+        projection = self._project(position)
+        if self._terrain_cache is None:
+            self._terrain_cache = self.circuit.terrain_for_projection(projection)
+        return self._terrain_cache
+
+    def projection_cache_stats(self) -> dict[str, float | int]:
+        """Projection cache hits and misses accumulated by simulation ticks."""
+
+        requests = self._step_projection_hits + self._step_projection_misses
+        return {
+            "hits": self._step_projection_hits,
+            "misses": self._step_projection_misses,
+            "hit_rate": self._step_projection_hits / requests if requests else 0.0,
+        }
+
     def observation(self) -> tuple[float, ...]:
         state = self.vehicle.state
         telemetry = self.vehicle.last_telemetry
-        projection = self.circuit.project(state.position)
+        projection = self._project(state.position)
         track_heading = math.atan2(projection.tangent.y, projection.tangent.x)
         heading_error = wrap_angle(state.heading - track_heading) / math.pi
         max_speed = max(1.0, self.vehicle.build.max_speed)
@@ -538,7 +965,7 @@ class DrivingEnv:
             clamp(telemetry.lateral_speed / max_speed, -1.0, 1.0),
             heading_error,
             clamp(projection.signed_offset / self.circuit.collision_radius, -1.0, 1.0),
-            clamp(self.circuit.terrain_at(state.position).grip, 0.0, 1.0),
+            clamp(self._terrain_at(state.position).grip, 0.0, 1.0),
             projection.progress,
             *(ray.normalized_distance for ray in rays),
         )
@@ -573,6 +1000,7 @@ class DrivingEnv:
             float(self.SENSOR_SAMPLE_STEP),
             int(self.SENSOR_REFINEMENT_STEPS),
             float(self.circuit.collision_radius),
+            self.sensor_engine,
         )
         if cache_key == self._sensor_ray_cache_key:
             return self._sensor_ray_cache
@@ -597,6 +1025,25 @@ class DrivingEnv:
 
         origin = self.vehicle.state.position
         directions = tuple(Vec2.from_angle(angle) for angle in angles)
+        if self.sensor_engine == "analytic":
+            exits = self.circuit.barrier_exit_distances(
+                np.full((len(directions), 2), (origin.x, origin.y)),
+                np.asarray(
+                    [(direction.x, direction.y) for direction in directions],
+                    dtype=np.float64,
+                ),
+            ).tolist()
+            return tuple(
+                self._sensor_ray_result(
+                    angle,
+                    origin,
+                    direction,
+                    min(exit_distance, max_distance),
+                    max_distance,
+                    exit_distance <= max_distance,
+                )
+                for angle, direction, exit_distance in zip(angles, directions, exits)
+            )
         sample_distances = [
             self.SENSOR_SAMPLE_STEP * index
             for index in range(
@@ -605,19 +1052,23 @@ class DrivingEnv:
         ]
         if not sample_distances or sample_distances[-1] < max_distance - 1e-12:
             sample_distances.append(max_distance)
-        samples = tuple(
-            origin + direction * distance
-            for direction in directions
-            for distance in sample_distances
+        samples = np.asarray(
+            [
+                (origin.x + direction.x * distance, origin.y + direction.y * distance)
+                for direction in directions
+                for distance in sample_distances
+            ],
+            dtype=np.float64,
         )
-        centerline_distances = self.circuit.distances_to_centerline(samples)
+        radius = self.circuit.collision_radius
+        centerline_distances = self.circuit.clearances(samples, radius).tolist()
         samples_per_ray = len(sample_distances)
         hit_intervals: dict[int, tuple[float, float]] = {}
         for ray_index in range(len(angles)):
             start = ray_index * samples_per_ray
             readings = centerline_distances[start : start + samples_per_ray]
             for sample_index, clearance in enumerate(readings):
-                if clearance >= self.circuit.collision_radius:
+                if clearance >= radius:
                     low = (
                         0.0
                         if sample_index == 0
@@ -634,16 +1085,22 @@ class DrivingEnv:
                 (hit_intervals[index][0] + hit_intervals[index][1]) * 0.5
                 for index in ray_indices
             )
-            refinement_samples = tuple(
-                origin + directions[index] * midpoint
-                for index, midpoint in zip(ray_indices, midpoints)
+            refinement_samples = np.asarray(
+                [
+                    (
+                        origin.x + directions[index].x * midpoint,
+                        origin.y + directions[index].y * midpoint,
+                    )
+                    for index, midpoint in zip(ray_indices, midpoints)
+                ],
+                dtype=np.float64,
             )
-            refinements = self.circuit.distances_to_centerline(refinement_samples)
+            refinements = self.circuit.clearances(refinement_samples, radius).tolist()
             for index, midpoint, clearance in zip(
                 ray_indices, midpoints, refinements
             ):
                 low, high = hit_intervals[index]
-                if clearance >= self.circuit.collision_radius:
+                if clearance >= radius:
                     high = midpoint
                 else:
                     low = midpoint
@@ -655,18 +1112,31 @@ class DrivingEnv:
             hit = interval is not None
             distance = interval[1] if interval is not None else max_distance
             rays.append(
-                SensorRay(
-                    angle=angle,
-                    max_distance=max_distance,
-                    distance=distance,
-                    normalized_distance=distance / max_distance,
-                    origin=origin,
-                    endpoint=origin + direction * distance,
-                    hit=hit,
+                self._sensor_ray_result(
+                    angle, origin, direction, distance, max_distance, hit
                 )
             )
         return tuple(rays)
 
+    @staticmethod
+    def _sensor_ray_result(
+        angle: float,
+        origin: Vec2,
+        direction: Vec2,
+        distance: float,
+        max_distance: float,
+        hit: bool,
+    ) -> SensorRay:
+        return SensorRay(
+            angle=angle,
+            max_distance=max_distance,
+            distance=distance,
+            normalized_distance=distance / max_distance,
+            origin=origin,
+            endpoint=origin + direction * distance,
+            hit=hit,
+        )
+
     def _ray_distance(
         self, angle: float, max_distance: float = SENSOR_MAX_DISTANCE
     ) -> float:
@@ -721,6 +1191,89 @@ class DrivingEnv:
         ) / len(normalized)
         return clamp(combined, 0.0, 1.0), green_fraction
 
+    @classmethod
+    def _step_info_dict(cls, snapshot: _StepSnapshot) -> dict[str, object]:
+        """Expand one tick's snapshot into the full diagnostic info dict."""
+
+        lap_times = snapshot.episode_lap_times[: snapshot.episode_lap_count]
+        return {
+            "circuit": snapshot.circuit,
+            "terrain": snapshot.terrain,
+            "on_road": snapshot.on_road,
+            "progress": snapshot.progress,
+            "episode_lap_progress": snapshot.episode_lap_progress,
+            "max_episode_lap_progress": snapshot.max_episode_lap_progress,
+            "episode_target_progress": snapshot.episode_target_progress,
+            "max_episode_target_progress": snapshot.max_episode_target_progress,
+            "laps": snapshot.laps,
+            "lap_target": snapshot.lap_target,
+            "laps_remaining": max(0, snapshot.lap_target - snapshot.laps),
+            "lap_completed": snapshot.lap_completed,
+            "lap_target_completed": snapshot.lap_target_completed,
+            "checkpoint_advanced": snapshot.checkpoint_advanced,
+            "next_lap_checkpoint": snapshot.next_lap_checkpoint,
+            "current_lap_time": snapshot.current_lap_time,
+            "last_lap_time": snapshot.last_lap_time,
+            "best_lap_time": snapshot.best_lap_time,
+            "episode_best_lap_time": min(lap_times) if lap_times else None,
+            "episode_mean_lap_time": (
+                sum(lap_times) / len(lap_times) if lap_times else None
+            ),
+            "lap_time_reference": snapshot.lap_time_reference,
+            "lap_time_bonus": snapshot.lap_time_bonus,
+            "episode_lap_time_bonus_total": snapshot.episode_lap_time_bonus_total,
+            "lap_time_bonus_valid": snapshot.lap_time_bonus_valid,
+            "lap_candidate_valid": snapshot.lap_candidate_valid,
+            "lap_origin_progress": snapshot.lap_origin_progress,
+            "random_start_curriculum": snapshot.random_start_curriculum,
+            "curriculum_unlocked": snapshot.curriculum_unlocked,
+            "curriculum_ready": snapshot.curriculum_unlocked,
+            "curriculum_lap_completed": snapshot.curriculum_lap_completed,
+            "normal_start_probability": cls.NORMAL_START_PROBABILITY,
+            "spawn_mode": snapshot.spawn_mode,
+            "spawn_progress": snapshot.spawn_progress,
+            "collided": snapshot.collided,
+            "collision_started": snapshot.collision_started,
+            "impact_speed": snapshot.impact_speed,
+            "heading_alignment": snapshot.heading_alignment,
+            "forward_clearance": snapshot.forward_clearance,
+            "usable_clearance": snapshot.usable_clearance,
+            "previous_usable_clearance": snapshot.previous_usable_clearance,
+            "clearance_delta": snapshot.clearance_delta,
+            "green_ray_fraction": snapshot.green_ray_fraction,
+            "wall_closing": snapshot.wall_closing,
+            "clearance_motion_ratio": snapshot.clearance_motion_ratio,
+            "clearance_green_threshold": cls.CLEARANCE_GREEN_THRESHOLD,
+            "wall_contact_active": snapshot.wall_contact_active,
+            "wall_contact_steps": snapshot.wall_contact_steps,
+            "wall_contact_limit": cls.COLLISION_RECOVERY_TIMEOUT_STEPS,
+            "recent_collision_entries": snapshot.recent_collision_entries,
+            "collision_entry_limit": cls.COLLISION_LOOP_ENTRY_LIMIT,
+            "collision_loop_window_steps": cls.COLLISION_LOOP_WINDOW_STEPS,
+            "steps_since_collision": snapshot.steps_since_collision,
+            "collision_looped": snapshot.collision_looped,
+            "collision_recovery_active": snapshot.collision_recovery_active,
+            "collision_recovery_steps": snapshot.collision_recovery_steps,
+            "collision_recovery_clean_steps": (
+                snapshot.collision_recovery_clean_steps
+            ),
+            "collision_recovery_confirm_steps": (
+                cls.COLLISION_RECOVERY_CONFIRM_STEPS
+            ),
+            "collision_recovery_timeout_steps": (
+                cls.COLLISION_RECOVERY_TIMEOUT_STEPS
+            ),
+            "collision_recoveries": snapshot.collision_recoveries,
+            "collision_pressure": snapshot.collision_pressure,
+            "clearance_objective": cls._clearance_objective_config(),
+            "stagnation_steps": snapshot.stagnation_steps,
+            "stagnated": snapshot.stagnated,
+            "truncation_reason": snapshot.truncation_reason,
+            "decision_ticks": snapshot.decision_ticks,
+            "reward_terms": snapshot.reward_terms.copy(),
+            "telemetry": snapshot.telemetry,
+        }
+
     @classmethod
     def _clearance_objective_config(
         cls,
@@ -759,9 +1312,94 @@ class DrivingEnv:
         return self.step_controls(controls)
 
     def step_controls(self, controls: DriverControls) -> StepResult:
-        active_terrain = self.circuit.terrain_at(self.vehicle.state.position)
+        """Hold *controls* for one decision of ``decision_interval`` ticks.
+
+        Each tick runs the full 60 Hz simulation and reward.  The decision
+        stops early when a tick ends the episode.  Its reward and reward terms
+        are the sums over the ticks it ran, and the event flags report
+        whether the event happened on any of them.  The observation is only
+        built for the final tick.
+        """
+
+        cache_hits = self._projection_cache_hits
+        cache_misses = self._projection_cache_misses
+        reward, terminated, truncated, snapshot = self._simulate_tick(controls)
+        if self.decision_interval > 1:
+            reward, terminated, truncated, snapshot = self._repeat_decision(
+                controls, reward, terminated, truncated, snapshot
+            )
+        info: Mapping[str, object]
+        if self.info_level == "full":
+            info = self._step_info_dict(snapshot)
+        elif self.info_level == "training":
+            info = StepInfo(snapshot, type(self))
+        else:
+            info = _EMPTY_INFO
+        observation = self.observation()
+        self._step_projection_hits += self._projection_cache_hits - cache_hits
+        self._step_projection_misses += self._projection_cache_misses - cache_misses
+        return StepResult(observation, reward, terminated, truncated, info)
+
+    def _repeat_decision(
+        self,
+        controls: DriverControls,
+        reward: float,
+        terminated: bool,
+        truncated: bool,
+        snapshot: _StepSnapshot,
+    ) -> tuple[float, bool, bool, _StepSnapshot]:
+        """Run the remaining ticks of one decision and merge their snapshots."""
+
+        reward_terms = dict(snapshot.reward_terms)
+        lap_completed = snapshot.lap_completed
+        checkpoint_advanced = snapshot.checkpoint_advanced
+        curriculum_lap_completed = snapshot.curriculum_lap_completed
+        lap_time_bonus = snapshot.lap_time_bonus
+        lap_time_bonus_valid = snapshot.lap_time_bonus_valid
+        collided = snapshot.collided
+        collision_started = snapshot.collision_started
+        impact_speed = snapshot.impact_speed
+        ticks = 1
+        while ticks < self.decision_interval and not (terminated or truncated):
+            tick_reward, terminated, truncated, snapshot = self._simulate_tick(
+                controls
+            )
+            ticks += 1
+            reward += tick_reward
+            for name, value in snapshot.reward_terms.items():
+                reward_terms[name] += value
+            lap_completed = lap_completed or snapshot.lap_completed
+            checkpoint_advanced = checkpoint_advanced or snapshot.checkpoint_advanced
+            curriculum_lap_completed = (
+                curriculum_lap_completed or snapshot.curriculum_lap_completed
+            )
+            lap_time_bonus += snapshot.lap_time_bonus
+            lap_time_bonus_valid = lap_time_bonus_valid or snapshot.lap_time_bonus_valid
+            collided = collided or snapshot.collided
+            collision_started = collision_started or snapshot.collision_started
+            impact_speed = max(impact_speed, snapshot.impact_speed)
+        snapshot = snapshot._replace(
+            lap_completed=lap_completed,
+            checkpoint_advanced=checkpoint_advanced,
+            curriculum_lap_completed=curriculum_lap_completed,
+            lap_time_bonus=lap_time_bonus,
+            lap_time_bonus_valid=lap_time_bonus_valid,
+            collided=collided,
+            collision_started=collision_started,
+            impact_speed=impact_speed,
+            decision_ticks=ticks,
+            reward_terms=reward_terms,
+        )
+        return reward, terminated, truncated, snapshot
+
+    def _simulate_tick(
+        self, controls: DriverControls
+    ) -> tuple[float, bool, bool, _StepSnapshot]:
+        """Advance one fixed physics tick and score it."""
+
+        active_terrain = self._terrain_at(self.vehicle.state.position)
         telemetry = self.vehicle.step(controls, active_terrain, self.fixed_dt)
-        after = self.circuit.project(self.vehicle.state.position)
+        after = self._project(self.vehicle.state.position)
         penetrated_barrier = after.distance > self.circuit.collision_radius
         impact_speed = self.vehicle.resolve_collision(
             after.point, self.circuit.collision_radius
@@ -774,7 +1412,7 @@ class DrivingEnv:
             self.vehicle.apply_impact_damage(impact_speed)
         if collided:
             self._collision_contact = True
-            after = self.circuit.project(self.vehicle.state.position)
+            after = self._project(self.vehicle.state.position, after.segment_index)
             telemetry = self.vehicle.last_telemetry
         elif after.distance < self.circuit.collision_radius - 4.0:
             self._collision_contact = False
@@ -1111,93 +1749,68 @@ class DrivingEnv:
         else:
             truncation_reason = None
         self._last_truncation_reason = truncation_reason
-        info: dict[str, object] = {
-            "circuit": self.circuit.slug,
-            "terrain": active_terrain.kind.value,
-            "on_road": on_road,
-            "progress": after.progress,
-            "episode_lap_progress": episode_lap_progress,
-            "max_episode_lap_progress": self._max_episode_lap_progress,
-            "episode_target_progress": self._episode_target_progress,
-            "max_episode_target_progress": self._max_episode_target_progress,
-            "laps": self.laps,
-            "lap_target": self._lap_target,
-            "laps_remaining": max(0, self._lap_target - self.laps),
-            "lap_completed": lap_completed,
-            "lap_target_completed": lap_target_completed,
-            "checkpoint_advanced": ordered_checkpoint_advanced,
-            "next_lap_checkpoint": self._next_lap_checkpoint,
-            "current_lap_time": self.current_lap_time,
-            "last_lap_time": self.last_lap_time,
-            "best_lap_time": self.best_lap_time,
-            "episode_best_lap_time": (
-                min(self._episode_lap_times) if self._episode_lap_times else None
-            ),
-            "episode_mean_lap_time": (
-                sum(self._episode_lap_times) / len(self._episode_lap_times)
-                if self._episode_lap_times
-                else None
-            ),
-            "lap_time_reference": self.lap_time_reference,
-            "lap_time_bonus": lap_time_bonus if lap_completed else 0.0,
-            "episode_lap_time_bonus_total": (
-                self._episode_lap_time_bonus_total
-            ),
-            "lap_time_bonus_valid": (
-                lap_time_bonus_valid if lap_completed else False
-            ),
-            "lap_candidate_valid": self._lap_candidate_armed,
-            "lap_origin_progress": self._lap_origin_progress,
-            "random_start_curriculum": self.random_start_curriculum,
-            "curriculum_unlocked": self._curriculum_unlocked,
-            "curriculum_ready": self._curriculum_unlocked,
-            "curriculum_lap_completed": curriculum_lap_completed,
-            "normal_start_probability": self.NORMAL_START_PROBABILITY,
-            "spawn_mode": self._spawn_mode,
-            "spawn_progress": self._spawn_progress,
-            "collided": collided,
-            "collision_started": collision_started,
-            "impact_speed": impact_speed,
-            "heading_alignment": heading_alignment,
-            "forward_clearance": forward_clearance,
-            "usable_clearance": self._usable_clearance,
-            "previous_usable_clearance": self._previous_usable_clearance,
-            "clearance_delta": self._clearance_delta,
-            "green_ray_fraction": self._green_ray_fraction,
-            "wall_closing": self._wall_closing,
-            "clearance_motion_ratio": self._clearance_motion_ratio,
-            "clearance_green_threshold": self.CLEARANCE_GREEN_THRESHOLD,
-            "wall_contact_active": self._wall_contact_active,
-            "wall_contact_steps": self._wall_contact_steps,
-            "wall_contact_limit": self.COLLISION_RECOVERY_TIMEOUT_STEPS,
-            "recent_collision_entries": self._recent_collision_entries,
-            "collision_entry_limit": self.COLLISION_LOOP_ENTRY_LIMIT,
-            "collision_loop_window_steps": self.COLLISION_LOOP_WINDOW_STEPS,
-            "steps_since_collision": self._steps_since_collision,
-            "collision_looped": self._collision_looped,
-            "collision_recovery_active": self._collision_recovery_active,
-            "collision_recovery_steps": self._collision_recovery_steps,
-            "collision_recovery_clean_steps": (
-                self._collision_recovery_clean_steps
-            ),
-            "collision_recovery_confirm_steps": (
-                self.COLLISION_RECOVERY_CONFIRM_STEPS
-            ),
-            "collision_recovery_timeout_steps": (
-                self.COLLISION_RECOVERY_TIMEOUT_STEPS
-            ),
-            "collision_recoveries": self._collision_recoveries,
-            "collision_pressure": self._collision_pressure,
-            "clearance_objective": self._clearance_objective_config(),
-            "stagnation_steps": self._stagnation_steps,
-            "stagnated": stagnated,
-            "truncation_reason": truncation_reason,
-            "reward_terms": reward_terms.copy(),
-            "telemetry": telemetry,
-        }
-        return StepResult(
-            self.observation(), reward, lap_target_completed, truncated, info
+        snapshot = _StepSnapshot(
+            self.circuit.slug,
+            active_terrain.kind.value,
+            on_road,
+            after.progress,
+            episode_lap_progress,
+            self._max_episode_lap_progress,
+            self._episode_target_progress,
+            self._max_episode_target_progress,
+            self.laps,
+            self._lap_target,
+            lap_completed,
+            lap_target_completed,
+            ordered_checkpoint_advanced,
+            self._next_lap_checkpoint,
+            self.current_lap_time,
+            self.last_lap_time,
+            self.best_lap_time,
+            self.lap_time_reference,
+            lap_time_bonus if lap_completed else 0.0,
+            self._episode_lap_time_bonus_total,
+            lap_time_bonus_valid if lap_completed else False,
+            self._lap_candidate_armed,
+            self._lap_origin_progress,
+            self.random_start_curriculum,
+            self._curriculum_unlocked,
+            curriculum_lap_completed,
+            self._spawn_mode,
+            self._spawn_progress,
+            collided,
+            collision_started,
+            impact_speed,
+            heading_alignment,
+            forward_clearance,
+            self._usable_clearance,
+            self._previous_usable_clearance,
+            self._clearance_delta,
+            self._green_ray_fraction,
+            self._wall_closing,
+            self._clearance_motion_ratio,
+            self._wall_contact_active,
+            self._wall_contact_steps,
+            self._recent_collision_entries,
+            self._steps_since_collision,
+            self._collision_looped,
+            self._collision_recovery_active,
+            self._collision_recovery_steps,
+            self._collision_recovery_clean_steps,
+            self._collision_recoveries,
+            self._collision_pressure,
+            self._stagnation_steps,
+            stagnated,
+            truncation_reason,
+            1,
+            reward_terms,
+            telemetry,
+            # Lap times are only appended within an episode and reset() binds
+            # a new list, so the list and its current length are a snapshot.
+            self._episode_lap_times,
+            len(self._episode_lap_times),
         )
+        return reward, lap_target_completed, truncated, snapshot
 
     def change_circuit(self, name: str) -> tuple[float, ...]:
         self.circuit = get_circuit(name)
@@ -1209,8 +1822,8 @@ class DrivingEnv:
 
         state = self.vehicle.state
         physics = self.vehicle.last_telemetry
-        projection = self.circuit.project(state.position)
-        active_terrain = self.circuit.terrain_at(state.position)
+        projection = self._project(state.position)
+        active_terrain = self._terrain_at(state.position)
         build = self.vehicle.build
         return {
             "circuit": self.circuit.slug,
@@ -1306,6 +1919,7 @@ class DrivingEnv:
             "clearance_objective": self._clearance_objective_config(),
             "stagnation_steps": self._stagnation_steps,
             "stagnation_limit_steps": self.STAGNATION_LIMIT_STEPS,
+            "projection_cache": self.projection_cache_stats(),
             "damage": state.damage,
             "components": {
                 "motor": build.motor,
@@ -192,8 +192,8 @@ class DrivingLearningGame:
         return DriverControls(throttle=throttle, steering=steering, brake=brake)
 
     def _save_checkpoint(self) -> Path:
-        output = self.session.save(self.checkpoint_path)
-        self._status = f"saved {output.name}"
+        output = self.session.save(self.checkpoint_path, background=True)
+        self._status = f"saving {output.name}"
         return output
 
     def handle_events(self) -> None:
@@ -280,7 +280,7 @@ class DrivingLearningGame:
             self.toggle_sensor_rays()
 
     def _training_telemetry(self) -> dict[str, Any]:
-        data = self.session.telemetry()
+        data = self.session.telemetry(sections=self.dashboard.telemetry_sections)
         rollouts: list[dict[str, Any]] = []
         rollout_generation = self.session.current_generation
         if self.show_population_cars:
@@ -454,7 +454,7 @@ class DrivingLearningGame:
     def _race_telemetry(self) -> dict[str, Any]:
         assert self.race is not None
         race = self.race.telemetry()
-        training = self._last_telemetry or self.session.telemetry()
+        training = self._last_telemetry or self.session.telemetry(sections=())
         race.update(
             {
                 "generation": training.get("generation", 0),
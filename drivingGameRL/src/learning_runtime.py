@@ -8,12 +8,11 @@ same fixed-step simulation.
 from __future__ import annotations
 
 from collections import deque
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, replace
 import math
-import os
 from pathlib import Path
-import tempfile
 from typing import Any, Literal, Sequence
 
 import numpy as np
@@ -22,9 +21,12 @@ import torch
 from .environment import DrivingAction, DrivingEnv, StepResult
 from .learning_health import build_learning_health
 from .ml import (
+    AsyncDQNLearner,
+    CheckpointWriter,
     DQNConfig,
     DrivingDQNAgent,
     default_population_dqn_config,
+    write_checkpoint,
 )
 from .sensor_clearance import SensorClearancePolicy, SensorClearanceStats
 from .vehicle import CarBuild, DriverControls
@@ -39,6 +41,8 @@ ACTION_LABELS = tuple(action.name.replace("_", " ").title() for action in Drivin
 class LearningRuntimeConfig:
     """Small, validated contract shared by the CLI and visual trainer."""
 
+    MAX_ACTOR_COUNT = 64
+
     algorithm: LearningAlgorithm = "genetic_dqn"
     circuit: str = "harbor_loop"
     seed: int = 7
@@ -54,6 +58,15 @@ class LearningRuntimeConfig:
     mutation_rate: float = 0.08
     mutation_std: float = 0.055
     parallel_workers: int | None = None
+    worker_backend: Literal["thread", "process"] = "thread"
+    batched_updates: bool = False
+    decision_interval: int = 1
+    learner_thread: bool = False
+    replay_ratio: float | None = None
+    publish_interval: int = 4
+    actor_count: int = 1
+    autosave_generations: int = 0
+    autosave_path: str | Path | None = None
 
     def __post_init__(self) -> None:
         if self.algorithm not in ("dqn", "double_dqn", "genetic", "genetic_dqn"):
@@ -68,6 +81,10 @@ class LearningRuntimeConfig:
             "population_size",
             "elite_count",
             "tournament_size",
+            "decision_interval",
+            "publish_interval",
+            "actor_count",
+            "autosave_generations",
         )
         for name in integer_fields:
             value = getattr(self, name)
@@ -116,6 +133,46 @@ class LearningRuntimeConfig:
             or self.parallel_workers <= 0
         ):
             raise ValueError("parallel_workers must be a positive integer or None")
+        if self.worker_backend not in ("thread", "process"):
+            raise ValueError("worker_backend must be 'thread' or 'process'")
+        if self.worker_backend == "process" and self.algorithm != "genetic":
+            raise ValueError("worker_backend='process' requires the genetic algorithm")
+        if not isinstance(self.batched_updates, bool):
+            raise ValueError("batched_updates must be a boolean")
+        if self.batched_updates and self.algorithm != "genetic_dqn":
+            raise ValueError("batched_updates requires the genetic_dqn algorithm")
+        if not isinstance(self.learner_thread, bool):
+            raise ValueError("learner_thread must be a boolean")
+        if self.learner_thread and self.algorithm not in ("dqn", "double_dqn"):
+            raise ValueError("learner_thread requires the dqn or double_dqn algorithm")
+        if self.replay_ratio is not None:
+            if isinstance(self.replay_ratio, bool) or not isinstance(
+                self.replay_ratio, (int, float)
+            ):
+                raise ValueError("replay_ratio must be finite and positive or None")
+            if not math.isfinite(self.replay_ratio) or self.replay_ratio <= 0.0:
+                raise ValueError("replay_ratio must be finite and positive or None")
+        if self.publish_interval <= 0:
+            raise ValueError("publish_interval must be positive")
+        if not 1 <= self.actor_count <= self.MAX_ACTOR_COUNT:
+            raise ValueError(
+                f"actor_count must be in [1, {self.MAX_ACTOR_COUNT}]"
+            )
+        if self.actor_count > 1 and self.algorithm not in ("dqn", "double_dqn"):
+            raise ValueError("actor_count > 1 requires the dqn or double_dqn algorithm")
+        if not 1 <= self.decision_interval <= DrivingEnv.MAX_DECISION_INTERVAL:
+            raise ValueError(
+                "decision_interval must be in [1, DrivingEnv.MAX_DECISION_INTERVAL "
+                f"({DrivingEnv.MAX_DECISION_INTERVAL})]"
+            )
+        if self.autosave_generations < 0:
+            raise ValueError("autosave_generations must be non-negative")
+        if self.autosave_path is not None and not isinstance(
+            self.autosave_path, (str, Path)
+        ):
+            raise ValueError("autosave_path must be a path or None")
+        if self.autosave_generations > 0 and self.autosave_path is None:
+            raise ValueError("autosave_generations requires an autosave_path")
 
 
 class DrivingLearningSession:
@@ -126,6 +183,22 @@ class DrivingLearningSession:
     stopping conditions meaningful across every algorithm.
     """
 
+    # Optional telemetry sections and the snapshot keys each one provides.
+    TELEMETRY_SECTIONS = ("population", "history", "network", "memory")
+    _SECTION_KEYS = {
+        "population": ("population",),
+        "history": (
+            "generation_history",
+            "history",
+            "loss_history",
+            "epsilon_history",
+        ),
+        "network": ("network",),
+        "memory": ("memory_samples",),
+    }
+    # Neurons per layer in the network section; the dashboard draws this many.
+    NETWORK_SNAPSHOT_NEURONS = 12
+
     def __init__(
         self,
         config: LearningRuntimeConfig | None = None,
@@ -137,10 +210,20 @@ class DrivingLearningSession:
         self.build = build or CarBuild()
         self._last_event = "session_started"
         self._checkpoint_path: Path | None = None
+        # Checkpoints are snapshotted here and serialized off the step loop.
+        self._checkpoint_writer = CheckpointWriter()
+        # Generation the autosave interval counts from; a load restarts it so
+        # resuming does not immediately save again.
+        self._autosave_generation = 0
+        self._autosaves = 0
         self._population_trainer: Any | None = None
         self._uses_population_default_dqn = False
         self._loss_history: deque[float] = deque(maxlen=300)
         self._epsilon_history: deque[float] = deque(maxlen=300)
+        self._learning_trace_version = 0
+        # Telemetry sections keyed on the state they were derived from.
+        self._telemetry_cache: dict[str, tuple[object, Any]] = {}
+        self._population_rows: dict[int, tuple[tuple[object, ...], dict[str, Any]]] = {}
         self._environment_decisions = 0
         self._health_decision_origin = 0
         self._health_update_origin = 0
@@ -150,6 +233,10 @@ class DrivingLearningSession:
         self._collision_loop_terminations = 0
         self.clearance_policy = SensorClearancePolicy()
         self._safety_stats = SensorClearanceStats()
+        self._learner: AsyncDQNLearner | None = None
+        # Extra standalone actors; ``self.env`` stays the visible evaluation.
+        self._actor_envs: list[DrivingEnv] = []
+        self._actor_observations: list[tuple[float, ...]] = []
 
         if self.config.algorithm in ("genetic", "genetic_dqn"):
             self._init_population(dqn_config)
@@ -170,9 +257,23 @@ class DrivingLearningSession:
             ),
             random_start_curriculum=True,
             lap_target=self.config.initial_lap_target,
+            decision_interval=self.config.decision_interval,
         )
         self.observation = self.env.observation()
+        for actor in range(1, self.config.actor_count):
+            actor_env = DrivingEnv(
+                self.config.circuit,
+                build=self.build,
+                seed=self._actor_seed(actor),
+                max_steps=self.env.max_steps,
+                random_start_curriculum=True,
+                lap_target=self.config.initial_lap_target,
+                decision_interval=self.config.decision_interval,
+            )
+            self._actor_envs.append(actor_env)
+            self._actor_observations.append(actor_env.observation())
         self.generation = 1
+        self._autosave_generation = self.generation
         self.episode_return = 0.0
         self.best_fitness = -math.inf
         self._best_champion_rank: tuple[float, bool, int] = (
@@ -183,6 +284,13 @@ class DrivingLearningSession:
         self._champion = self.agent.clone(seed=self.config.seed + 1)
         self.generation_history: list[dict[str, object]] = []
         self._episode_fitness: list[float] = []
+        if self.config.learner_thread:
+            self._learner = AsyncDQNLearner(
+                self.agent,
+                replay_ratio=self.config.replay_ratio,
+                publish_interval=self.config.publish_interval,
+            )
+            self._learner.start()
 
     def _init_population(self, dqn_config: DQNConfig | None) -> None:
         # Imported lazily so the standalone DQN remains usable in minimal
@@ -230,16 +338,23 @@ class DrivingLearningSession:
             ),
             random_start_curriculum=True,
             lap_target=self.config.initial_lap_target,
+            decision_interval=self.config.decision_interval,
         )
         self._population_trainer = PopulationTrainer(
             evolution,
             dqn_config=dqn_config,
             env=population_env,
             parallel_workers=self.config.parallel_workers,
+            worker_backend=self.config.worker_backend,
+            batched_updates=self.config.batched_updates,
         )
         self.env = self._population_trainer.env
         self.agent = self._population_trainer.current_agent
         self.observation = self.env.observation()
+        self._autosave_generation = self.current_generation
+
+    def _actor_seed(self, actor: int) -> int:
+        return (self.config.seed + 1_000_003 * actor) % 2**63
 
     def _effective_evaluation_steps(self, lap_target: int) -> int:
         """Return the fixed-step budget for one progressive lap target."""
@@ -363,14 +478,45 @@ class DrivingLearningSession:
             else:
                 self._last_event = "population_step"
             self._record_learning_trace(result)
+            self._autosave_if_due()
             return result
 
-        state = self.observation
-        proposed_action = self.agent.select_action(state, explore=True)
+        # Every actor acts on the same pre-tick weights from one batched
+        # forward pass. Extra actors go first so the visible car's proposal
+        # and safety decision are the ones telemetry reports.
+        states = (*self._actor_observations, self.observation)
+        q_values = self.agent.q_values_many(states)
+        for actor, actor_env in enumerate(self._actor_envs, start=1):
+            actor_result, actor_done = self._act(
+                actor_env, states[actor - 1], q_values[actor - 1], stream=actor
+            )
+            if actor_done:
+                self._restart_actor(actor)
+            else:
+                self._actor_observations[actor - 1] = actor_result.observation
+        result, done = self._act(self.env, states[-1], q_values[-1], stream=0)
+        self.episode_return += result.reward
+        self.observation = result.observation
+        self._last_event = "training_step"
+        if done:
+            self._finish_dqn_episode(result)
+        self._record_learning_trace()
+        self._autosave_if_due()
+        return result
+
+    def _act(
+        self,
+        env: DrivingEnv,
+        state: Sequence[float],
+        q_values: np.ndarray,
+        *,
+        stream: int,
+    ) -> tuple[StepResult, bool]:
+        proposed_action = self.agent.select_action_from_values(q_values, explore=True)
         safety_decision = self.clearance_policy.decide(state, proposed_action)
         self._safety_stats.observe(safety_decision)
         executed_action = safety_decision.executed_action
-        result = self.env.step(executed_action)
+        result = env.step(executed_action)
         self._environment_decisions += 1
         self._wall_contact_decisions += int(
             bool(result.info.get("wall_contact_active", False))
@@ -388,14 +534,21 @@ class DrivingLearningSession:
             result.reward,
             result.observation,
             done,
+            stream=stream,
         )
-        self.episode_return += result.reward
-        self.observation = result.observation
-        self._last_event = "training_step"
-        if done:
-            self._finish_dqn_episode(result)
-        self._record_learning_trace()
-        return result
+        return result, done
+
+    def _restart_actor(self, actor: int) -> None:
+        """Start an extra actor's next episode on the visible curriculum."""
+
+        actor_env = self._actor_envs[actor - 1]
+        curriculum = self.env.curriculum_state()
+        curriculum["unlocked"] = bool(
+            curriculum["unlocked"] or actor_env.curriculum_state()["unlocked"]
+        )
+        actor_env.load_curriculum_state(curriculum)
+        actor_env.max_steps = self.env.max_steps
+        self._actor_observations[actor - 1] = actor_env.reset()
 
     def step_many(
         self,
@@ -447,6 +600,7 @@ class DrivingLearningSession:
         # chunk. Record one honest snapshot from the final live agent instead
         # of attributing that agent's epsilon/loss to every earlier tick.
         self._record_learning_trace()
+        self._autosave_if_due()
         return tuple(results)
 
     def _record_learning_trace(self, population_step: Any | None = None) -> None:
@@ -461,6 +615,7 @@ class DrivingLearningSession:
         epsilon = float(self.agent.epsilon) if exploration_enabled else 0.0
         if math.isfinite(epsilon):
             self._epsilon_history.append(epsilon)
+        self._learning_trace_version += 1
 
     def _finish_dqn_episode(self, result: StepResult) -> None:
         completed_lap_target = bool(result.info.get("lap_target_completed", False))
@@ -476,7 +631,10 @@ class DrivingLearningSession:
         if champion_rank > self._best_champion_rank:
             self._best_champion_rank = champion_rank
             self.best_fitness = fitness
-            self._champion = self.agent.clone(seed=self.config.seed + self.generation)
+            with self._paused_learner():
+                self._champion = self.agent.clone(
+                    seed=self.config.seed + self.generation
+                )
             self._last_event = "new_champion"
         else:
             self._last_event = "episode_complete"
@@ -602,143 +760,214 @@ class DrivingLearningSession:
             "expected_greedy_fraction": 1.0 - expected_exploration,
         }
 
-    def telemetry(self) -> dict[str, Any]:
-        """Merge environment, learning, replay, and real-network state."""
+    def _paused_learner(self) -> AbstractContextManager[Any]:
+        """Hold off background updates while the agent's state is read."""
+
+        return nullcontext() if self._learner is None else self._learner.paused()
+
+    def _cached_telemetry(
+        self, name: str, key: object, build: Callable[[], Any]
+    ) -> Any:
+        """Return the cached telemetry section *name* unless *key* changed."""
+
+        cached = self._telemetry_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, build())
+            self._telemetry_cache[name] = cached
+        return cached[1]
 
+    def telemetry(self, sections: Iterable[str] | None = None) -> dict[str, Any]:
+        """Merge environment, learning, replay, and real-network state.
+
+        ``sections`` selects which of :attr:`TELEMETRY_SECTIONS` to include;
+        ``None`` includes all of them, and omitted sections are neither built
+        nor present in the result.  Sections are cached and rebuilt only after
+        their source changes (a member finishing, a generation evolving, a
+        gradient step or a new observation), so nested values are shared
+        between calls and must be treated as read-only.
+        """
+
+        requested = frozenset(self.TELEMETRY_SECTIONS if sections is None else sections)
+        unknown = requested.difference(self.TELEMETRY_SECTIONS)
+        if unknown:
+            raise ValueError(
+                "unknown telemetry sections: " + ", ".join(sorted(map(str, unknown)))
+            )
+        with self._paused_learner():
+            return self._telemetry(requested)
+
+    def _population_row(
+        self,
+        index: int,
+        member: Mapping[str, Any],
+        *,
+        active: bool,
+        elite: bool,
+    ) -> dict[str, Any]:
+        # The trainer hands back the same row object for finished members, so
+        # their dashboard rows are converted once per generation.
+        cached = self._population_rows.get(index)
+        if (
+            cached is not None
+            and cached[0][0] is member
+            and cached[0][1:] == (active, elite)
+        ):
+            return cached[1]
+        result = member.get("result") or {}
+        member_fitness = member.get("fitness")
+        selection_fitness = member.get("selection_fitness")
+        if member_fitness is None:
+            member_fitness = selection_fitness
+        runtime_status = member.get("status")
+        if runtime_status == "active":
+            runtime_status = "evaluating"
+        row = {
+            "index": index,
+            "member_id": member.get("member_id", index),
+            "fitness": member_fitness,
+            "status": (
+                runtime_status
+                or (
+                    "evaluating"
+                    if active
+                    else ("evaluated" if member.get("evaluated") else "queued")
+                )
+            ),
+            "elite": elite,
+            "laps": result.get("laps", member.get("laps", 0)),
+            "lap_target": result.get(
+                "lap_target", member.get("lap_target", 1)
+            ),
+            "lap_target_completed": result.get(
+                "lap_target_completed",
+                member.get("lap_target_completed", False),
+            ),
+            "progress": result.get(
+                "progress",
+                member.get("episode_target_progress", 0.0),
+            ),
+            "max_progress": result.get(
+                "max_progress",
+                member.get(
+                    "max_episode_target_progress",
+                    result.get("progress", 0.0),
+                ),
+            ),
+            "best_lap_time": result.get(
+                "best_lap_time", member.get("best_lap_time")
+            ),
+            "mean_lap_time": result.get(
+                "mean_lap_time", member.get("mean_lap_time")
+            ),
+            "lap_time_bonus_total": result.get(
+                "lap_time_bonus_total",
+                member.get("lap_time_bonus_total", 0.0),
+            ),
+            "collisions": result.get("collisions", 0),
+            "collision_recoveries": result.get(
+                "collision_recoveries", 0
+            ),
+            "end_reason": result.get("end_reason", "unknown"),
+            "safety_interventions": result.get(
+                "safety_interventions", 0
+            ),
+            "protected_elite": bool(
+                member.get("protected_elite", False)
+            ),
+            "parents": member.get("parent_ids", ()),
+            "evaluation_step": member.get("evaluation_step", 0),
+            "evaluation_return": member.get("evaluation_return", 0.0),
+            "raw_return": member.get(
+                "raw_return", member.get("evaluation_return", 0.0)
+            ),
+            "selection_fitness": selection_fitness,
+            "safety_intervention_penalty": member.get(
+                "safety_intervention_penalty", 0.0
+            ),
+            "action": member.get("action"),
+            "raw_action": member.get("raw_action"),
+            "executed_action": member.get("executed_action"),
+            "safety_intervened": bool(
+                member.get("safety_intervened", False)
+            ),
+            "safety": member.get("safety", {}),
+        }
+
+        self._population_rows[index] = ((member, active, elite), row)
+        return row
+
+    @staticmethod
+    def _generation_history_rows(
+        records: Sequence[Mapping[str, Any]],
+    ) -> list[dict[str, Any]]:
+        return [
+            {
+                "generation": row["generation"],
+                "best": row["best_fitness"],
+                "mean": row["mean_fitness"],
+                "worst": row["worst_fitness"],
+                "diversity": row.get("genome_diversity", 0.0),
+                "laps_completed": row.get("laps_completed", 0),
+                "lap_completion_rate": row.get("lap_completion_rate", 0.0),
+                "lap_finishers": row.get("lap_finishers", 0),
+                "lap_target": row.get("lap_target", 1),
+                "target_finishers": row.get("target_finishers", 0),
+                "target_completion_rate": row.get(
+                    "target_completion_rate",
+                    row.get("lap_completion_rate", 0.0),
+                ),
+                "best_progress": row.get("best_progress", 0.0),
+                "mean_progress": row.get("mean_progress", 0.0),
+                "best_target_progress": row.get(
+                    "best_target_progress", row.get("best_progress", 0.0)
+                ),
+                "mean_target_progress": row.get(
+                    "mean_target_progress", row.get("mean_progress", 0.0)
+                ),
+                "best_lap_time": row.get("best_lap_time"),
+                "mean_lap_time": row.get("mean_lap_time"),
+                "near_finish_count": row.get("near_finish_count", 0),
+                "collision_recoveries": row.get(
+                    "collision_recoveries", 0
+                ),
+                "end_reasons": dict(row.get("end_reasons", {})),
+            }
+            for row in records
+        ]
+
+    def _telemetry(self, sections: frozenset[str]) -> dict[str, Any]:
         if self.is_population:
-            raw = dict(self._population_trainer.telemetry())
+            raw = dict(
+                self._population_trainer.telemetry(
+                    include_population="population" in sections
+                )
+            )
             self.env = self._population_trainer.env
             self.agent = self._population_trainer.current_agent
             observation = self._population_trainer.observation
             learning = raw.get("learning") or self.agent.telemetry(observation)
             fitness = raw.get("fitness") or {}
-            population = []
             current_index = raw.get("current_member_index")
             active_indices = {
                 int(index) for index in raw.get("active_member_indices", ())
             }
-            for index, member in enumerate(raw.get("population", ())):
-                result = member.get("result") or {}
-                member_fitness = member.get("fitness")
-                selection_fitness = member.get("selection_fitness")
-                if member_fitness is None:
-                    member_fitness = selection_fitness
-                runtime_status = member.get("status")
-                if runtime_status == "active":
-                    runtime_status = "evaluating"
-                population.append(
-                    {
-                        "index": index,
-                        "member_id": member.get("member_id", index),
-                        "fitness": member_fitness,
-                        "status": (
-                            runtime_status
-                            or (
-                                "evaluating"
-                                if index in active_indices
-                                else (
-                                    "evaluated" if member.get("evaluated") else "queued"
-                                )
-                            )
-                        ),
-                        "elite": False,
-                        "laps": result.get("laps", member.get("laps", 0)),
-                        "lap_target": result.get(
-                            "lap_target", member.get("lap_target", 1)
-                        ),
-                        "lap_target_completed": result.get(
-                            "lap_target_completed",
-                            member.get("lap_target_completed", False),
-                        ),
-                        "progress": result.get(
-                            "progress",
-                            member.get("episode_target_progress", 0.0),
-                        ),
-                        "max_progress": result.get(
-                            "max_progress",
-                            member.get(
-                                "max_episode_target_progress",
-                                result.get("progress", 0.0),
-                            ),
-                        ),
-                        "best_lap_time": result.get(
-                            "best_lap_time", member.get("best_lap_time")
-                        ),
-                        "mean_lap_time": result.get(
-                            "mean_lap_time", member.get("mean_lap_time")
-                        ),
-                        "lap_time_bonus_total": result.get(
-                            "lap_time_bonus_total",
-                            member.get("lap_time_bonus_total", 0.0),
-                        ),
-                        "collisions": result.get("collisions", 0),
-                        "collision_recoveries": result.get(
-                            "collision_recoveries", 0
-                        ),
-                        "end_reason": result.get("end_reason", "unknown"),
-                        "safety_interventions": result.get(
-                            "safety_interventions", 0
-                        ),
-                        "protected_elite": bool(
-                            member.get("protected_elite", False)
-                        ),
-                        "parents": member.get("parent_ids", ()),
-                        "evaluation_step": member.get("evaluation_step", 0),
-                        "evaluation_return": member.get("evaluation_return", 0.0),
-                        "raw_return": member.get(
-                            "raw_return", member.get("evaluation_return", 0.0)
-                        ),
-                        "selection_fitness": selection_fitness,
-                        "safety_intervention_penalty": member.get(
-                            "safety_intervention_penalty", 0.0
-                        ),
-                        "action": member.get("action"),
-                        "raw_action": member.get("raw_action"),
-                        "executed_action": member.get("executed_action"),
-                        "safety_intervened": bool(
-                            member.get("safety_intervened", False)
-                        ),
-                        "safety": member.get("safety", {}),
-                    }
+            trainer_history = self._population_trainer.history
+            elite_ids = set(trainer_history[-1].elite_ids) if trainer_history else set()
+            population = [
+                self._population_row(
+                    index,
+                    member,
+                    active=index in active_indices,
+                    elite=member.get("member_id", index) in elite_ids,
                 )
-            history = [
-                {
-                    "generation": row["generation"],
-                    "best": row["best_fitness"],
-                    "mean": row["mean_fitness"],
-                    "worst": row["worst_fitness"],
-                    "diversity": row.get("genome_diversity", 0.0),
-                    "laps_completed": row.get("laps_completed", 0),
-                    "lap_completion_rate": row.get("lap_completion_rate", 0.0),
-                    "lap_finishers": row.get("lap_finishers", 0),
-                    "lap_target": row.get("lap_target", 1),
-                    "target_finishers": row.get("target_finishers", 0),
-                    "target_completion_rate": row.get(
-                        "target_completion_rate",
-                        row.get("lap_completion_rate", 0.0),
-                    ),
-                    "best_progress": row.get("best_progress", 0.0),
-                    "mean_progress": row.get("mean_progress", 0.0),
-                    "best_target_progress": row.get(
-                        "best_target_progress", row.get("best_progress", 0.0)
-                    ),
-                    "mean_target_progress": row.get(
-                        "mean_target_progress", row.get("mean_progress", 0.0)
-                    ),
-                    "best_lap_time": row.get("best_lap_time"),
-                    "mean_lap_time": row.get("mean_lap_time"),
-                    "near_finish_count": row.get("near_finish_count", 0),
-                    "collision_recoveries": row.get(
-                        "collision_recoveries", 0
-                    ),
-                    "end_reasons": dict(row.get("end_reasons", {})),
-                }
-                for row in raw.get("history", ())
+                for index, member in enumerate(raw.get("population", ()))
             ]
-            if history:
-                elite_ids = set(self._population_trainer.history[-1].elite_ids)
-                for item in population:
-                    item["elite"] = item["member_id"] in elite_ids
+            raw_history = raw.get("history", ())
+            history = self._cached_telemetry(
+                "generation_history",
+                raw_history,
+                lambda: self._generation_history_rows(raw_history),
+            )
             genetics = raw.get("genetics") or {}
             champion = raw.get("champion") or raw.get("best_champion") or {}
             current_best = fitness.get("best")
@@ -791,6 +1020,7 @@ class DrivingLearningSession:
                 "completed_generations": len(self.generation_history),
                 "member_index": 0,
                 "population_size": 1,
+                "actor_count": self.config.actor_count,
                 "episode_step": self.env.steps,
                 "evaluation_steps": self.env.max_steps,
                 "evaluation_steps_per_lap": self.config.evaluation_steps,
@@ -812,7 +1042,17 @@ class DrivingLearningSession:
                     else self.episode_return
                 ),
                 "population": population,
-                "generation_history": list(self.generation_history),
+                "generation_history": self._cached_telemetry(
+                    "generation_history",
+                    (
+                        self.generation_history,
+                        len(self.generation_history),
+                        self.generation_history[-1]
+                        if self.generation_history
+                        else None,
+                    ),
+                    lambda: list(self.generation_history),
+                ),
                 "event": self._last_event,
                 **learning,
             }
@@ -823,12 +1063,9 @@ class DrivingLearningSession:
             self.agent = self._population_trainer.champion_agent()
         agent_learning = (
             dict(learning)
-            if self.is_population and isinstance(learning, Mapping)
+            if isinstance(learning, Mapping)
             else self.agent.telemetry(observation)
         )
-        # The visualizer receives the exact network. It may down-sample nodes and
-        # edges for legibility, but never invents values.
-        network = self.agent.network_snapshot(observation)
         replay = dict(agent_learning.get("replay", {}))
         if self.is_population:
             aggregate_memory = raw.get("memory") or {}
@@ -847,19 +1084,11 @@ class DrivingLearningSession:
                         aggregate_replay.get("member_count", 0)
                     ),
                     "protected_elites": sum(
-                        bool(member.get("protected_elite", False))
-                        for member in raw.get("population", ())
+                        member.protected_elite
+                        for member in self._population_trainer.population
                     ),
                 }
             )
-        memory_samples = [
-            {
-                "action": item.action,
-                "reward": item.reward,
-                "done": item.done,
-            }
-            for item in list(self.agent.replay)[-12:]
-        ]
         safety_value = snapshot.get("safety_prior")
         safety = (
             dict(safety_value)
@@ -871,7 +1100,16 @@ class DrivingLearningSession:
             agent_learning.get("last_action"),
         )
         executed_action = safety.get("executed_action", proposed_action)
-        epsilon_schedule = self._epsilon_schedule_telemetry()
+        epsilon_schedule = self._cached_telemetry(
+            "epsilon_schedule",
+            (
+                self.agent,
+                self.agent.environment_steps,
+                self.env.max_steps,
+                self._exploration_context(),
+            ),
+            self._epsilon_schedule_telemetry,
+        )
         environment_value = snapshot.get("environment")
         environment_snapshot = (
             dict(environment_value)
@@ -919,14 +1157,47 @@ class DrivingLearningSession:
                 "replay_size": replay.get("size", 0),
                 "replay_capacity": replay.get("capacity", 0),
                 "replay": replay,
-                "memory_samples": memory_samples,
-                "loss_history": list(self._loss_history),
-                "epsilon_history": list(self._epsilon_history),
                 "fitness": snapshot.get("current_fitness", 0.0),
-                "network": network,
                 "environment": environment_snapshot,
             }
         )
+        if "history" in sections:
+            snapshot["loss_history"], snapshot["epsilon_history"] = (
+                self._cached_telemetry(
+                    "learning_trace",
+                    self._learning_trace_version,
+                    lambda: (list(self._loss_history), list(self._epsilon_history)),
+                )
+            )
+        if "network" in sections:
+            # The visualizer receives exact weights and activations of evenly
+            # sampled neurons; nothing is invented for presentation.
+            network = self.agent.online_network
+            snapshot["network"] = self._cached_telemetry(
+                "network",
+                (
+                    network,
+                    network.parameter_version,
+                    np.asarray(observation, dtype=np.float32).tobytes(),
+                ),
+                lambda: self.agent.network_snapshot(
+                    observation, max_neurons_per_layer=self.NETWORK_SNAPSHOT_NEURONS
+                ),
+            )
+        if "memory" in sections:
+            replay_buffer = self.agent.replay
+            snapshot["memory_samples"] = self._cached_telemetry(
+                "memory_samples",
+                (replay_buffer, len(replay_buffer), self.agent.environment_steps),
+                lambda: [
+                    {
+                        "action": item.action,
+                        "reward": item.reward,
+                        "done": item.done,
+                    }
+                    for item in replay_buffer.tail(12)
+                ],
+            )
         if self.is_population:
             raw_health = snapshot.get("health")
             health = dict(raw_health) if isinstance(raw_health, Mapping) else {}
@@ -975,41 +1246,87 @@ class DrivingLearningSession:
                 )
         snapshot["health"] = health
         snapshot["learning_status"] = health.get("status", "critical")
+        snapshot["checkpoint"] = self._checkpoint_telemetry()
+        for section in self.TELEMETRY_SECTIONS:
+            if section not in sections:
+                for key in self._SECTION_KEYS[section]:
+                    snapshot.pop(key, None)
         return snapshot
 
-    def save(self, path: str | Path) -> Path:
-        """Save the current learner; population trainers may include ancestry."""
+    def save(self, path: str | Path, *, background: bool = False) -> Path:
+        """Save the current learner; population trainers may include ancestry.
 
-        output = Path(path).expanduser().resolve()
-        if self.is_population and hasattr(self._population_trainer, "save"):
-            saved = self._population_trainer.save(output)
+        The state is snapshotted before this returns either way.  With
+        ``background=True`` the file is written by the checkpoint writer
+        thread, so the caller keeps stepping; a save queued behind another
+        for the same path replaces it.  Progress is reported under
+        ``telemetry()["checkpoint"]``.
+        """
+
+        output = self._save(path, background=background)
+        self._last_event = "checkpoint_queued" if background else "checkpoint_saved"
+        return output
+
+    def _save(self, path: str | Path, *, background: bool) -> Path:
+        with self._paused_learner():
+            payload = self._checkpoint_payload()
+        if background:
+            output = self._checkpoint_writer.submit(payload, path)
         else:
-            # Keep the file compatible with ``DrivingDQNAgent.load`` by adding
-            # session metadata to the ordinary agent payload.  The agent
-            # intentionally ignores unknown top-level keys.
-            output.parent.mkdir(parents=True, exist_ok=True)
-            payload = self.agent.state_dict()
-            payload["environment_curriculum"] = self.env.curriculum_state()
-            # Resuming must continue the deterministic spawn stream. Saving
-            # only the unlock latch would make every process restart replay
-            # the same first 80/20 draw and random origin.
-            payload["environment_rng_state"] = self.env.random.getstate()
-            descriptor, temporary_name = tempfile.mkstemp(
-                prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
-            )
-            os.close(descriptor)
-            temporary = Path(temporary_name)
-            try:
-                torch.save(payload, temporary)
-                os.replace(temporary, output)
-            finally:
-                temporary.unlink(missing_ok=True)
-            saved = output
-        self._checkpoint_path = Path(saved)
-        self._last_event = "checkpoint_saved"
-        return Path(saved)
+            # An older queued write must not land after this one.
+            self._checkpoint_writer.flush()
+            output = write_checkpoint(payload, path)
+        self._checkpoint_path = output
+        return output
+
+    def flush_checkpoints(self) -> None:
+        """Wait until every background checkpoint has been written."""
+
+        self._checkpoint_writer.flush()
+
+    def _checkpoint_payload(self) -> dict[str, Any]:
+        if self.is_population:
+            return self._population_trainer.state_dict()
+        # Keep the file compatible with ``DrivingDQNAgent.load`` by adding
+        # session metadata to the ordinary agent payload.  The agent
+        # intentionally ignores unknown top-level keys.
+        payload = self.agent.state_dict()
+        payload["environment_curriculum"] = self.env.curriculum_state()
+        # Resuming must continue the deterministic spawn stream. Saving
+        # only the unlock latch would make every process restart replay
+        # the same first 80/20 draw and random origin.
+        payload["environment_rng_state"] = self.env.random.getstate()
+        return payload
+
+    def _autosave_if_due(self) -> None:
+        interval = self.config.autosave_generations
+        if interval <= 0:
+            return
+        generation = self.current_generation
+        if generation - self._autosave_generation < interval:
+            return
+        self._autosave_generation = generation
+        self._autosaves += 1
+        # The step's own event (e.g. ``generation_evolved``) stays visible;
+        # the checkpoint telemetry section reports the queued write.
+        self._save(self.config.autosave_path, background=True)
+
+    def _checkpoint_telemetry(self) -> dict[str, Any]:
+        return {
+            **self._checkpoint_writer.telemetry(),
+            "path": (
+                None if self._checkpoint_path is None else str(self._checkpoint_path)
+            ),
+            "autosave_generations": self.config.autosave_generations,
+            "autosaves": self._autosaves,
+        }
 
     def load(self, path: str | Path) -> None:
+        self._checkpoint_writer.flush()
+        with self._paused_learner():
+            self._load(path)
+
+    def _load(self, path: str | Path) -> None:
         checkpoint = Path(path).expanduser().resolve()
         if self.is_population:
             self._population_trainer.load(checkpoint)
@@ -1079,6 +1396,8 @@ class DrivingLearningSession:
                 # was read. Consume the saved stream once to begin the exact
                 # next episode an uninterrupted session would have seen.
                 self.observation = self.env.reset()
+            for actor in range(1, len(self._actor_envs) + 1):
+                self._restart_actor(actor)
             self.episode_return = 0.0
             # A standalone agent checkpoint has no episode scoreboard. Until a
             # new complete evaluation is available, its loaded policy is the
@@ -1091,6 +1410,7 @@ class DrivingLearningSession:
         self._wall_contact_decisions = 0
         self._collision_loop_terminations = 0
         self._checkpoint_path = checkpoint
+        self._autosave_generation = self.current_generation
         self._last_event = "checkpoint_loaded"
 
     def reset_current_evaluation(self) -> tuple[float, ...]:
@@ -1105,14 +1425,18 @@ class DrivingLearningSession:
                 self.env.lap_target
             )
             observation = self.env.reset()
+            self.agent.discard_pending_steps(stream=0)
             self.episode_return = 0.0
         self.observation = tuple(float(value) for value in observation)
         self._last_event = "evaluation_reset"
         return self.observation
 
     def close(self) -> None:
-        """Release persistent population workers; standalone DQN owns none."""
+        """Write queued checkpoints, then release workers and learner threads."""
 
+        self._checkpoint_writer.close()
+        if self._learner is not None:
+            self._learner.close()
         if self._population_trainer is not None:
             self._population_trainer.close()
 
@@ -14,6 +14,7 @@ import math
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pygame
 
 from .environment import DrivingEnv
@@ -102,6 +103,10 @@ def _integer(value: object, default: int = 0) -> int:
 
 
 def _sequence(value: object) -> list[object]:
+    if isinstance(value, np.ndarray):
+        # Network snapshots ship arrays; only their small sampled slices reach
+        # here, so converting to Python values per frame stays cheap.
+        return value.tolist() if value.ndim else []
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
         return list(value)
     return []
@@ -181,6 +186,12 @@ class DrivingLearningVisualization:
     """Draw a complete learning observatory onto one reusable Pygame surface."""
 
     TABS = ("OVERVIEW", "NETWORK", "MEMORY")
+    # Optional session telemetry sections each tab actually draws.
+    TAB_TELEMETRY_SECTIONS = {
+        "OVERVIEW": ("population", "history"),
+        "NETWORK": ("network",),
+        "MEMORY": ("history", "memory"),
+    }
     WIDTH = LEARNING_WINDOW_WIDTH
     HEIGHT = LEARNING_WINDOW_HEIGHT
 
@@ -338,6 +349,12 @@ class DrivingLearningVisualization:
         combined.update(source)
         return combined
 
+    @property
+    def telemetry_sections(self) -> tuple[str, ...]:
+        """Telemetry sections the active tab needs from the learning session."""
+
+        return self.TAB_TELEMETRY_SECTIONS[self.active_tab]
+
     def set_tab(self, tab: str | int) -> str:
         if isinstance(tab, int) and not isinstance(tab, bool):
             self.active_tab = self.TABS[tab % len(self.TABS)]
@@ -2337,10 +2354,20 @@ class DrivingLearningVisualization:
                     [_finite(value) for value in _sequence(row)]
                     for row in _sequence(layer.get("weights"))
                 ]
+                size = max(size, len(activations))
+                # Sampled snapshots name the real neuron behind each position.
+                neuron_indices = [
+                    _integer(value)
+                    for value in _sequence(layer.get("selected_indices"))
+                ]
                 layers.append(
                     {
                         "name": str(layer.get("name", f"layer_{index}")),
-                        "size": max(size, len(activations)),
+                        "size": size,
+                        "full_size": max(
+                            size, _integer(layer.get("full_size", size), size)
+                        ),
+                        "neuron_indices": neuron_indices,
                         "activations": activations,
                         "weights": weights,
                     }
@@ -2460,6 +2487,7 @@ class DrivingLearningVisualization:
         q_values = self._q_values(data)
         for layer_index, (layer, nodes) in enumerate(zip(layers, positions)):
             activations = layer["activations"]
+            neuron_indices = layer.get("neuron_indices") or ()
             activation_scale = (
                 max((abs(value) for value in activations), default=1.0) or 1.0
             )
@@ -2482,12 +2510,17 @@ class DrivingLearningVisualization:
                     self.surface, color if activations else COLORS["edge"], (x, y), 8, 1
                 )
                 label = ""
-                if layer_index == 0 and source_index < len(observations):
-                    label = observations[source_index][0]
+                neuron = (
+                    neuron_indices[source_index]
+                    if source_index < len(neuron_indices)
+                    else source_index
+                )
+                if layer_index == 0 and neuron < len(observations):
+                    label = observations[neuron][0]
                     text = self._render_text(label[:14], size=7, color=COLORS["muted"])
                     self.surface.blit(text, (x - 14 - text.get_width(), y - 4))
-                elif layer_index == len(layers) - 1 and source_index < len(q_values):
-                    label = q_values[source_index][0]
+                elif layer_index == len(layers) - 1 and neuron < len(q_values):
+                    label = q_values[neuron][0]
                     self._text(label, (x + 13, y - 5), size=8, color=COLORS["muted"])
             label = str(layer["name"]).replace("_", " ").upper()
             self._text(
@@ -2498,7 +2531,7 @@ class DrivingLearningVisualization:
                 bold=True,
             )
             self._text(
-                f"{layer['size']} UNITS",
+                f"{layer.get('full_size', layer['size'])} UNITS",
                 (nodes[0][0] - 34, content.bottom + 22),
                 size=8,
                 color=COLORS["muted"],
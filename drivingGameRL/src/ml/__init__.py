@@ -1,10 +1,13 @@
 """Learning building blocks for the observable Driving Lab."""
 
+from .async_learner import AsyncDQNLearner
+from .checkpoint_writer import CheckpointWriter, write_checkpoint
 from .config import (
     Algorithm,
     DQNConfig,
     POPULATION_EPSILON_END,
     POPULATION_EPSILON_START,
+    ReplayStrategy,
     default_population_dqn_config,
 )
 from .dqn import DrivingDQNAgent
@@ -17,11 +20,22 @@ from .evolution import (
     PopulationStep,
     PopulationTrainer,
 )
+from .inference import PopulationInference
 from .network import DrivingQNetwork
-from .replay import ReplayBuffer, Transition
+from .population_learner import PopulationLearner
+from .replay import (
+    PrioritizedReplayBatch,
+    PrioritizedReplayBuffer,
+    ReplayBatch,
+    ReplayBuffer,
+    SumTree,
+    Transition,
+)
 
 __all__ = (
     "Algorithm",
+    "AsyncDQNLearner",
+    "CheckpointWriter",
     "DQNConfig",
     "POPULATION_EPSILON_END",
     "POPULATION_EPSILON_START",
@@ -32,9 +46,17 @@ __all__ = (
     "EvaluationResult",
     "EvolutionConfig",
     "GenerationRecord",
+    "PopulationInference",
+    "PopulationLearner",
     "PopulationSession",
     "PopulationStep",
     "PopulationTrainer",
+    "PrioritizedReplayBatch",
+    "PrioritizedReplayBuffer",
+    "ReplayBatch",
     "ReplayBuffer",
+    "ReplayStrategy",
+    "SumTree",
     "Transition",
+    "write_checkpoint",
 )
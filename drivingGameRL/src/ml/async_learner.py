@@ -0,0 +1,184 @@
+"""Background replay updates for a standalone DQN agent."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from numbers import Real
+import math
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .dqn import DrivingDQNAgent
+
+
+class AsyncDQNLearner:
+    """Split one agent into a foreground actor and a background learner.
+
+    While running, :meth:`DrivingDQNAgent.observe` only stores transitions
+    and the learner thread runs :meth:`DrivingDQNAgent.train_step` until the
+    updates made since :meth:`start` reach ``replay_ratio`` times the
+    decisions observed since then.  The actor acts through a NumPy copy of
+    the online weights that the learner publishes after every
+    ``publish_interval`` updates, so acting never waits on backprop and
+    lags the learner by fewer than ``publish_interval`` updates.
+
+    Transitions are appended and sampled under one short replay lock.  Code
+    that reads or replaces network or optimizer state from the actor side
+    (checkpoints, clones, telemetry) wraps it in :meth:`paused`.  A failed
+    update stops the learner, and the actor's next ``observe`` raises.
+    Update timing depends on thread scheduling, so runs are not bit-exact.
+    """
+
+    def __init__(
+        self,
+        agent: DrivingDQNAgent,
+        *,
+        replay_ratio: float | None = None,
+        publish_interval: int = 4,
+    ):
+        if replay_ratio is None:
+            replay_ratio = 1.0 / agent.config.train_interval
+        if (
+            isinstance(replay_ratio, bool)
+            or not isinstance(replay_ratio, Real)
+            or not math.isfinite(replay_ratio)
+            or replay_ratio <= 0.0
+        ):
+            raise ValueError("replay_ratio must be finite and positive")
+        if (
+            isinstance(publish_interval, bool)
+            or not isinstance(publish_interval, int)
+            or publish_interval <= 0
+        ):
+            raise ValueError("publish_interval must be a positive integer")
+        self.agent = agent
+        self.replay_ratio = float(replay_ratio)
+        self.publish_interval = publish_interval
+        self.replay_lock = threading.Lock()
+        self._update_lock = threading.RLock()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closing = False
+        self._failure: BaseException | None = None
+        self._learning_start = max(agent.config.batch_size, agent.config.warmup_steps)
+        self.decisions = 0
+        self.updates = 0
+        self.publishes = 0
+        self._published_update = 0
+        self._published_parameters: tuple[tuple[np.ndarray, np.ndarray], ...] = ()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def published_parameters(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        """Acting weights the actor uses until the next publish."""
+
+        return self._published_parameters
+
+    @property
+    def staleness(self) -> int:
+        """Updates made since the actor's weights were published."""
+
+        return self.updates - self._published_update
+
+    def start(self) -> None:
+        """Attach to the agent and begin learning in a daemon thread."""
+
+        if self._thread is not None:
+            raise RuntimeError("asynchronous learner was already started")
+        if self.agent._learner is not None:
+            raise RuntimeError("agent already has an asynchronous learner")
+        self._publish()
+        self.agent._replay_lock = self.replay_lock
+        self.agent._learner = self
+        self._thread = threading.Thread(
+            target=self._run, name="driving-dqn-learner", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the thread and return the agent to inline training."""
+
+        thread = self._thread
+        if thread is None:
+            return
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        thread.join()
+        if self.agent._learner is self:
+            self.agent._learner = None
+            self.agent._replay_lock = nullcontext()
+
+    def record_decision(self) -> None:
+        """Count one stored actor decision and wake the learner if it is due."""
+
+        if self._failure is not None:
+            raise RuntimeError(
+                "asynchronous DQN learner failed; training cannot continue"
+            ) from self._failure
+        with self._condition:
+            self.decisions += 1
+            if self._update_due():
+                self._condition.notify()
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """Hold off updates; weights changed meanwhile are published on exit."""
+
+        with self._update_lock:
+            version = self.agent.online_network.parameter_version
+            yield
+            if self.agent.online_network.parameter_version != version:
+                self._publish()
+
+    def telemetry(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "failed": self._failure is not None,
+            "replay_ratio": self.replay_ratio,
+            "achieved_replay_ratio": (
+                self.updates / self.decisions if self.decisions else 0.0
+            ),
+            "decisions": self.decisions,
+            "updates": self.updates,
+            "publish_interval": self.publish_interval,
+            "publishes": self.publishes,
+            "staleness_updates": self.staleness,
+        }
+
+    def _update_due(self) -> bool:
+        return (
+            len(self.agent.replay) >= self._learning_start
+            and self.updates < self.replay_ratio * self.decisions
+        )
+
+    def _publish(self) -> None:
+        self._published_parameters = self.agent.online_network.acting_parameters()
+        self._published_update = self.updates
+        self.publishes += 1
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    while not self._closing and not self._update_due():
+                        self._condition.wait()
+                    if self._closing:
+                        return
+                with self._update_lock:
+                    self.agent.train_step()
+                    self.updates += 1
+                    if self.updates % self.publish_interval == 0:
+                        self._publish()
+        except BaseException as error:
+            self._failure = error
+
+
+__all__ = ("AsyncDQNLearner",)
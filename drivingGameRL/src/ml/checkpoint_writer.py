@@ -0,0 +1,150 @@
+"""Atomic checkpoint files, written inline or from a background thread."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any
+
+import torch
+
+
+def write_checkpoint(payload: Mapping[str, Any], path: str | Path) -> Path:
+    """Atomically replace *path* after Torch has written *payload* fully."""
+
+    output = Path(path).expanduser().resolve()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary_name = tempfile.mkstemp(
+        prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
+    )
+    os.close(descriptor)
+    temporary = Path(temporary_name)
+    try:
+        torch.save(payload, temporary)
+        os.replace(temporary, output)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return output
+
+
+class CheckpointWriter:
+    """Serialize checkpoint payloads on one background thread.
+
+    The caller snapshots state on its own thread; ``state_dict()`` payloads
+    already hold cloned tensors, so training may continue while the clone is
+    pickled and written.  :meth:`submit` returns at once.  A payload queued
+    for a path that is still waiting replaces the older one, so back-to-back
+    saves coalesce into a single write of the newest state.  Every write goes
+    through :func:`write_checkpoint`, so readers never see a partial file.
+
+    A failed write is recorded in :meth:`telemetry` and does not stop later
+    writes.  :meth:`close` writes everything still queued before it returns.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._queued: dict[Path, Mapping[str, Any]] = {}
+        self._writing: Path | None = None
+        self._thread: threading.Thread | None = None
+        self._closing = False
+        self.requests = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.last_written: Path | None = None
+        self.last_write_ms = 0.0
+        self.last_error: str | None = None
+
+    @property
+    def pending(self) -> int:
+        """Checkpoints queued or being written."""
+
+        with self._condition:
+            return len(self._queued) + (self._writing is not None)
+
+    def submit(self, payload: Mapping[str, Any], path: str | Path) -> Path:
+        """Queue *payload* for *path* and return the resolved destination."""
+
+        output = Path(path).expanduser().resolve()
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("checkpoint writer is closed")
+            if output in self._queued:
+                self.coalesced += 1
+            self._queued[output] = payload
+            self.requests += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="driving-checkpoint-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return output
+
+    def flush(self) -> None:
+        """Block until every queued checkpoint has been written or has failed."""
+
+        with self._condition:
+            while self._queued or self._writing is not None:
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Write what is still queued, then stop the thread."""
+
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def telemetry(self) -> dict[str, Any]:
+        with self._condition:
+            return {
+                "pending": len(self._queued) + (self._writing is not None),
+                "writing": None if self._writing is None else str(self._writing),
+                "requests": self.requests,
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "failures": self.failures,
+                "last_written": (
+                    None if self.last_written is None else str(self.last_written)
+                ),
+                "last_write_ms": self.last_write_ms,
+                "last_error": self.last_error,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queued and not self._closing:
+                    self._condition.wait()
+                if not self._queued:
+                    return
+                path = next(iter(self._queued))
+                payload = self._queued.pop(path)
+                self._writing = path
+            started = time.perf_counter()
+            error: Exception | None = None
+            try:
+                write_checkpoint(payload, path)
+            except Exception as failure:
+                error = failure
+            with self._condition:
+                self._writing = None
+                if error is None:
+                    self.writes += 1
+                    self.last_written = path
+                    self.last_write_ms = (time.perf_counter() - started) * 1_000.0
+                    self.last_error = None
+                else:
+                    self.failures += 1
+                    self.last_error = f"{type(error).__name__}: {error}"
+                self._condition.notify_all()
+
+
+__all__ = ("CheckpointWriter", "write_checkpoint")
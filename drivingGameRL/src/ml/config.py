@@ -8,6 +8,7 @@ from typing import Any, Literal, Mapping, get_type_hints
 
 
 Algorithm = Literal["dqn", "double_dqn"]
+ReplayStrategy = Literal["uniform", "prioritized"]
 
 POPULATION_EPSILON_START = 0.30
 POPULATION_EPSILON_END = 0.05
@@ -21,6 +22,11 @@ class DQNConfig:
 
     The defaults match :class:`drivingGameRL.src.environment.DrivingEnv`:
     sixteen normalized observations and five discrete driving actions.
+    ``replay_strategy="prioritized"`` replays transitions in proportion to
+    their TD error; its importance-sampling exponent anneals linearly from
+    ``priority_beta`` to one over ``epsilon_decay_steps``.  ``n_step`` folds
+    that many consecutive decisions into each replay entry and bootstraps
+    with ``gamma ** n_step``.
     """
 
     observation_size: int = 16
@@ -28,10 +34,15 @@ class DQNConfig:
     hidden_sizes: tuple[int, ...] = (128, 128)
     algorithm: Algorithm = "double_dqn"
     replay_capacity: int = 50_000
+    replay_strategy: ReplayStrategy = "uniform"
+    priority_alpha: float = 0.6
+    priority_beta: float = 0.4
+    priority_epsilon: float = 1e-3
     batch_size: int = 64
     warmup_steps: int = 512
     train_interval: int = 1
     target_sync_interval: int = 500
+    n_step: int = 1
     gamma: float = 0.99
     learning_rate: float = 5e-4
     weight_decay: float = 1e-5
@@ -61,12 +72,18 @@ class DQNConfig:
         if self.algorithm not in ("dqn", "double_dqn"):
             raise ValueError("algorithm must be 'dqn' or 'double_dqn'")
         self._positive_integer("replay_capacity", self.replay_capacity)
+        if self.replay_strategy not in ("uniform", "prioritized"):
+            raise ValueError("replay_strategy must be 'uniform' or 'prioritized'")
+        self._non_negative_finite("priority_alpha", self.priority_alpha)
+        self._finite_in_range("priority_beta", self.priority_beta, 0.0, 1.0)
+        self._positive_finite("priority_epsilon", self.priority_epsilon)
         self._positive_integer("batch_size", self.batch_size)
         if self.batch_size > self.replay_capacity:
             raise ValueError("batch_size cannot exceed replay_capacity")
         self._non_negative_integer("warmup_steps", self.warmup_steps)
         self._positive_integer("train_interval", self.train_interval)
         self._positive_integer("target_sync_interval", self.target_sync_interval)
+        self._positive_integer("n_step", self.n_step)
         self._positive_integer("epsilon_decay_steps", self.epsilon_decay_steps)
 
         self._finite_in_range("gamma", self.gamma, 0.0, 1.0)
@@ -181,5 +198,6 @@ __all__ = (
     "POPULATION_EPSILON_START",
     "POPULATION_REPLAY_WARMUP_STEPS",
     "POPULATION_TRAIN_INTERVAL",
+    "ReplayStrategy",
     "default_population_dqn_config",
 )
@@ -2,24 +2,33 @@
 
 from __future__ import annotations
 
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
 from copy import deepcopy
 from dataclasses import replace
 import math
 from numbers import Real
-import os
 from pathlib import Path
 import random
-import tempfile
-from typing import Any, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
 import numpy as np
 import torch
 from torch import nn
 
 from ..learning_health import build_learning_health
+from .checkpoint_writer import write_checkpoint
 from .config import DQNConfig
-from .network import DrivingQNetwork
-from .replay import ReplayBuffer
+from .network import DrivingQNetwork, acting_forward
+from .replay import (
+    PrioritizedReplayBatch,
+    PrioritizedReplayBuffer,
+    ReplayBatch,
+    ReplayBuffer,
+)
+
+if TYPE_CHECKING:
+    from .async_learner import AsyncDQNLearner
 
 
 class DrivingDQNAgent:
@@ -52,12 +61,31 @@ class DrivingDQNAgent:
             weight_decay=self.config.weight_decay,
         )
         self.loss_function = nn.SmoothL1Loss()
-        self.replay = ReplayBuffer(
-            self.config.replay_capacity,
-            self.config.observation_size,
-            seed=self.config.seed,
-        )
+        self.replay: ReplayBuffer
+        if self.config.replay_strategy == "prioritized":
+            self.replay = PrioritizedReplayBuffer(
+                self.config.replay_capacity,
+                self.config.observation_size,
+                seed=self.config.seed,
+                alpha=self.config.priority_alpha,
+                epsilon=self.config.priority_epsilon,
+            )
+        else:
+            self.replay = ReplayBuffer(
+                self.config.replay_capacity,
+                self.config.observation_size,
+                seed=self.config.seed,
+            )
         self._rng = random.Random(self.config.seed)
+        # Decisions not yet folded into an n-step replay entry, oldest first,
+        # kept per experience stream so parallel actors never share a window.
+        self._pending_steps: dict[
+            int, deque[tuple[np.ndarray, int, float, np.ndarray]]
+        ] = {}
+        self._bootstrap_discount = self.config.gamma**self.config.n_step
+        # An attached AsyncDQNLearner swaps in its lock and trains instead.
+        self._learner: AsyncDQNLearner | None = None
+        self._replay_lock: AbstractContextManager[Any] = nullcontext()
         self.environment_steps = 0
         self.gradient_steps = 0
         self.target_syncs = 0
@@ -72,6 +100,9 @@ class DrivingDQNAgent:
         self.last_policy = "uninitialized"
         self.last_q_values = np.zeros(self.config.action_size, dtype=np.float32)
         self.action_counts = [0 for _ in range(self.config.action_size)]
+        # Telemetry reuses these until the weights or the observation change.
+        self._telemetry_q_values: tuple[Any, list[float]] | None = None
+        self._telemetry_norms: tuple[Any, tuple[float, float]] | None = None
 
     @property
     def epsilon(self) -> float:
@@ -80,6 +111,13 @@ class DrivingDQNAgent:
             self.config.epsilon_end - self.config.epsilon_start
         )
 
+    @property
+    def priority_beta(self) -> float:
+        """Importance-sampling exponent, annealed to one with epsilon."""
+
+        progress = min(1.0, self.environment_steps / self.config.epsilon_decay_steps)
+        return self.config.priority_beta + progress * (1.0 - self.config.priority_beta)
+
     @property
     def network(self) -> DrivingQNetwork:
         """Short alias useful to generic policy renderers."""
@@ -91,15 +129,30 @@ class DrivingDQNAgent:
         return self.replay
 
     def q_values(self, observation: Sequence[float] | np.ndarray) -> np.ndarray:
-        array = self._observation(observation)
-        was_training = self.online_network.training
-        self.online_network.eval()
-        try:
-            with torch.no_grad():
-                values = self.online_network(torch.from_numpy(array))
-        finally:
-            self.online_network.train(was_training)
-        result = values.detach().cpu().numpy().astype(np.float32, copy=True)
+        """Greedy-acting Q-values from the network's cached NumPy mirror.
+
+        With an asynchronous learner attached, the mirror is the learner's
+        last published copy rather than the live online weights.
+        """
+
+        return self.q_values_many((observation,))[0]
+
+    def q_values_many(
+        self, observations: Sequence[Sequence[float] | np.ndarray]
+    ) -> np.ndarray:
+        """One row of acting Q-values per observation, in one forward pass.
+
+        Each row equals :meth:`q_values` for that observation alone.
+        """
+
+        if not observations:
+            raise ValueError("q_values_many requires at least one observation")
+        batch = np.stack([self._observation(value) for value in observations])
+        learner = self._learner
+        if learner is None:
+            result = self.online_network.acting_values(batch)
+        else:
+            result = acting_forward(learner.published_parameters, batch)
         if not np.isfinite(result).all():
             raise FloatingPointError("driving policy produced non-finite Q-values")
         return result
@@ -107,7 +160,21 @@ class DrivingDQNAgent:
     def select_action(
         self, observation: Sequence[float] | np.ndarray, *, explore: bool = True
     ) -> int:
-        values = self.q_values(observation)
+        return self.select_action_from_values(
+            self.q_values(observation), explore=explore
+        )
+
+    act = select_action
+
+    def select_action_from_values(
+        self, values: np.ndarray, *, explore: bool = True
+    ) -> int:
+        """Choose an action from Q-values already computed for this agent.
+
+        Batched population inference evaluates many members at once; this
+        applies the same epsilon draw and bookkeeping as :meth:`select_action`.
+        """
+
         if explore and self._rng.random() < self.epsilon:
             action = self._rng.randrange(self.config.action_size)
             policy = "explore"
@@ -120,8 +187,6 @@ class DrivingDQNAgent:
         self.action_counts[action] += 1
         return action
 
-    act = select_action
-
     def observe(
         self,
         state: Sequence[float] | np.ndarray,
@@ -129,8 +194,22 @@ class DrivingDQNAgent:
         reward: float,
         next_state: Sequence[float] | np.ndarray,
         done: bool,
+        *,
+        stream: int = 0,
+        train: bool = True,
     ) -> float | None:
-        """Store a transition and run one scheduled replay update if ready."""
+        """Store a transition and run one scheduled replay update if ready.
+
+        With ``n_step > 1`` the replay entry for a decision is written once
+        ``n_step`` later decisions are known, carrying their discounted
+        reward sum and the final next state.  A ``done`` transition flushes
+        every pending decision as a shorter terminal entry, so no entry ever
+        spans two episodes.  Actors sharing this agent pass distinct
+        ``stream`` ids so their windows stay separate.  With an asynchronous
+        learner attached, or with ``train=False`` for a caller that batches
+        due updates itself (see :attr:`training_due`), the transition is only
+        stored and ``None`` is returned.
+        """
 
         if isinstance(action, bool) or not isinstance(action, (int, np.integer)):
             raise ValueError("action must be an integer")
@@ -139,44 +218,143 @@ class DrivingDQNAgent:
             raise ValueError(
                 f"action must be in the [0, {self.config.action_size}) interval"
             )
-        self.replay.append(state, action, reward, next_state, done)
+        with self._replay_lock:
+            if self.config.n_step == 1:
+                self.replay.append(state, action, reward, next_state, done)
+            else:
+                self._store_n_step(state, action, reward, next_state, done, stream)
         self.environment_steps += 1
-        learning_start = max(self.config.batch_size, self.config.warmup_steps)
-        if len(self.replay) < learning_start:
+        if self._learner is not None:
+            self._learner.record_decision()
             return None
-        if self.environment_steps % self.config.train_interval:
+        if not train or not self.training_due:
             return None
         return self.train_step()
 
+    @property
+    def training_due(self) -> bool:
+        """Whether the latest stored decision schedules a replay update."""
+
+        learning_start = max(self.config.batch_size, self.config.warmup_steps)
+        return (
+            len(self.replay) >= learning_start
+            and self.environment_steps % self.config.train_interval == 0
+        )
+
     remember = observe
 
+    def discard_pending_steps(self, stream: int | None = None) -> None:
+        """Forget decisions of an episode abandoned without a ``done`` step.
+
+        ``stream`` selects one actor's window; ``None`` forgets every stream.
+        """
+
+        if stream is None:
+            self._pending_steps.clear()
+        else:
+            self._pending_steps.pop(stream, None)
+
+    def _store_n_step(
+        self,
+        state: Sequence[float] | np.ndarray,
+        action: int,
+        reward: float,
+        next_state: Sequence[float] | np.ndarray,
+        done: bool,
+        stream: int,
+    ) -> None:
+        transition = self.replay.validate_transition(
+            state, action, reward, next_state, done
+        )
+        pending = self._pending_steps.setdefault(stream, deque())
+        pending.append(
+            (
+                transition.state,
+                transition.action,
+                transition.reward,
+                transition.next_state,
+            )
+        )
+        if not done and len(pending) < self.config.n_step:
+            return
+        while pending:
+            first_state, first_action, _, _ = pending[0]
+            discounted = 0.0
+            for offset, (_, _, step_reward, _) in enumerate(pending):
+                discounted += self.config.gamma**offset * step_reward
+            self.replay.append(
+                first_state, first_action, discounted, transition.next_state, done
+            )
+            pending.popleft()
+            if not done:
+                break
+
     def train_step(self) -> float | None:
-        """Fit one uniformly sampled replay batch."""
+        """Fit one replay batch, uniformly or by TD-error priority."""
 
-        if len(self.replay) < self.config.batch_size:
+        batch = self._sample_update_batch()
+        if batch is None:
             return None
-        batch = self.replay.sample(self.config.batch_size)
-        states = torch.from_numpy(np.stack([item.state for item in batch]))
-        actions = torch.tensor([item.action for item in batch], dtype=torch.long)
-        rewards = torch.tensor([item.reward for item in batch], dtype=torch.float32)
-        next_states = torch.from_numpy(np.stack([item.next_state for item in batch]))
-        dones = torch.tensor([item.done for item in batch], dtype=torch.bool)
+        states = torch.from_numpy(batch.states)
+        actions = torch.from_numpy(batch.actions)
+        rewards = torch.from_numpy(batch.rewards)
+        next_states = torch.from_numpy(batch.next_states)
+        dones = torch.from_numpy(batch.dones)
 
         self.online_network.train()
         predicted = self.online_network(states).gather(1, actions[:, None]).squeeze(1)
         bootstrap = self._bootstrap_values(next_states)
-        targets = rewards + (~dones).float() * self.config.gamma * bootstrap
+        targets = rewards + (~dones).float() * self._bootstrap_discount * bootstrap
+        self._require_finite_targets(predicted, targets)
 
+        self.optimizer.zero_grad(set_to_none=True)
+        if isinstance(batch, PrioritizedReplayBatch):
+            # Importance weights undo the sampling bias of prioritized replay.
+            elementwise = nn.functional.smooth_l1_loss(
+                predicted, targets, reduction="none"
+            )
+            loss = (torch.from_numpy(batch.weights) * elementwise).mean()
+        else:
+            loss = self.loss_function(predicted, targets)
+        self._require_finite_loss(loss)
+        loss.backward()
+        return self._apply_update(batch, loss, predicted, targets)
+
+    def _sample_update_batch(self) -> ReplayBatch | PrioritizedReplayBatch | None:
+        if len(self.replay) < self.config.batch_size:
+            return None
+        with self._replay_lock:
+            if isinstance(self.replay, PrioritizedReplayBuffer):
+                return self.replay.sample_batch(
+                    self.config.batch_size, beta=self.priority_beta
+                )
+            return self.replay.sample_batch(self.config.batch_size)
+
+    def _require_finite_targets(
+        self, predicted: torch.Tensor, targets: torch.Tensor
+    ) -> None:
         if not torch.isfinite(predicted).all() or not torch.isfinite(targets).all():
             self.nonfinite_update_rejections += 1
             raise FloatingPointError("DQN update produced non-finite values")
 
-        self.optimizer.zero_grad(set_to_none=True)
-        loss = self.loss_function(predicted, targets)
+    def _require_finite_loss(self, loss: torch.Tensor) -> None:
         if not torch.isfinite(loss):
             self.nonfinite_update_rejections += 1
             raise FloatingPointError("DQN update produced a non-finite loss")
-        loss.backward()
+
+    def _apply_update(
+        self,
+        batch: ReplayBatch | PrioritizedReplayBatch,
+        loss: torch.Tensor,
+        predicted: torch.Tensor,
+        targets: torch.Tensor,
+    ) -> float:
+        """Clip, step and record an update whose gradients are already set.
+
+        :class:`PopulationLearner` backpropagates many members at once and
+        then finishes each member's update here, like :meth:`train_step`.
+        """
+
         gradient_norm = torch.nn.utils.clip_grad_norm_(
             self.online_network.parameters(), self.config.gradient_clip
         )
@@ -200,6 +378,9 @@ class DrivingDQNAgent:
         if self.gradient_steps % self.config.target_sync_interval == 0:
             self.sync_target()
         td_errors = targets.detach() - predicted.detach()
+        if isinstance(batch, PrioritizedReplayBatch):
+            with self._replay_lock:
+                self.replay.update_priorities(batch.slots, td_errors.numpy())
         self.last_loss = float(loss.detach())
         self.last_gradient_norm = float(gradient_norm.detach())
         self.last_predicted_mean = float(predicted.detach().mean())
@@ -220,7 +401,8 @@ class DrivingDQNAgent:
             return target_values.gather(1, online_actions).squeeze(1)
 
     def sync_target(self) -> None:
-        self.target_network.load_state_dict(self.online_network.state_dict())
+        with torch.no_grad():
+            self.target_network.genome.copy_(self.online_network.genome)
         self.target_network.eval()
         self.target_syncs += 1
 
@@ -237,7 +419,12 @@ class DrivingDQNAgent:
         )
         if not isinstance(network, DrivingQNetwork):
             raise TypeError("source must be a DrivingDQNAgent or DrivingQNetwork")
-        self.online_network.load_state_dict(network.state_dict())
+        if network.architecture == self.online_network.architecture:
+            with torch.no_grad():
+                self.online_network.genome.copy_(network.genome)
+        else:
+            # Let PyTorch report the exact mismatched tensor shapes.
+            self.online_network.load_state_dict(network.state_dict())
         if sync_target:
             self.sync_target()
 
@@ -248,9 +435,11 @@ class DrivingDQNAgent:
 
         clone_seed = self.config.seed if seed is None else seed
         clone = DrivingDQNAgent(replace(self.config, seed=clone_seed))
-        clone.online_network.load_state_dict(self.online_network.state_dict())
+        with torch.no_grad():
+            clone.online_network.genome.copy_(self.online_network.genome)
         if include_optimizer:
-            clone.target_network.load_state_dict(self.target_network.state_dict())
+            with torch.no_grad():
+                clone.target_network.genome.copy_(self.target_network.genome)
             clone.optimizer.load_state_dict(deepcopy(self.optimizer.state_dict()))
             clone.environment_steps = self.environment_steps
             clone.gradient_steps = self.gradient_steps
@@ -264,14 +453,20 @@ class DrivingDQNAgent:
             clone.nonfinite_update_rejections = self.nonfinite_update_rejections
             clone._rng.setstate(self._rng.getstate())
         else:
-            clone.target_network.load_state_dict(clone.online_network.state_dict())
+            with torch.no_grad():
+                clone.target_network.genome.copy_(clone.online_network.genome)
         clone.target_network.eval()
         return clone
 
     def network_snapshot(
-        self, observation: Sequence[float] | np.ndarray
+        self,
+        observation: Sequence[float] | np.ndarray,
+        *,
+        max_neurons_per_layer: int | None = None,
     ) -> dict[str, Any]:
-        return self.online_network.snapshot(observation)
+        return self.online_network.snapshot(
+            observation, max_neurons_per_layer=max_neurons_per_layer
+        )
 
     def telemetry(
         self, observation: Sequence[float] | np.ndarray | None = None
@@ -293,7 +488,7 @@ class DrivingDQNAgent:
 
         try:
             q_values = (
-                self.q_values(observation).tolist()
+                self._telemetry_q_values_for(observation)
                 if observation is not None
                 else self.last_q_values.astype(float).tolist()
             )
@@ -303,24 +498,9 @@ class DrivingDQNAgent:
         if not all(math.isfinite(float(value)) for value in q_values):
             q_values = [0.0] * self.config.action_size
             telemetry_alerts.append("non_finite:q_values")
-        parameter_norm = finite_metric(
-            "parameter_norm",
-            math.sqrt(
-                sum(
-                    float(torch.sum(parameter.detach() ** 2))
-                    for parameter in self.online_network.parameters()
-                )
-            ),
-        )
-        target_gap = finite_metric(
-            "target_parameter_gap",
-            sum(
-                float(torch.mean(torch.abs(online.detach() - target.detach())))
-                for online, target in zip(
-                    self.online_network.parameters(), self.target_network.parameters()
-                )
-            ),
-        )
+        raw_norm, raw_gap = self._telemetry_parameter_norms()
+        parameter_norm = finite_metric("parameter_norm", raw_norm)
+        target_gap = finite_metric("target_parameter_gap", raw_gap)
         replay = self.replay.stats()
         learning = {
             "algorithm": self.config.algorithm,
@@ -349,6 +529,14 @@ class DrivingDQNAgent:
             "parameter_count": self.online_network.parameter_count,
             "parameter_norm": parameter_norm,
             "architecture": list(self.online_network.architecture),
+            "replay_strategy": self.config.replay_strategy,
+            "n_step": self.config.n_step,
+            "pending_n_step": sum(
+                len(pending) for pending in self._pending_steps.values()
+            ),
+            "async_learner": (
+                None if self._learner is None else self._learner.telemetry()
+            ),
             "replay": replay,
         }
         health = build_learning_health(
@@ -368,6 +556,49 @@ class DrivingDQNAgent:
         learning["health"] = health
         return learning
 
+    def _telemetry_q_values_for(
+        self, observation: Sequence[float] | np.ndarray
+    ) -> list[float]:
+        """Acting Q-values for telemetry, recomputed only for new weights or input."""
+
+        key = (
+            self.online_network.parameter_version,
+            None if self._learner is None else self._learner.publishes,
+            np.asarray(observation, dtype=np.float32).tobytes(),
+        )
+        cached = self._telemetry_q_values
+        if cached is None or cached[0] != key:
+            cached = (key, self.q_values(observation).tolist())
+            self._telemetry_q_values = cached
+        return list(cached[1])
+
+    def _telemetry_parameter_norms(self) -> tuple[float, float]:
+        """Online weight norm and online-target gap, cached per weight version."""
+
+        key = (
+            self.online_network.parameter_version,
+            self.target_network.parameter_version,
+        )
+        cached = self._telemetry_norms
+        if cached is None or cached[0] != key:
+            with torch.no_grad():
+                norm = math.sqrt(
+                    sum(
+                        float(torch.sum(parameter.detach() ** 2))
+                        for parameter in self.online_network.parameters()
+                    )
+                )
+                gap = sum(
+                    float(torch.mean(torch.abs(online.detach() - target.detach())))
+                    for online, target in zip(
+                        self.online_network.parameters(),
+                        self.target_network.parameters(),
+                    )
+                )
+            cached = (key, (norm, gap))
+            self._telemetry_norms = cached
+        return cached[1]
+
     def state_dict(self) -> dict[str, Any]:
         """Serializable training state (replay contents are intentionally omitted)."""
 
@@ -442,6 +673,7 @@ class DrivingDQNAgent:
         self.target_network.eval()
         if load_optimizer:
             self.optimizer.load_state_dict(optimizer_state)
+        self._pending_steps.clear()
         self.environment_steps = int(state.get("environment_steps", 0))
         self.gradient_steps = int(state.get("gradient_steps", 0))
         self.target_syncs = int(state.get("target_syncs", 0))
@@ -666,19 +898,7 @@ class DrivingDQNAgent:
     def save(self, path: str | Path) -> Path:
         """Atomically replace a checkpoint after Torch has written it fully."""
 
-        output = Path(path).expanduser().resolve()
-        output.parent.mkdir(parents=True, exist_ok=True)
-        descriptor, temporary_name = tempfile.mkstemp(
-            prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
-        )
-        os.close(descriptor)
-        temporary = Path(temporary_name)
-        try:
-            torch.save(self.state_dict(), temporary)
-            os.replace(temporary, output)
-        finally:
-            temporary.unlink(missing_ok=True)
-        return output
+        return write_checkpoint(self.state_dict(), path)
 
     def load(self, path: str | Path, *, load_optimizer: bool = True) -> None:
         state = self.read_checkpoint(path)
@@ -9,39 +9,60 @@ before selection, combining within-lifetime and across-generation learning.
 Every member owns an isolated ``DrivingEnv`` and evaluation context.  Active
 members advance one lockstep tick through a bounded thread pool; results are
 merged by population index on the coordinator thread.  Seeded runs therefore
-remain reproducible even when worker completion order changes.
+remain reproducible even when worker completion order changes.  A single
+worker instead interleaves members tick by tick and evaluates all of their
+policies with one batched forward pass; ``batched_updates=True`` also routes
+``genetic_dqn`` members through that path so every replay update due in a
+tick runs as one stacked backward pass.  Greedy ``genetic`` populations can
+also run on ``worker_backend="process"``, where spawned worker processes own
+the member simulations and escape the interpreter lock.
+
+Greedy evaluations (every ``genetic`` member and the protected elites of
+``genetic_dqn``) are deterministic functions of the genome and the spawned
+scenario, so their scorecards are memoized and an identical replay reuses
+the stored result instead of simulating it again.
+
+``racing_rungs`` optionally races each generation by successive halving: at
+every rung the members still in contention are ranked on the fitness earned
+so far, and those outside the best ``racing_keep`` fraction stop early so the
+survivors share the freed workers.
 """
 
 from __future__ import annotations
 
-from collections import deque
-from collections.abc import Callable, Mapping
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field, fields, replace
+import hashlib
 import math
 import os
 from pathlib import Path
-import tempfile
 from time import perf_counter
 from typing import Any, Literal, NoReturn
 
 import numpy as np
 import torch
 
-from ..environment import DrivingAction, DrivingEnv, StepResult
+from ..environment import DrivingAction, DrivingEnv, StepInfo, StepResult
 from ..learning_health import build_learning_health
 from ..sensor_clearance import (
     SensorClearanceDecision,
     SensorClearancePolicy,
     SensorClearanceStats,
 )
+from .checkpoint_writer import write_checkpoint
 from .config import DQNConfig, default_population_dqn_config
 from .dqn import DrivingDQNAgent
+from .inference import PopulationInference
+from .population_learner import PopulationLearner
+from .process_pool import PopulationProcessPool
 
 
 EvolutionAlgorithm = Literal["genetic", "genetic_dqn"]
 CrossoverMode = Literal["uniform", "blend"]
+WorkerBackend = Literal["thread", "process"]
 
 
 def normalize_evolution_algorithm(value: str) -> EvolutionAlgorithm:
@@ -78,11 +99,17 @@ class EvolutionConfig:
     max_lap_target: int = 5
     history_capacity: int = 256
     seed: int = 7
+    fitness_cache_size: int = 256
+    # Fractions of the step budget at which dominated members stop early.
+    racing_rungs: tuple[float, ...] = ()
+    racing_keep: float = 0.5
 
     def __post_init__(self) -> None:
         object.__setattr__(
             self, "algorithm", normalize_evolution_algorithm(self.algorithm)
         )
+        if isinstance(self.racing_rungs, list):
+            object.__setattr__(self, "racing_rungs", tuple(self.racing_rungs))
         crossover = str(self.crossover).strip().lower().replace("-", "_")
         if crossover not in ("uniform", "blend"):
             raise ValueError("crossover must be 'uniform' or 'blend'")
@@ -116,6 +143,27 @@ class EvolutionConfig:
             raise ValueError("seed must be an integer")
         if not 0 <= self.seed < 2**63:
             raise ValueError("seed must be in the [0, 2**63) interval")
+        if (
+            isinstance(self.fitness_cache_size, bool)
+            or not isinstance(self.fitness_cache_size, int)
+            or self.fitness_cache_size < 0
+        ):
+            raise ValueError("fitness_cache_size must be a non-negative integer")
+        if not isinstance(self.racing_rungs, tuple) or any(
+            isinstance(value, bool)
+            or not isinstance(value, (int, float))
+            or not 0.0 < float(value) < 1.0
+            for value in self.racing_rungs
+        ):
+            raise ValueError("racing_rungs must contain fractions in (0, 1)")
+        if any(
+            later <= earlier
+            for earlier, later in zip(self.racing_rungs, self.racing_rungs[1:])
+        ):
+            raise ValueError("racing_rungs must be strictly increasing")
+        self._probability("racing_keep", self.racing_keep)
+        if self.racing_keep <= 0.0:
+            raise ValueError("racing_keep must be greater than zero")
 
     @property
     def crossover_mode(self) -> CrossoverMode:
@@ -188,6 +236,10 @@ class EvaluationResult:
     best_lap_time: float | None = None
     mean_lap_time: float | None = None
     lap_time_bonus_total: float = 0.0
+    cached: bool = False
+    # Index of the racing rung that cut this member from contention.
+    racing_rung: int | None = None
+    early_stopped: bool = False
 
     def __post_init__(self) -> None:
         for name in (
@@ -238,6 +290,18 @@ class EvaluationResult:
             raise ValueError("terminated and truncated must be booleans")
         if not isinstance(self.lap_target_completed, bool):
             raise ValueError("lap_target_completed must be a boolean")
+        if not isinstance(self.cached, bool):
+            raise ValueError("cached must be a boolean")
+        if self.racing_rung is not None and (
+            isinstance(self.racing_rung, bool)
+            or not isinstance(self.racing_rung, int)
+            or self.racing_rung < 0
+        ):
+            raise ValueError("racing_rung must be None or a non-negative integer")
+        if not isinstance(self.early_stopped, bool):
+            raise ValueError("early_stopped must be a boolean")
+        if self.early_stopped and self.racing_rung is None:
+            raise ValueError("early_stopped requires racing_rung")
         if self.lap_target_completed and self.laps < self.lap_target:
             raise ValueError(
                 "lap_target_completed requires laps to reach lap_target"
@@ -298,6 +362,19 @@ class PopulationMember:
     def evaluated(self) -> bool:
         return self.result is not None
 
+    @property
+    def selection_rank(self) -> tuple[float, float]:
+        """Racing rungs survived, then fitness; larger ranks higher.
+
+        A member cut at a rung ranks below every member that stayed in the
+        race past it, whatever either one scored afterwards.
+        """
+
+        if self.result is None:
+            return (-math.inf, -math.inf)
+        rung = self.result.racing_rung
+        return (math.inf if rung is None else float(rung), self.result.fitness)
+
     @property
     def protected_elite(self) -> bool:
         """Whether this genome is the exact survivor of the prior generation."""
@@ -343,6 +420,8 @@ class GenerationRecord:
     best_lap_time: float | None = None
     mean_lap_time: float | None = None
     lap_finishers: int = 0
+    cached_evaluations: int = 0
+    early_stopped: int = 0
 
     def __post_init__(self) -> None:
         for name in ("generation", "champion_id", "population_size"):
@@ -358,6 +437,8 @@ class GenerationRecord:
             "lap_target",
             "target_finishers",
             "lap_finishers",
+            "cached_evaluations",
+            "early_stopped",
         ):
             value = getattr(self, name)
             if isinstance(value, bool) or not isinstance(value, int) or value < 0:
@@ -372,6 +453,10 @@ class GenerationRecord:
             raise ValueError("target_finishers cannot exceed population_size")
         if self.lap_finishers > self.population_size:
             raise ValueError("lap_finishers cannot exceed population_size")
+        if self.cached_evaluations > self.population_size:
+            raise ValueError("cached_evaluations cannot exceed population_size")
+        if self.early_stopped > self.population_size:
+            raise ValueError("early_stopped cannot exceed population_size")
         if not isinstance(self.elite_ids, tuple) or any(
             isinstance(value, bool) or not isinstance(value, int) or value < 0
             for value in self.elite_ids
@@ -573,6 +658,9 @@ class _EvaluationRuntime:
     last_info: dict[str, object] = field(default_factory=dict)
     safety: SensorClearanceStats = field(default_factory=SensorClearanceStats)
     pose_reset: bool = False
+    # Set for greedy rollouts whose scorecard may be memoized.
+    cache_key: tuple[object, ...] | None = None
+    curriculum_lap_completed: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -601,6 +689,7 @@ class PopulationTrainer:
     MAX_WORKER_CHUNK_TICKS = 8
     NEAR_FINISH_THRESHOLD = 0.90
     SAFETY_INTERVENTION_FITNESS_PENALTY = 0.05
+    WORKER_BACKENDS = ("thread", "process")
     _SEED_LIMIT = 2**63
 
     def __init__(
@@ -613,6 +702,8 @@ class PopulationTrainer:
         env_factory: Callable[[int], DrivingEnv] | None = None,
         auto_evolve: bool = True,
         parallel_workers: int | None = None,
+        worker_backend: WorkerBackend = "thread",
+        batched_updates: bool = False,
     ) -> None:
         if env is not None and env_factory is not None:
             raise ValueError("provide env or env_factory, not both")
@@ -646,7 +737,27 @@ class PopulationTrainer:
             requested_workers,
             32,
         )
+        if worker_backend not in self.WORKER_BACKENDS:
+            raise ValueError("worker_backend must be 'thread' or 'process'")
+        if worker_backend == "process" and self.config.algorithm != "genetic":
+            # Hybrid children learn during their lifetime, which needs the
+            # optimizer and replay memory next to the simulation.
+            raise ValueError(
+                "worker_backend='process' requires the greedy genetic algorithm"
+            )
+        self.worker_backend: WorkerBackend = worker_backend
+        if not isinstance(batched_updates, bool):
+            raise ValueError("batched_updates must be a boolean")
+        if batched_updates and self.config.algorithm != "genetic_dqn":
+            raise ValueError("batched_updates requires the genetic_dqn algorithm")
+        self.batched_updates = batched_updates
         self._executor: ThreadPoolExecutor | None = None
+        # Created on the first process-backed tick; owns worker processes.
+        self._process_pool: PopulationProcessPool | None = None
+        # Serial trainers advance members in lockstep and batch their policies.
+        self._inference = PopulationInference()
+        # Due replay updates of a lockstep tick share one stacked backward.
+        self._population_learner = PopulationLearner()
         self._closed = False
         self._worker_failure: BaseException | None = None
         self._environment_decisions = 0
@@ -663,6 +774,20 @@ class PopulationTrainer:
         self._tick_throughput = 0.0
         self._safety_stats = SensorClearanceStats()
         self._last_safety_decision: SensorClearanceDecision | None = None
+        # Greedy scorecards and their curriculum-lap flag, least recent first.
+        self._fitness_cache: OrderedDict[
+            tuple[object, ...], tuple[EvaluationResult, bool]
+        ] = OrderedDict()
+        self._fitness_cache_hits = 0
+        self._fitness_cache_misses = 0
+        # Next racing rung of the generation under evaluation.
+        self._racing_rung = 0
+        # Telemetry rows of finished members, reused until the member changes.
+        self._finished_member_rows: dict[
+            int, tuple[tuple[object, ...], dict[str, Any]]
+        ] = {}
+        # Derived telemetry sections keyed on the state they were built from.
+        self._telemetry_cache: dict[str, tuple[object, Any]] = {}
         self._rng = np.random.default_rng(self.config.seed)
         self._next_member_id = 0
         self.generation = 0
@@ -696,16 +821,28 @@ class PopulationTrainer:
         first_env.max_steps = self.evaluation_step_budget
 
         member_envs = [first_env]
+        template_env: DrivingEnv | None = None
         for _ in range(1, self.config.population_size):
             if env_factory is not None:
                 member_env = env_factory(initial_seed)
                 if not isinstance(member_env, DrivingEnv):
                     raise TypeError("env_factory must return DrivingEnv instances")
+            elif template_env is None:
+                member_env = template_env = self._clone_environment(
+                    first_env, seed=initial_seed
+                )
             else:
-                member_env = self._clone_environment(first_env, seed=initial_seed)
+                # Every clone starts from the same freshly seeded state, so
+                # later members fork the first clone instead of re-running a
+                # constructor, reset and sensor fan each.
+                member_env = template_env.fork()
             member_envs.append(member_env)
         if any(type(member_env) is not type(first_env) for member_env in member_envs):
             raise TypeError("env_factory must return one consistent DrivingEnv type")
+        if worker_backend == "process" and type(first_env) is not DrivingEnv:
+            raise TypeError(
+                "worker_backend='process' requires exact DrivingEnv members"
+            )
         if len({id(member_env) for member_env in member_envs}) != len(member_envs):
             raise ValueError(
                 "each population member requires an independent environment"
@@ -713,6 +850,9 @@ class PopulationTrainer:
         for member_env in member_envs:
             member_env.set_lap_target(self._lap_target)
             member_env.max_steps = self.evaluation_step_budget
+            # Members only read a handful of per-tick fields; reports that
+            # need the full diagnostics expand the lazy mapping on demand.
+            member_env.info_level = "training"
         self._member_envs = member_envs
         self.env = first_env
 
@@ -777,6 +917,16 @@ class PopulationTrainer:
 
         return self.config.evaluation_steps * self._lap_target
 
+    @property
+    def racing_rung_steps(self) -> tuple[int, ...]:
+        """Physics steps at which each racing rung compares the members."""
+
+        budget = self.evaluation_step_budget
+        return tuple(
+            max(1, math.ceil(fraction * budget))
+            for fraction in self.config.racing_rungs
+        )
+
     @property
     def current_member_index(self) -> int | None:
         return (
@@ -891,14 +1041,18 @@ class PopulationTrainer:
 
     @property
     def ranked_members(self) -> tuple[PopulationMember, ...]:
-        """Evaluated members first, ordered deterministically on fitness ties."""
+        """Evaluated members first, ordered deterministically on fitness ties.
+
+        Members cut by a racing rung follow every member that outlasted it.
+        """
 
         return tuple(
             sorted(
                 self.population,
                 key=lambda member: (
                     member.result is None,
-                    -member.fitness,
+                    -member.selection_rank[0],
+                    -member.selection_rank[1],
                     member.member_id,
                 ),
             )
@@ -998,6 +1152,11 @@ class PopulationTrainer:
                 max_ticks - len(steps),
                 self.MAX_WORKER_CHUNK_TICKS,
             )
+            # A chunk ends on the tick that reaches the next racing rung, so
+            # members cut there never simulate past it.
+            rung_ticks = self._ticks_to_racing_rung(active_indices)
+            if rung_ticks is not None:
+                requested_ticks = min(requested_ticks, rung_ticks)
             batches = self._advance_active_member_batches(
                 active_indices,
                 requested_ticks,
@@ -1024,6 +1183,13 @@ class PopulationTrainer:
             if generation_ended and (stop_after_generation or not self.auto_evolve):
                 break
 
+        if self._process_pool is not None:
+            # Callers read member environments between batches, so running
+            # members' worker state is written back once per call.
+            try:
+                self._process_pool.sync_environments()
+            except BaseException as error:
+                self._fail_after_worker_error(error)
         elapsed = max(perf_counter() - started_at, 1e-12)
         decisions = self._environment_decisions - starting_decisions
         self._last_batch_ticks = len(steps)
@@ -1074,10 +1240,14 @@ class PopulationTrainer:
             runtime.safety.observe(advance.safety_decision)
             self._safety_stats.observe(advance.safety_decision)
             runtime.observation = advance.next_state
-            runtime.steps += 1
+            # Budgets count physics ticks; one decision may span several.
+            runtime.steps += int(advance.env_result.info.get("decision_ticks", 1))
             runtime.total_reward += float(advance.env_result.reward)
             runtime.last_reward = float(advance.env_result.reward)
-            runtime.last_info = dict(advance.env_result.info)
+            info = advance.env_result.info
+            runtime.last_info = (
+                info.training_dict() if isinstance(info, StepInfo) else dict(info)
+            )
             self._optimization_updates += int(advance.gradient_updated)
             self._gradient_clip_events += int(advance.gradient_clipped)
             self._wall_contact_decisions += int(
@@ -1091,6 +1261,7 @@ class PopulationTrainer:
                 runtime.losses.append(advance.loss)
             if bool(advance.env_result.info.get("curriculum_lap_completed", False)):
                 self._pending_curriculum_unlock = True
+                runtime.curriculum_lap_completed = True
             if (
                 bool(advance.env_result.info.get("lap_target_completed", False))
                 and self._lap_target < self.config.max_lap_target
@@ -1101,6 +1272,10 @@ class PopulationTrainer:
                 completed_results.append(result)
                 if advance.index == member_index:
                     focal_result = result
+        for result in self._run_due_racing_rungs(advances_by_index):
+            completed_results.append(result)
+            if result.member_id == self.population[member_index].member_id:
+                focal_result = result
 
         generation_record: GenerationRecord | None = None
         generation_completed = self.generation_complete
@@ -1168,7 +1343,14 @@ class PopulationTrainer:
         sample_size = min(self.config.tournament_size, len(candidates))
         indices = self._rng.choice(len(candidates), size=sample_size, replace=False)
         sampled = [candidates[int(index)] for index in np.atleast_1d(indices)]
-        return min(sampled, key=lambda item: (-item.fitness, item.member_id))
+        return min(
+            sampled,
+            key=lambda item: (
+                -item.selection_rank[0],
+                -item.selection_rank[1],
+                item.member_id,
+            ),
+        )
 
     def crossover_agents(
         self,
@@ -1184,35 +1366,26 @@ class PopulationTrainer:
         child = first.clone(seed=child_seed, include_optimizer=False)
         if self._rng.random() >= self.config.crossover_rate:
             return child
+        # Genomes are flat in parameter order, so one draw over the whole
+        # vector consumes the RNG exactly like the former per-layer draws.
+        first_values = first.online_network.genome.numpy()
+        second_values = second.online_network.genome.numpy()
+        if self.config.crossover == "uniform":
+            mask = self._rng.random(first_values.shape) < 0.5
+            values = np.where(mask, first_values, second_values)
+        else:
+            distance = np.abs(first_values - second_values)
+            low = (
+                np.minimum(first_values, second_values)
+                - self.config.blend_alpha * distance
+            )
+            high = (
+                np.maximum(first_values, second_values)
+                + self.config.blend_alpha * distance
+            )
+            values = self._rng.uniform(low, high)
         with torch.no_grad():
-            for child_parameter, first_parameter, second_parameter in zip(
-                child.online_network.parameters(),
-                first.online_network.parameters(),
-                second.online_network.parameters(),
-            ):
-                first_values = first_parameter.detach().cpu().numpy()
-                second_values = second_parameter.detach().cpu().numpy()
-                if self.config.crossover == "uniform":
-                    mask = self._rng.random(first_values.shape) < 0.5
-                    values = np.where(mask, first_values, second_values)
-                else:
-                    distance = np.abs(first_values - second_values)
-                    low = (
-                        np.minimum(first_values, second_values)
-                        - self.config.blend_alpha * distance
-                    )
-                    high = (
-                        np.maximum(first_values, second_values)
-                        + self.config.blend_alpha * distance
-                    )
-                    values = self._rng.uniform(low, high)
-                child_parameter.copy_(
-                    torch.as_tensor(
-                        values,
-                        dtype=child_parameter.dtype,
-                        device=child_parameter.device,
-                    )
-                )
+            child.online_network.genome.copy_(torch.from_numpy(values))
         child.sync_target()
         return child
 
@@ -1225,24 +1398,23 @@ class PopulationTrainer:
         changed = 0
         if self.config.mutation_rate == 0.0 or self.config.mutation_std == 0.0:
             return changed
-        with torch.no_grad():
-            for parameter in agent.online_network.parameters():
-                shape = tuple(parameter.shape)
-                mask = self._rng.random(shape) < self.config.mutation_rate
-                count = int(np.count_nonzero(mask))
-                if count == 0:
-                    continue
-                noise = self._rng.normal(0.0, self.config.mutation_std, size=shape)
-                delta = np.where(mask, noise, 0.0)
-                parameter.add_(
-                    torch.as_tensor(
-                        delta,
-                        dtype=parameter.dtype,
-                        device=parameter.device,
-                    )
-                )
-                changed += count
+        network = agent.online_network
+        delta = np.zeros(network.genome.shape, dtype=np.float64)
+        # Masks and noise are still drawn tensor by tensor so seeded runs keep
+        # their RNG stream; the genome itself is updated in one write.
+        for start, stop in network.genome_spans:
+            mask = self._rng.random(stop - start) < self.config.mutation_rate
+            count = int(np.count_nonzero(mask))
+            if count == 0:
+                continue
+            noise = self._rng.normal(
+                0.0, self.config.mutation_std, size=stop - start
+            )
+            delta[start:stop] = np.where(mask, noise, 0.0)
+            changed += count
         if changed:
+            with torch.no_grad():
+                network.genome.add_(torch.from_numpy(delta.astype(np.float32)))
             agent.sync_target()
         return changed
 
@@ -1386,6 +1558,14 @@ class PopulationTrainer:
             best_lap_time=generation_metrics["best_lap_time"],
             mean_lap_time=generation_metrics["mean_lap_time"],
             lap_finishers=int(generation_metrics["lap_finishers"]),
+            cached_evaluations=sum(
+                member.result is not None and member.result.cached
+                for member in ranked
+            ),
+            early_stopped=sum(
+                member.result is not None and member.result.early_stopped
+                for member in ranked
+            ),
         )
         self.history.append(record)
 
@@ -1452,8 +1632,108 @@ class PopulationTrainer:
             agent = self.champion_agent()
         return agent.network_snapshot(self._observation)
 
-    def telemetry(self) -> dict[str, Any]:
-        """Return bounded, serialization-friendly live population metrics."""
+    def _cached_telemetry(
+        self, name: str, key: object, build: Callable[[], Any]
+    ) -> Any:
+        """Return the cached telemetry section *name* unless *key* changed."""
+
+        cached = self._telemetry_cache.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, build())
+            self._telemetry_cache[name] = cached
+        return cached[1]
+
+    def _member_telemetry_row(
+        self,
+        index: int,
+        item: PopulationMember,
+        runtime: _EvaluationRuntime,
+        *,
+        active: bool,
+    ) -> dict[str, Any]:
+        key = (
+            item,
+            item.result,
+            runtime,
+            self.generation,
+            self._lap_target,
+            self._generation_curriculum_ready,
+        )
+        cached = self._finished_member_rows.get(index)
+        if (
+            cached is not None
+            and all(left is right for left, right in zip(cached[0][:3], key[:3]))
+            and cached[0][3:] == key[3:]
+        ):
+            return cached[1]
+        summary = item.summary()
+        safety = runtime.safety.snapshot()
+        safety_penalty = (
+            int(safety["interventions"])
+            * self.SAFETY_INTERVENTION_FITNESS_PENALTY
+        )
+        selection_fitness = (
+            float(item.result.fitness)
+            if item.result is not None
+            else float(runtime.total_reward) - safety_penalty
+        )
+        summary.update(
+            {
+                "index": index,
+                "status": "active" if active else "evaluated",
+                "evaluation_step": runtime.steps,
+                "evaluation_return": runtime.total_reward,
+                "raw_return": runtime.total_reward,
+                "selection_fitness": selection_fitness,
+                "safety_intervention_penalty": safety_penalty,
+                "last_reward": runtime.last_reward,
+                "action": safety["executed_action"],
+                "raw_action": safety["proposed_action"],
+                "executed_action": safety["executed_action"],
+                "safety_intervened": safety["intervened"],
+                "safety": safety,
+                "observation": [float(value) for value in runtime.observation],
+                "curriculum_qualified": runtime.env.curriculum_ready,
+                "curriculum_generation_ready": (self._generation_curriculum_ready),
+                "laps": runtime.last_info.get("laps", runtime.env.laps),
+                "lap_target": self._lap_target,
+                "episode_lap_progress": runtime.last_info.get(
+                    "episode_lap_progress", 0.0
+                ),
+                "episode_target_progress": runtime.last_info.get(
+                    "episode_target_progress", 0.0
+                ),
+                "max_episode_target_progress": runtime.last_info.get(
+                    "max_episode_target_progress", 0.0
+                ),
+                "lap_target_completed": runtime.last_info.get(
+                    "lap_target_completed", False
+                ),
+                "best_lap_time": runtime.last_info.get(
+                    "episode_best_lap_time"
+                ),
+                "mean_lap_time": runtime.last_info.get(
+                    "episode_mean_lap_time"
+                ),
+                "lap_time_bonus_total": runtime.last_info.get(
+                    "episode_lap_time_bonus_total", 0.0
+                ),
+                "pose_reset": runtime.pose_reset,
+            }
+        )
+        if item.result is not None and not active:
+            # A finished member's scorecard and runtime stay fixed until the
+            # next generation starts, so its row is built only once.
+            self._finished_member_rows[index] = (key, summary)
+        return summary
+
+    def telemetry(self, *, include_population: bool = True) -> dict[str, Any]:
+        """Return bounded, serialization-friendly live population metrics.
+
+        Rows of finished members are built once and reused until the next
+        generation, so treat the returned rows as read-only.  Dashboards that
+        do not show per-member rows pass ``include_population=False``.
+        """
 
         evaluated = [member for member in self.population if member.evaluated]
         fitnesses = np.asarray([member.fitness for member in evaluated], dtype=float)
@@ -1484,64 +1764,14 @@ class PopulationTrainer:
         for index, (item, runtime) in enumerate(
             zip(self.population, self._member_runtimes)
         ):
-            summary = item.summary()
-            safety = runtime.safety.snapshot()
-            safety_penalty = (
-                int(safety["interventions"])
-                * self.SAFETY_INTERVENTION_FITNESS_PENALTY
-            )
-            selection_fitness = (
-                float(item.result.fitness)
-                if item.result is not None
-                else float(runtime.total_reward) - safety_penalty
-            )
             safety_decisions += runtime.safety.decisions
             safety_interventions += runtime.safety.interventions
-            summary.update(
-                {
-                    "index": index,
-                    "status": "active" if index in active_set else "evaluated",
-                    "evaluation_step": runtime.steps,
-                    "evaluation_return": runtime.total_reward,
-                    "raw_return": runtime.total_reward,
-                    "selection_fitness": selection_fitness,
-                    "safety_intervention_penalty": safety_penalty,
-                    "last_reward": runtime.last_reward,
-                    "action": safety["executed_action"],
-                    "raw_action": safety["proposed_action"],
-                    "executed_action": safety["executed_action"],
-                    "safety_intervened": safety["intervened"],
-                    "safety": safety,
-                    "observation": [float(value) for value in runtime.observation],
-                    "curriculum_qualified": runtime.env.curriculum_ready,
-                    "curriculum_generation_ready": (self._generation_curriculum_ready),
-                    "laps": runtime.last_info.get("laps", runtime.env.laps),
-                    "lap_target": self._lap_target,
-                    "episode_lap_progress": runtime.last_info.get(
-                        "episode_lap_progress", 0.0
-                    ),
-                    "episode_target_progress": runtime.last_info.get(
-                        "episode_target_progress", 0.0
-                    ),
-                    "max_episode_target_progress": runtime.last_info.get(
-                        "max_episode_target_progress", 0.0
-                    ),
-                    "lap_target_completed": runtime.last_info.get(
-                        "lap_target_completed", False
-                    ),
-                    "best_lap_time": runtime.last_info.get(
-                        "episode_best_lap_time"
-                    ),
-                    "mean_lap_time": runtime.last_info.get(
-                        "episode_mean_lap_time"
-                    ),
-                    "lap_time_bonus_total": runtime.last_info.get(
-                        "episode_lap_time_bonus_total", 0.0
-                    ),
-                    "pose_reset": runtime.pose_reset,
-                }
-            )
-            population.append(summary)
+            if include_population:
+                population.append(
+                    self._member_telemetry_row(
+                        index, item, runtime, active=index in active_set
+                    )
+                )
         aggregate_safety = self._safety_stats.snapshot()
         current_index = self.current_member_index
         current_raw_return = float(self._evaluation_return)
@@ -1674,6 +1904,12 @@ class PopulationTrainer:
             "population_size": len(self.population),
             "parallel_workers": self.parallel_workers,
             "requested_parallel_workers": self.requested_parallel_workers,
+            "worker_backend": self.worker_backend,
+            "batched_updates": {
+                "enabled": self.batched_updates,
+                "batched_steps": self._population_learner.batched_steps,
+                "member_updates": self._population_learner.member_updates,
+            },
             "worker_failed": self._worker_failure is not None,
             "worker_failure_type": (
                 None
@@ -1723,7 +1959,14 @@ class PopulationTrainer:
                 "blend_alpha": self.config.blend_alpha,
                 "mutation_rate": self.config.mutation_rate,
                 "mutation_std": self.config.mutation_std,
-                "sampled_genome_diversity": self._genome_diversity(self.population),
+                "sampled_genome_diversity": self._cached_telemetry(
+                    "genome_diversity",
+                    tuple(
+                        (item.agent, item.agent.online_network.parameter_version)
+                        for item in self.population
+                    ),
+                    lambda: self._genome_diversity(self.population),
+                ),
             },
             "champion": (
                 None
@@ -1733,7 +1976,15 @@ class PopulationTrainer:
             "best_champion": (
                 None if self._best_champion is None else self._best_champion.to_dict()
             ),
-            "history": [record.to_dict() for record in self.history],
+            "history": self._cached_telemetry(
+                "history",
+                (
+                    self.history,
+                    len(self.history),
+                    self.history[-1] if self.history else None,
+                ),
+                lambda: [record.to_dict() for record in self.history],
+            ),
             "learning": learning,
             "memory": {
                 "transitions": replay_size,
@@ -1749,6 +2000,26 @@ class PopulationTrainer:
                     self._pending_lap_target_increase
                 ),
             },
+            "fitness_cache": {
+                "capacity": self.config.fitness_cache_size,
+                "entries": len(self._fitness_cache),
+                "hits": self._fitness_cache_hits,
+                "misses": self._fitness_cache_misses,
+                "generation_hits": sum(
+                    item.result is not None and item.result.cached
+                    for item in self.population
+                ),
+            },
+            "racing": {
+                "rungs": list(self.config.racing_rungs),
+                "rung_steps": list(self.racing_rung_steps),
+                "keep": self.config.racing_keep,
+                "next_rung": self._racing_rung,
+                "early_stopped": sum(
+                    item.result is not None and item.result.early_stopped
+                    for item in self.population
+                ),
+            },
             "environment": environment_snapshot,
             "health": health,
         }
@@ -2105,19 +2376,7 @@ class PopulationTrainer:
 
     def save(self, path: str | Path) -> Path:
         self._require_usable()
-        output = Path(path).expanduser().resolve()
-        output.parent.mkdir(parents=True, exist_ok=True)
-        descriptor, temporary_name = tempfile.mkstemp(
-            prefix=f".{output.name}.", suffix=".tmp", dir=output.parent
-        )
-        os.close(descriptor)
-        temporary = Path(temporary_name)
-        try:
-            torch.save(self.state_dict(), temporary)
-            os.replace(temporary, output)
-        finally:
-            temporary.unlink(missing_ok=True)
-        return output
+        return write_checkpoint(self.state_dict(), path)
 
     def load(self, path: str | Path) -> None:
         self._require_usable()
@@ -2131,7 +2390,7 @@ class PopulationTrainer:
         self.load_state_dict(state)
 
     def close(self) -> None:
-        """Release persistent evaluation threads; safe to call repeatedly."""
+        """Release persistent evaluation workers; safe to call repeatedly."""
 
         if self._closed:
             return
@@ -2140,6 +2399,7 @@ class PopulationTrainer:
         self._executor = None
         if executor is not None:
             executor.shutdown(wait=True, cancel_futures=False)
+        self._close_process_pool()
 
     def __enter__(self) -> "PopulationTrainer":
         self._require_usable()
@@ -2152,6 +2412,9 @@ class PopulationTrainer:
         executor = getattr(self, "_executor", None)
         if executor is not None:
             executor.shutdown(wait=False, cancel_futures=True)
+        pool = getattr(self, "_process_pool", None)
+        if pool is not None:
+            pool.close()
 
     def _new_random_member(self) -> PopulationMember:
         member_id = self._take_member_id()
@@ -2213,6 +2476,7 @@ class PopulationTrainer:
             max_steps=source.max_steps,
             random_start_curriculum=source.random_start_curriculum,
             lap_target=source.lap_target,
+            decision_interval=source.decision_interval,
         )
         clone.load_curriculum_state(source.curriculum_state())
         return clone
@@ -2241,6 +2505,8 @@ class PopulationTrainer:
                 }
             )
             observation = member_env.reset(seed=scenario_seed)
+            # A restarted member must not fold steps across the old episode.
+            self.population[index].agent.discard_pending_steps()
             if len(observation) != self.dqn_config.observation_size:
                 raise ValueError(
                     "DrivingEnv observation size does not match DQNConfig: "
@@ -2249,27 +2515,9 @@ class PopulationTrainer:
             restored_result = (
                 self.population[index].result if keep_evaluated else None
             )
-            restored_info: dict[str, object] = {}
-            if restored_result is not None:
-                restored_info = {
-                    "laps": restored_result.laps,
-                    "lap_target": restored_result.lap_target,
-                    "lap_target_completed": (
-                        restored_result.lap_target_completed
-                    ),
-                    "episode_target_progress": restored_result.progress,
-                    "max_episode_target_progress": (
-                        restored_result.max_progress
-                        if restored_result.max_progress is not None
-                        else restored_result.progress
-                    ),
-                    "episode_best_lap_time": restored_result.best_lap_time,
-                    "episode_mean_lap_time": restored_result.mean_lap_time,
-                    "episode_lap_time_bonus_total": (
-                        restored_result.lap_time_bonus_total
-                    ),
-                    "end_reason": restored_result.end_reason,
-                }
+            restored_info = (
+                {} if restored_result is None else self._result_info(restored_result)
+            )
             runtimes.append(
                 _EvaluationRuntime(
                     env=member_env,
@@ -2282,15 +2530,115 @@ class PopulationTrainer:
                     steps=(0 if restored_result is None else restored_result.steps),
                     last_info=restored_info,
                     pose_reset=restored_result is not None,
+                    cache_key=(
+                        None
+                        if restored_result is not None
+                        else self._evaluation_cache_key(
+                            self.population[index], member_env
+                        )
+                    ),
                 )
             )
         self._member_runtimes = runtimes
+        self._racing_rung = 0
+        self._reuse_cached_evaluations()
+        if self._process_pool is not None:
+            self._process_pool.invalidate()
         active = self.active_member_indices
         focal_index = active[0] if active else 0
         self._sync_focal_aliases(focal_index)
         if not active:
             self._current_index = len(self.population)
 
+    @staticmethod
+    def _result_info(result: EvaluationResult) -> dict[str, object]:
+        """Runtime info fields of a member scored without stepping its car."""
+
+        return {
+            "laps": result.laps,
+            "lap_target": result.lap_target,
+            "lap_target_completed": result.lap_target_completed,
+            "episode_target_progress": result.progress,
+            "max_episode_target_progress": (
+                result.max_progress
+                if result.max_progress is not None
+                else result.progress
+            ),
+            "episode_best_lap_time": result.best_lap_time,
+            "episode_mean_lap_time": result.mean_lap_time,
+            "episode_lap_time_bonus_total": result.lap_time_bonus_total,
+            "end_reason": result.end_reason,
+        }
+
+    def _greedy_evaluation(self, member: PopulationMember) -> bool:
+        """Whether a member is scored without exploration or optimizer writes."""
+
+        return self.config.algorithm == "genetic" or member.protected_elite
+
+    def _evaluation_cache_key(
+        self, member: PopulationMember, env: DrivingEnv
+    ) -> tuple[object, ...] | None:
+        """Identify a greedy rollout by its genome and freshly spawned scenario.
+
+        The scenario seed only drives the spawn draw, so the resulting pose is
+        keyed instead: generations that draw the same start replay the same
+        rollout even though their seeds differ.
+        """
+
+        if not self.config.fitness_cache_size or not self._greedy_evaluation(member):
+            return None
+        genome = member.agent.online_network.genome.detach().cpu().numpy()
+        pose = env.vehicle.state
+        return (
+            hashlib.blake2b(genome.tobytes(), digest_size=16).digest(),
+            member.agent.online_network.architecture,
+            env.spawn_mode,
+            pose.position.x,
+            pose.position.y,
+            pose.heading,
+            env.lap_target,
+            env.curriculum_unlocked,
+            env.decision_interval,
+            self.evaluation_step_budget,
+        )
+
+    def _reuse_cached_evaluations(self) -> None:
+        """Score unevaluated greedy members from identical earlier rollouts.
+
+        The last unevaluated member is always simulated, so a generation still
+        completes on a real tick that can report and evolve it.
+        """
+
+        for member, runtime in zip(self.population, self._member_runtimes):
+            key = runtime.cache_key
+            if key is None or member.evaluated:
+                continue
+            entry = self._fitness_cache.get(key)
+            if entry is None or len(self.active_member_indices) == 1:
+                self._fitness_cache_misses += 1
+                continue
+            self._fitness_cache.move_to_end(key)
+            self._fitness_cache_hits += 1
+            result, curriculum_lap_completed = entry
+            member.result = replace(
+                result,
+                generation=self.generation,
+                member_id=member.member_id,
+                cached=True,
+            )
+            runtime.total_reward = result.total_reward
+            runtime.steps = result.steps
+            runtime.last_info = self._result_info(result)
+            runtime.pose_reset = True
+            if curriculum_lap_completed:
+                self._pending_curriculum_unlock = True
+            if (
+                result.lap_target_completed
+                and self._lap_target < self.config.max_lap_target
+            ):
+                self._pending_lap_target_increase = True
+            self._consider_champion(member)
+
     def _sync_focal_aliases(self, index: int) -> None:
         """Keep legacy scalar accessors aligned with a deterministic member."""
 
@@ -2311,14 +2659,21 @@ class PopulationTrainer:
     ) -> tuple[tuple[_MemberAdvance, ...], ...]:
         """Run isolated member chunks concurrently and collect in stable order."""
 
-        if self.parallel_workers == 1 or len(active_indices) == 1:
-            batches: list[tuple[_MemberAdvance, ...]] = []
+        if self.worker_backend == "process":
+            try:
+                return self._advance_members_in_processes(active_indices, max_ticks)
+            except BaseException as error:
+                self._fail_after_worker_error(error)
+        if len(active_indices) == 1:
+            try:
+                return (self._advance_member_many(active_indices[0], max_ticks),)
+            except BaseException as error:
+                self._fail_after_worker_error(error)
+        if self.parallel_workers == 1 or self.batched_updates:
             try:
-                for index in active_indices:
-                    batches.append(self._advance_member_many(index, max_ticks))
+                return self._advance_members_lockstep(active_indices, max_ticks)
             except BaseException as error:
                 self._fail_after_worker_error(error)
-            return tuple(batches)
         if self._executor is None:
             self._executor = ThreadPoolExecutor(
                 max_workers=self.parallel_workers,
@@ -2363,6 +2718,7 @@ class PopulationTrainer:
         self._executor = None
         if executor is not None:
             executor.shutdown(wait=True, cancel_futures=False)
+        self._close_process_pool()
         if not isinstance(error, Exception):
             # Preserve process-level interrupts such as Ctrl-C after making the
             # partially executed tick impossible to resume.
@@ -2371,6 +2727,12 @@ class PopulationTrainer:
             "population member evaluation failed; trainer is closed"
         ) from error
 
+    def _close_process_pool(self) -> None:
+        pool = self._process_pool
+        self._process_pool = None
+        if pool is not None:
+            pool.close()
+
     def _require_usable(self) -> None:
         if self._worker_failure is not None:
             raise RuntimeError(
@@ -2386,72 +2748,339 @@ class PopulationTrainer:
     ) -> tuple[_MemberAdvance, ...]:
         """Advance one member chunk without touching another member context."""
 
-        member = self.population[index]
         runtime = self._member_runtimes[index]
         state = runtime.observation.copy()
         completed_steps = runtime.steps
+        advances: list[_MemberAdvance] = []
+        for _ in range(max_ticks):
+            advance, completed_steps = self._advance_member_tick(
+                index, state, completed_steps
+            )
+            advances.append(advance)
+            state = advance.next_state
+            if advance.done:
+                break
+        return tuple(advances)
+
+    def _advance_members_lockstep(
+        self,
+        active_indices: tuple[int, ...],
+        max_ticks: int,
+    ) -> tuple[tuple[_MemberAdvance, ...], ...]:
+        """Advance serial members tick by tick behind one batched forward pass.
+
+        Members never share mutable state, so interleaving their ticks yields
+        the same per-member transitions as advancing each chunk in turn. Every
+        tick evaluates all still-running policies in a single call instead of
+        one small forward per member, and filters the chosen actions with
+        :meth:`SensorClearancePolicy.decide_many`.  With
+        :attr:`batched_updates`, members only store their transitions and the
+        replay updates due on a tick run together afterwards, still before
+        any member's next decision.
+        """
+
+        agents = [member.agent for member in self.population]
+        states = {
+            index: self._member_runtimes[index].observation.copy()
+            for index in active_indices
+        }
+        completed_steps = {
+            index: self._member_runtimes[index].steps for index in active_indices
+        }
+        advances: dict[int, list[_MemberAdvance]] = {
+            index: [] for index in active_indices
+        }
+        running = list(active_indices)
+        for _ in range(max_ticks):
+            if not running:
+                break
+            q_values = self._inference.q_values(
+                agents,
+                [states[index] for index in running],
+                rows=running,
+            )
+            proposed_actions = [
+                agents[index].select_action_from_values(
+                    q_values[row].copy(),
+                    explore=not self._greedy_evaluation(self.population[index]),
+                )
+                for row, index in enumerate(running)
+            ]
+            safety_decisions = self.clearance_policy.decide_many(
+                [states[index] for index in running], proposed_actions
+            )
+            still_running = []
+            for index, safety_decision in zip(running, safety_decisions):
+                advance, completed_steps[index] = self._advance_member_tick(
+                    index,
+                    states[index],
+                    completed_steps[index],
+                    safety_decision=safety_decision,
+                    defer_training=self.batched_updates,
+                )
+                advances[index].append(advance)
+                states[index] = advance.next_state
+                if not advance.done:
+                    still_running.append(index)
+            if self.batched_updates:
+                self._train_due_members(running, advances)
+            running = still_running
+        return tuple(tuple(advances[index]) for index in active_indices)
+
+    def _train_due_members(
+        self,
+        indices: Sequence[int],
+        advances: Mapping[int, list[_MemberAdvance]],
+    ) -> None:
+        """Run the deferred updates of one tick and record them on its advances."""
+
+        due = [
+            index
+            for index in indices
+            if not self._greedy_evaluation(self.population[index])
+            and self.population[index].agent.training_due
+        ]
+        if not due:
+            return
+        agents = [self.population[index].agent for index in due]
+        before = [
+            (agent.gradient_steps, agent.gradient_clip_events) for agent in agents
+        ]
+        losses = self._population_learner.train_steps(agents)
+        for index, agent, (steps, clips), loss in zip(due, agents, before, losses):
+            advances[index][-1] = replace(
+                advances[index][-1],
+                loss=None if loss is None or not math.isfinite(loss) else loss,
+                gradient_updated=agent.gradient_steps > steps,
+                gradient_clipped=agent.gradient_clip_events > clips,
+            )
+
+    def _advance_members_in_processes(
+        self,
+        active_indices: tuple[int, ...],
+        max_ticks: int,
+    ) -> tuple[tuple[_MemberAdvance, ...], ...]:
+        """Advance members on worker processes and rebuild their transitions.
+
+        Workers only act greedily, which is exactly what ``genetic`` members
+        do.  Replaying each returned Q-value row through
+        :meth:`DrivingDQNAgent.select_action_from_values` keeps the agents'
+        action bookkeeping identical to in-process evaluation.
+        """
+
+        if self._process_pool is None:
+            self._process_pool = PopulationProcessPool(
+                self.parallel_workers,
+                population_size=len(self.population),
+                network=self.population[0].agent.online_network,
+                circuit=self._member_envs[0].circuit,
+                clearance_policy=self.clearance_policy,
+            )
+        states = {
+            index: self._member_runtimes[index].observation.copy()
+            for index in active_indices
+        }
+        chunks = self._process_pool.advance(
+            [
+                (
+                    index,
+                    self.population[index].agent.online_network,
+                    self._member_runtimes[index].env,
+                    states[index],
+                    self._member_runtimes[index].steps,
+                )
+                for index in active_indices
+            ],
+            max_ticks=max_ticks,
+            step_budget=self.evaluation_step_budget,
+        )
+        batches = []
+        for index, chunk in zip(active_indices, chunks):
+            agent = self.population[index].agent
+            state = states[index]
+            advances = []
+            for tick in chunk:
+                agent.select_action_from_values(tick.q_values, explore=False)
+                next_state = np.asarray(tick.env_result.observation, dtype=np.float32)
+                advances.append(
+                    _MemberAdvance(
+                        index=index,
+                        state=state,
+                        safety_decision=tick.safety_decision,
+                        env_result=tick.env_result,
+                        next_state=next_state,
+                        budget_reached=tick.budget_reached,
+                        done=tick.done,
+                        loss=None,
+                        gradient_updated=False,
+                        gradient_clipped=False,
+                    )
+                )
+                state = next_state
+            batches.append(tuple(advances))
+        return tuple(batches)
+
+    def _advance_member_tick(
+        self,
+        index: int,
+        state: np.ndarray,
+        completed_steps: int,
+        *,
+        safety_decision: SensorClearanceDecision | None = None,
+        defer_training: bool = False,
+    ) -> tuple[_MemberAdvance, int]:
+        """Run one member decision and return it with the updated step count.
+
+        A lockstep caller that already chose and filtered the member's action
+        passes it as ``safety_decision``.  ``defer_training`` stores a
+        learning member's transition without running its replay update;
+        :meth:`_train_due_members` runs it later.
+        """
+
+        member = self.population[index]
+        runtime = self._member_runtimes[index]
         # A hybrid child may learn and explore during its lifetime. Exact
         # elites are evaluated greedily without optimizer writes so one noisy
         # rollout cannot destroy the best inherited genome before selection.
-        dqn_training = (
-            self.config.algorithm == "genetic_dqn"
-            and not member.protected_elite
-        )
+        dqn_training = not self._greedy_evaluation(member)
         explore = dqn_training
-        advances: list[_MemberAdvance] = []
-        for _ in range(max_ticks):
-            gradient_steps_before = member.agent.gradient_steps
-            clip_events_before = member.agent.gradient_clip_events
+        gradient_steps_before = member.agent.gradient_steps
+        clip_events_before = member.agent.gradient_clip_events
+        if safety_decision is None:
             proposed_action = member.agent.select_action(state, explore=explore)
             safety_decision = self.clearance_policy.decide(
                 state,
                 proposed_action,
             )
-            executed_action = safety_decision.executed_action
-            env_result = runtime.env.step(executed_action)
-            next_state = np.asarray(env_result.observation, dtype=np.float32)
-            completed_steps += 1
-            budget_reached = completed_steps >= self.evaluation_step_budget
-            done = bool(env_result.terminated or env_result.truncated or budget_reached)
-            loss: float | None = None
-            if dqn_training:
-                observed_loss = member.agent.observe(
-                    state,
-                    executed_action,
-                    env_result.reward,
-                    next_state,
-                    done,
-                )
-                if observed_loss is not None and math.isfinite(float(observed_loss)):
-                    loss = float(observed_loss)
-            advances.append(
-                _MemberAdvance(
-                    index=index,
-                    state=state,
-                    safety_decision=safety_decision,
-                    env_result=env_result,
-                    next_state=next_state,
-                    budget_reached=budget_reached,
-                    done=done,
-                    loss=loss,
-                    gradient_updated=(
-                        member.agent.gradient_steps > gradient_steps_before
-                    ),
-                    gradient_clipped=(
-                        member.agent.gradient_clip_events > clip_events_before
-                    ),
-                )
+        executed_action = safety_decision.executed_action
+        env_result = runtime.env.step(executed_action)
+        next_state = np.asarray(env_result.observation, dtype=np.float32)
+        completed_steps += int(env_result.info.get("decision_ticks", 1))
+        budget_reached = completed_steps >= self.evaluation_step_budget
+        done = bool(env_result.terminated or env_result.truncated or budget_reached)
+        loss: float | None = None
+        if dqn_training:
+            observed_loss = member.agent.observe(
+                state,
+                executed_action,
+                env_result.reward,
+                next_state,
+                done,
+                train=not defer_training,
             )
-            state = next_state
-            if done:
+            if observed_loss is not None and math.isfinite(float(observed_loss)):
+                loss = float(observed_loss)
+        advance = _MemberAdvance(
+            index=index,
+            state=state,
+            safety_decision=safety_decision,
+            env_result=env_result,
+            next_state=next_state,
+            budget_reached=budget_reached,
+            done=done,
+            loss=loss,
+            gradient_updated=member.agent.gradient_steps > gradient_steps_before,
+            gradient_clipped=(
+                member.agent.gradient_clip_events > clip_events_before
+            ),
+        )
+        return advance, completed_steps
+
+    def _ticks_to_racing_rung(self, active_indices: tuple[int, ...]) -> int | None:
+        thresholds = self.racing_rung_steps
+        if self._racing_rung >= len(thresholds):
+            return None
+        # Running members advance in lockstep from one shared start.
+        steps = max(self._member_runtimes[index].steps for index in active_indices)
+        interval = self._member_runtimes[active_indices[0]].env.decision_interval
+        return max(1, math.ceil((thresholds[self._racing_rung] - steps) / interval))
+
+    def _run_due_racing_rungs(
+        self, advances_by_index: Mapping[int, _MemberAdvance]
+    ) -> list[EvaluationResult]:
+        """Apply every racing rung the running members reached this tick."""
+
+        thresholds = self.racing_rung_steps
+        stopped: list[EvaluationResult] = []
+        while self._racing_rung < len(thresholds):
+            running = self.active_member_indices
+            if not running or any(
+                index not in advances_by_index
+                or self._member_runtimes[index].steps
+                < thresholds[self._racing_rung]
+                for index in running
+            ):
                 break
-        return tuple(advances)
+            stopped.extend(self._race_rung(self._racing_rung, advances_by_index))
+            self._racing_rung += 1
+        return stopped
+
+    def _race_rung(
+        self, rung: int, advances_by_index: Mapping[int, _MemberAdvance]
+    ) -> list[EvaluationResult]:
+        """Keep the best ``racing_keep`` share of contenders; stop the rest.
+
+        Contenders are members not cut at an earlier rung.  Running members
+        are compared on the fitness earned so far and finished members on
+        their final fitness.  A finished member outside the cut keeps its
+        score but is tagged with the rung, which ranks it below survivors.
+        """
+
+        contenders = [
+            index
+            for index, member in enumerate(self.population)
+            if member.result is None or member.result.racing_rung is None
+        ]
+        keep = max(1, math.ceil(self.config.racing_keep * len(contenders)))
+
+        def score(index: int) -> float:
+            result = self.population[index].result
+            if result is not None:
+                return result.fitness
+            runtime = self._member_runtimes[index]
+            return float(runtime.total_reward) - (
+                runtime.safety.interventions
+                * self.SAFETY_INTERVENTION_FITNESS_PENALTY
+            )
+
+        ranked = sorted(
+            contenders,
+            key=lambda index: (-score(index), self.population[index].member_id),
+        )
+        cut = ranked[keep:]
+        if self._process_pool is not None and any(
+            self.population[index].result is None for index in cut
+        ):
+            # Stopped members are scored from their coordinator environment.
+            try:
+                self._process_pool.sync_environments()
+            except BaseException as error:
+                self._fail_after_worker_error(error)
+        stopped: list[EvaluationResult] = []
+        for index in sorted(cut):
+            member = self.population[index]
+            if member.result is None:
+                stopped.append(
+                    self._finish_member(
+                        index, advances_by_index[index], racing_rung=rung
+                    )
+                )
+            else:
+                member.result = replace(member.result, racing_rung=rung)
+        return stopped
 
     def _finish_member(
         self,
         index: int,
         advance: _MemberAdvance,
+        *,
+        racing_rung: int | None = None,
     ) -> EvaluationResult:
+        """Score a member whose evaluation ended on ``advance``.
+
+        ``racing_rung`` marks a running member cut by that rung instead.
+        """
+
         member = self.population[index]
         runtime = self._member_runtimes[index]
         env_result = advance.env_result
@@ -2459,7 +3088,13 @@ class PopulationTrainer:
         laps = int(info.get("laps", runtime.env.laps))
         lap_target = int(info.get("lap_target", self._lap_target))
         lap_target_completed = bool(info.get("lap_target_completed", False))
-        if lap_target_completed:
+        early_stopped = racing_rung is not None
+        if early_stopped:
+            end_reason = "early_stopped"
+            # The cut episode never reached ``done``; its folded n-step
+            # window would otherwise leak into the next rollout.
+            member.agent.discard_pending_steps()
+        elif lap_target_completed:
             end_reason = "lap_target_completed"
         elif info.get("truncation_reason"):
             end_reason = str(info["truncation_reason"])
@@ -2498,7 +3133,9 @@ class PopulationTrainer:
             ),
             collisions=int(runtime.env.collisions),
             terminated=bool(env_result.terminated),
-            truncated=bool(env_result.truncated or advance.budget_reached),
+            truncated=bool(
+                env_result.truncated or advance.budget_reached or early_stopped
+            ),
             mean_loss=(float(np.mean(runtime.losses)) if runtime.losses else 0.0),
             training_updates=len(runtime.losses),
             end_reason=end_reason,
@@ -2528,13 +3165,25 @@ class PopulationTrainer:
             lap_time_bonus_total=float(
                 info.get("episode_lap_time_bonus_total", 0.0)
             ),
+            racing_rung=racing_rung,
+            early_stopped=early_stopped,
         )
         member.result = result
+        # A cut rollout depends on its rivals, not only on the genome.
+        if runtime.cache_key is not None and not early_stopped:
+            self._fitness_cache[runtime.cache_key] = (
+                result,
+                runtime.curriculum_lap_completed,
+            )
+            self._fitness_cache.move_to_end(runtime.cache_key)
+            while len(self._fitness_cache) > self.config.fitness_cache_size:
+                self._fitness_cache.popitem(last=False)
         self._consider_champion(member)
         return result
 
     def _consider_champion(self, member: PopulationMember) -> None:
-        if member.result is None:
+        # A partial score is not comparable with a finished evaluation.
+        if member.result is None or member.result.early_stopped:
             return
         snapshot = ChampionSnapshot(
             generation=self.generation,
@@ -2602,17 +3251,8 @@ class PopulationTrainer:
             raise ValueError("parent network architectures must match")
 
     def _genome_sample(self, agent: DrivingDQNAgent) -> np.ndarray:
-        remaining = self.GENOME_SAMPLE_LIMIT
-        chunks: list[np.ndarray] = []
-        for parameter in agent.online_network.parameters():
-            values = parameter.detach().cpu().numpy().reshape(-1)
-            take = min(remaining, len(values))
-            if take:
-                chunks.append(values[:take].astype(np.float64, copy=False))
-                remaining -= take
-            if remaining == 0:
-                break
-        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float64)
+        genome = agent.online_network.genome[: self.GENOME_SAMPLE_LIMIT]
+        return genome.numpy().astype(np.float64)
 
     def _genome_diversity(self, members: list[PopulationMember]) -> float:
         if len(members) < 2:
@@ -0,0 +1,119 @@
+"""Batched Q-value inference across many same-shaped population networks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .network import DrivingQNetwork, stacked_layer
+
+if TYPE_CHECKING:
+    from .dqn import DrivingDQNAgent
+
+
+class PopulationInference:
+    """Evaluate every requested member network with one batched forward pass.
+
+    Each member's acting weights occupy one slot of stacked ``(members, in,
+    out)`` arrays, and a forward pass is one stacked ``np.matmul`` per layer.
+    A slot is copied again only when its network object changes or its
+    :attr:`DrivingQNetwork.parameter_version` moves (optimizer steps, weight
+    copies, crossover and mutation).  Each row equals the agent's own
+    :meth:`DrivingDQNAgent.q_values`, which runs the same kernel for a single
+    member.
+    """
+
+    def __init__(self) -> None:
+        self._networks: list[DrivingQNetwork | None] = []
+        self._versions: list[tuple[int, ...] | None] = []
+        self._architecture: tuple[int, ...] | None = None
+        self._weights: tuple[np.ndarray, ...] = ()
+        self._biases: tuple[np.ndarray, ...] = ()
+        self.refreshes = 0
+
+    def q_values(
+        self,
+        agents: Sequence[DrivingDQNAgent],
+        observations: Sequence[Sequence[float] | np.ndarray],
+        *,
+        rows: Iterable[int] | None = None,
+    ) -> np.ndarray:
+        """Return one float32 row of Q-values per evaluated member.
+
+        ``rows`` selects which agents are evaluated, in order, against the
+        matching ``observations``.  Stacked slots stay aligned with ``agents``
+        so members that finish early do not shift their peers' cached weights.
+        """
+
+        selected = tuple(range(len(agents))) if rows is None else tuple(rows)
+        if not selected:
+            raise ValueError("population inference requires at least one member")
+        if len(observations) != len(selected):
+            raise ValueError("observations must match the evaluated members")
+        if any(not 0 <= row < len(agents) for row in selected):
+            raise ValueError("rows must index the supplied agents")
+        self._ensure_layout(agents)
+        batch = np.stack(
+            [
+                agents[row]._observation(observation)
+                for row, observation in zip(selected, observations)
+            ]
+        )
+        for row in selected:
+            self._refresh(row, agents[row].online_network)
+
+        index = None if selected == tuple(range(len(agents))) else list(selected)
+        last_layer = len(self._weights) - 1
+        result = batch
+        for layer, (weights, biases) in enumerate(zip(self._weights, self._biases)):
+            if index is not None:
+                weights = weights[index]
+                biases = biases[index]
+            result = stacked_layer(result, weights, biases)
+            if layer < last_layer:
+                result = np.maximum(result, 0.0)
+        if not np.isfinite(result).all():
+            raise FloatingPointError("driving policy produced non-finite Q-values")
+        return result
+
+    def _ensure_layout(self, agents: Sequence[DrivingDQNAgent]) -> None:
+        architecture = agents[0].online_network.architecture
+        if (
+            len(agents) == len(self._networks)
+            and architecture == self._architecture
+        ):
+            return
+        sizes = tuple(zip(architecture, architecture[1:]))
+        self._architecture = architecture
+        self._networks = [None] * len(agents)
+        self._versions = [None] * len(agents)
+        self._weights = tuple(
+            np.zeros((len(agents), input_size, output_size), dtype=np.float32)
+            for input_size, output_size in sizes
+        )
+        self._biases = tuple(
+            np.zeros((len(agents), output_size), dtype=np.float32)
+            for _, output_size in sizes
+        )
+
+    def _refresh(self, slot: int, network: DrivingQNetwork) -> None:
+        versions = network.parameter_version
+        if self._networks[slot] is network and self._versions[slot] == versions:
+            return
+        if network.architecture != self._architecture:
+            raise ValueError(
+                "population inference requires one shared network architecture"
+            )
+        for (layer_weights, layer_biases), weights, biases in zip(
+            network.acting_parameters(), self._weights, self._biases
+        ):
+            weights[slot] = layer_weights
+            biases[slot] = layer_biases
+        self._networks[slot] = network
+        self._versions[slot] = versions
+        self.refreshes += 1
+
+
+__all__ = ("PopulationInference",)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from copy import deepcopy
 from typing import Any
 
 import numpy as np
@@ -12,6 +13,54 @@ from torch import nn
 from .config import DQNConfig
 
 
+def stacked_layer(
+    inputs: np.ndarray, weights: np.ndarray, biases: np.ndarray
+) -> np.ndarray:
+    """Apply one linear layer per member to a ``(members, features)`` batch.
+
+    ``weights`` and ``biases`` stack ``(members, in, out)`` and ``(members,
+    out)`` float32 parameters. NumPy evaluates a stacked product one member
+    matrix at a time, so a row's Q-values do not depend on how many peers
+    shared its forward pass; single-observation reads use one member.
+    """
+
+    return np.matmul(inputs[:, None, :], weights)[:, 0, :] + biases
+
+
+def acting_forward(
+    parameters: Sequence[tuple[np.ndarray, np.ndarray]], observations: np.ndarray
+) -> np.ndarray:
+    """Q-values of ``(rows, features)`` observations for one acting layer set.
+
+    ``parameters`` is a value of :meth:`DrivingQNetwork.acting_parameters`,
+    which is never modified after it is returned, so a reference published
+    by another thread can be evaluated without holding a lock.
+    """
+
+    values = observations
+    for index, (weights, biases) in enumerate(parameters):
+        values = stacked_layer(values, weights[None], biases)
+        if index < len(parameters) - 1:
+            values = np.maximum(values, 0.0)
+    return values
+
+
+def _evenly_spaced(size: int, limit: int | None) -> np.ndarray:
+    """Indices of at most *limit* neurons spread evenly across *size*."""
+
+    if limit is None or size <= limit:
+        return np.arange(size)
+    if limit == 1:
+        return np.zeros(1, dtype=np.int64)
+    return np.unique(np.round(np.linspace(0, size - 1, limit)).astype(np.int64))
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    result = np.array(array, order="C")
+    result.flags.writeable = False
+    return result
+
+
 class DrivingQNetwork(nn.Module):
     """Fully connected action-value network for the driving observation."""
 
@@ -41,6 +90,77 @@ class DrivingQNetwork(nn.Module):
             nn.Linear(input_size, output_size)
             for input_size, output_size in zip(sizes, sizes[1:])
         )
+        self._bind_genome()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DrivingQNetwork":
+        # Parameter.__deepcopy__ clones each tensor on its own; re-point the
+        # copies at one fresh genome so the clone keeps the flat layout.
+        clone = type(self).__new__(type(self))
+        memo[id(self)] = clone
+        for name, value in self.__dict__.items():
+            object.__setattr__(clone, name, deepcopy(value, memo))
+        clone._bind_genome()
+        return clone
+
+    def _bind_genome(self) -> None:
+        """Move every parameter into one contiguous float32 genome.
+
+        Layer weights and biases become views of consecutive slices in
+        ``parameters()`` order, which is also the order of the flat vector.
+        Writes through either side share Torch's version counter.
+        """
+
+        genome = torch.cat(
+            [parameter.detach().reshape(-1) for parameter in self.parameters()]
+        ).to(torch.float32)
+        spans: list[tuple[int, int]] = []
+        offset = 0
+        for layer in self.layers:
+            for name in ("weight", "bias"):
+                parameter = getattr(layer, name)
+                count = parameter.numel()
+                setattr(
+                    layer,
+                    name,
+                    nn.Parameter(
+                        genome[offset : offset + count].view_as(parameter),
+                        requires_grad=parameter.requires_grad,
+                    ),
+                )
+                spans.append((offset, offset + count))
+                offset += count
+        self._genome = genome
+        self._genome_spans = tuple(spans)
+        # Parameters are only ever written in place, so these stay current.
+        self._parameter_tensors = tuple(self.parameters())
+        self._acting_version: tuple[int, ...] | None = None
+        self._acting_parameters: tuple[tuple[np.ndarray, np.ndarray], ...] = ()
+        # Sampled snapshot weights per neuron limit, tagged with their version.
+        self._snapshot_cache: dict[
+            int | None,
+            tuple[
+                tuple[np.ndarray, ...],
+                tuple[tuple[np.ndarray, np.ndarray], ...],
+                tuple[int, ...],
+            ],
+        ] = {}
+
+    @property
+    def genome(self) -> torch.Tensor:
+        """Flat float32 tensor whose slices are this network's parameters.
+
+        Population operators read and write the whole vector at once. Write
+        under ``torch.no_grad()`` with Torch in-place ops so
+        :attr:`parameter_version` notices the change.
+        """
+
+        return self._genome
+
+    @property
+    def genome_spans(self) -> tuple[tuple[int, int], ...]:
+        """``(start, stop)`` genome offsets of each tensor in ``parameters()``."""
+
+        return self._genome_spans
 
     @property
     def architecture(self) -> tuple[int, ...]:
@@ -60,14 +180,81 @@ class DrivingQNetwork(nn.Module):
                 values = torch.relu(values)
         return values
 
-    def snapshot(self, observation: Sequence[float] | np.ndarray) -> dict[str, Any]:
-        """Return full, JSON-friendly weights and activations for one state.
+    @property
+    def parameter_version(self) -> tuple[int, ...]:
+        """Per-parameter in-place write counters maintained by Torch.
+
+        Optimizer steps, ``load_state_dict`` (``copy_weights_from``, target
+        syncs, checkpoint loads) and the population's crossover and mutation
+        all write parameters in place, and each write bumps the counter.
+
+        This reads Torch's private ``Tensor._version``, the counter autograd
+        uses to detect in-place edits of saved tensors. Views share it with
+        their base, so writes through :attr:`genome` count too; writes that
+        bypass Torch (for example through ``genome.numpy()``) do not. The
+        acting mirror, population inference slots, process-pool weights and
+        snapshot caches all key on this value, and ``test_driving_dqn`` pins
+        its behaviour for the write paths above.
+        """
+
+        return tuple(parameter._version for parameter in self._parameter_tensors)
+
+    def acting_parameters(self) -> tuple[tuple[np.ndarray, np.ndarray], ...]:
+        """Cached ``(in, out)`` float32 weights and biases for each layer.
+
+        The NumPy copies are rebuilt only after :attr:`parameter_version`
+        changes, so greedy acting skips Torch dispatch, autograd bookkeeping
+        and mode toggles entirely.
+        """
+
+        version = self.parameter_version
+        if version != self._acting_version:
+            with torch.no_grad():
+                self._acting_parameters = tuple(
+                    (
+                        np.ascontiguousarray(
+                            layer.weight.detach().cpu().numpy().T,
+                            dtype=np.float32,
+                        ),
+                        layer.bias.detach().cpu().numpy().astype(
+                            np.float32, copy=True
+                        ),
+                    )
+                    for layer in self.layers
+                )
+            self._acting_version = version
+        return self._acting_parameters
+
+    def acting_values(self, observations: np.ndarray) -> np.ndarray:
+        """Q-values for a ``(rows, observation_size)`` float32 array in NumPy."""
+
+        return acting_forward(self.acting_parameters(), observations)
+
+    def snapshot(
+        self,
+        observation: Sequence[float] | np.ndarray,
+        *,
+        max_neurons_per_layer: int | None = None,
+    ) -> dict[str, Any]:
+        """Return real weights and activations for one state as NumPy arrays.
 
         Nothing is synthesized for presentation: every connection weight,
         bias, pre-activation, and displayed activation comes directly from the
-        live model. A renderer can down-sample these arrays if space is tight.
+        live model.  Layers wider than ``max_neurons_per_layer`` are sampled at
+        evenly spaced neurons; ``selected_indices`` and ``full_size`` record
+        the sampling, and each returned weight is the exact weight between two
+        selected neurons.  ``None`` keeps every neuron.
+
+        Weight and bias slices depend only on the weights, so they are reused
+        until :attr:`parameter_version` changes.  All arrays are read-only.
         """
 
+        if max_neurons_per_layer is not None and (
+            isinstance(max_neurons_per_layer, bool)
+            or not isinstance(max_neurons_per_layer, int)
+            or max_neurons_per_layer <= 0
+        ):
+            raise ValueError("max_neurons_per_layer must be a positive integer or None")
         array = np.asarray(observation, dtype=np.float32)
         if array.shape != (self.observation_size,):
             raise ValueError(
@@ -77,41 +264,88 @@ class DrivingQNetwork(nn.Module):
         if not np.isfinite(array).all():
             raise ValueError("observation values must be finite")
 
-        tensor = torch.from_numpy(array)
+        selections, slices, version = self._snapshot_parameters(max_neurons_per_layer)
         layers: list[dict[str, Any]] = [
-            {
-                "name": "observation",
-                "kind": "input",
-                "activations": array.astype(float).tolist(),
-            }
+            self._snapshot_layer(
+                "observation", "input", selections[0], self.observation_size
+            )
         ]
-        values = tensor
-        was_training = self.training
-        self.eval()
-        try:
-            with torch.no_grad():
-                for index, layer in enumerate(self.layers):
-                    raw = layer(values)
-                    is_output = index == len(self.layers) - 1
-                    values = raw if is_output else torch.relu(raw)
-                    layers.append(
-                        {
-                            "name": "q_values" if is_output else f"hidden_{index + 1}",
-                            "kind": "output" if is_output else "hidden",
-                            "pre_activations": raw.detach().cpu().tolist(),
-                            "activations": values.detach().cpu().tolist(),
-                            "weights": layer.weight.detach().cpu().tolist(),
-                            "biases": layer.bias.detach().cpu().tolist(),
-                        }
-                    )
-        finally:
-            self.train(was_training)
+        layers[0]["activations"] = _read_only(array[selections[0]])
+        # Activations come from the same NumPy kernel that chooses actions, so
+        # the displayed Q-values are exactly the ones the policy acted on.
+        values = array[None, :]
+        parameters = self.acting_parameters()
+        for index, ((weights, biases), (selected_weights, selected_biases)) in (
+            enumerate(zip(parameters, slices))
+        ):
+            raw = stacked_layer(values, weights[None], biases)
+            is_output = index == len(parameters) - 1
+            values = raw if is_output else np.maximum(raw, 0.0)
+            selected = selections[index + 1]
+            layer = self._snapshot_layer(
+                "q_values" if is_output else f"hidden_{index + 1}",
+                "output" if is_output else "hidden",
+                selected,
+                biases.shape[0],
+            )
+            layer.update(
+                {
+                    "pre_activations": _read_only(raw[0][selected]),
+                    "activations": _read_only(values[0][selected]),
+                    "weights": selected_weights,
+                    "biases": selected_biases,
+                }
+            )
+            layers.append(layer)
 
         return {
             "architecture": list(self.architecture),
             "parameter_count": self.parameter_count,
+            "parameter_version": version,
+            "weight_layout": "out_in",
             "layers": layers,
-            "q_values": layers[-1]["activations"],
+            # Q-values are never sampled; every action keeps its value.
+            "q_values": values[0].astype(float).tolist(),
         }
 
+    @staticmethod
+    def _snapshot_layer(
+        name: str, kind: str, selected: np.ndarray, full_size: int
+    ) -> dict[str, Any]:
+        return {
+            "name": name,
+            "kind": kind,
+            "size": len(selected),
+            "full_size": full_size,
+            "selected_indices": selected,
+            "sampled": len(selected) != full_size,
+        }
+
+    def _snapshot_parameters(
+        self, limit: int | None
+    ) -> tuple[
+        tuple[np.ndarray, ...],
+        tuple[tuple[np.ndarray, np.ndarray], ...],
+        tuple[int, ...],
+    ]:
+        """Sampled neurons and their ``(out, in)`` weight slices for *limit*."""
+
+        version = self.parameter_version
+        cached = self._snapshot_cache.get(limit)
+        if cached is not None and cached[2] == version:
+            return cached
+        selections = tuple(
+            _read_only(_evenly_spaced(size, limit)) for size in self.architecture
+        )
+        slices = tuple(
+            (
+                _read_only(weights[np.ix_(selections[index], selections[index + 1])].T),
+                _read_only(biases[selections[index + 1]]),
+            )
+            for index, (weights, biases) in enumerate(self.acting_parameters())
+        )
+        cached = (selections, slices, version)
+        self._snapshot_cache[limit] = cached
+        return cached
+
     visualization_snapshot = snapshot
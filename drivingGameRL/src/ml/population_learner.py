@@ -0,0 +1,180 @@
+"""Vectorized replay updates across many same-shaped population learners."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+from torch import nn
+
+from .replay import PrioritizedReplayBatch, ReplayBatch
+
+if TYPE_CHECKING:
+    from .dqn import DrivingDQNAgent
+
+
+class PopulationLearner:
+    """Run several members' TD updates as one stacked forward and backward.
+
+    Each member samples its own replay batch exactly as
+    :meth:`DrivingDQNAgent.train_step` would.  Member layers are stacked with
+    ``torch.stack`` into ``(members, out, in)`` tensors and evaluated with one
+    ``torch.baddbmm`` per layer, so a single backward pass writes every
+    member's ``.grad``.  Each member then clips its gradients, steps its own
+    Adam optimizer and records telemetry through the same code as a solo
+    update, which keeps optimizer state, target syncs and replay priorities
+    per member.  Losses match the solo path up to floating-point rounding.
+    """
+
+    def __init__(self) -> None:
+        self.batched_steps = 0
+        self.member_updates = 0
+
+    def train_steps(
+        self, agents: Sequence[DrivingDQNAgent]
+    ) -> tuple[float | None, ...]:
+        """Update every agent whose replay holds a batch; return their losses.
+
+        Agents without a full batch are skipped and report ``None``, like
+        :meth:`DrivingDQNAgent.train_step`.
+        """
+
+        losses: list[float | None] = [None] * len(agents)
+        rows: list[int] = []
+        batches: list[ReplayBatch | PrioritizedReplayBatch] = []
+        members: list[DrivingDQNAgent] = []
+        self._require_compatible(agents)
+        for row, agent in enumerate(agents):
+            batch = agent._sample_update_batch()
+            if batch is not None:
+                rows.append(row)
+                batches.append(batch)
+                members.append(agent)
+        if not members:
+            return tuple(losses)
+
+        states = torch.from_numpy(np.stack([batch.states for batch in batches]))
+        actions = torch.from_numpy(np.stack([batch.actions for batch in batches]))
+        rewards = torch.from_numpy(np.stack([batch.rewards for batch in batches]))
+        next_states = torch.from_numpy(
+            np.stack([batch.next_states for batch in batches])
+        )
+        dones = torch.from_numpy(np.stack([batch.dones for batch in batches]))
+
+        for agent in members:
+            agent.online_network.train()
+        online = self._stacked_layers(members, target=False)
+        predicted = (
+            self._forward(online, states).gather(2, actions[..., None]).squeeze(2)
+        )
+        with torch.no_grad():
+            target_values = self._forward(
+                self._stacked_layers(members, target=True), next_states
+            )
+            if members[0].config.algorithm == "dqn":
+                bootstrap = target_values.max(dim=2).values
+            else:
+                detached = tuple(
+                    (weights.detach(), biases.detach()) for weights, biases in online
+                )
+                online_actions = self._forward(detached, next_states).argmax(
+                    dim=2, keepdim=True
+                )
+                bootstrap = target_values.gather(2, online_actions).squeeze(2)
+        discount = members[0]._bootstrap_discount
+        targets = rewards + (~dones).float() * discount * bootstrap
+        for position, agent in enumerate(members):
+            agent._require_finite_targets(predicted[position], targets[position])
+
+        elementwise = nn.functional.smooth_l1_loss(
+            predicted, targets, reduction="none"
+        )
+        if isinstance(batches[0], PrioritizedReplayBatch):
+            # Importance weights undo the sampling bias of prioritized replay.
+            importance = torch.from_numpy(
+                np.stack([batch.weights for batch in batches])
+            )
+            elementwise = importance * elementwise
+        member_losses = elementwise.mean(dim=1)
+        for position, agent in enumerate(members):
+            agent.optimizer.zero_grad(set_to_none=True)
+            agent._require_finite_loss(member_losses[position])
+        # Members share no parameters, so the summed loss gives each member
+        # exactly the gradient of its own mean loss.
+        member_losses.sum().backward()
+        for position, (row, agent, batch) in enumerate(zip(rows, members, batches)):
+            losses[row] = agent._apply_update(
+                batch,
+                member_losses[position],
+                predicted[position],
+                targets[position],
+            )
+        self.batched_steps += 1
+        self.member_updates += len(members)
+        return tuple(losses)
+
+    @staticmethod
+    def _require_compatible(agents: Sequence[DrivingDQNAgent]) -> None:
+        if not agents:
+            return
+        first = agents[0]
+        update_shape = (
+            first.online_network.architecture,
+            first.config.algorithm,
+            first.config.batch_size,
+            first.config.gamma,
+            first.config.n_step,
+            first.config.replay_strategy,
+        )
+        for agent in agents:
+            if agent._learner is not None:
+                raise ValueError(
+                    "population learner cannot update agents with an "
+                    "asynchronous learner"
+                )
+            if (
+                agent.online_network.architecture,
+                agent.config.algorithm,
+                agent.config.batch_size,
+                agent.config.gamma,
+                agent.config.n_step,
+                agent.config.replay_strategy,
+            ) != update_shape:
+                raise ValueError(
+                    "population learner requires one shared architecture and "
+                    "update configuration"
+                )
+
+    @staticmethod
+    def _stacked_layers(
+        agents: Sequence[DrivingDQNAgent], *, target: bool
+    ) -> tuple[tuple[torch.Tensor, torch.Tensor], ...]:
+        networks = [
+            agent.target_network if target else agent.online_network
+            for agent in agents
+        ]
+        return tuple(
+            (
+                torch.stack([network.layers[layer].weight for network in networks]),
+                torch.stack([network.layers[layer].bias for network in networks]),
+            )
+            for layer in range(len(networks[0].layers))
+        )
+
+    @staticmethod
+    def _forward(
+        layers: Sequence[tuple[torch.Tensor, torch.Tensor]], inputs: torch.Tensor
+    ) -> torch.Tensor:
+        """Apply stacked ``(members, out, in)`` layers to ``(members, rows, in)``."""
+
+        values = inputs
+        for index, (weights, biases) in enumerate(layers):
+            values = torch.baddbmm(biases[:, None, :], values, weights.transpose(1, 2))
+            if index < len(layers) - 1:
+                values = torch.relu(values)
+        return values
+
+
+__all__ = ("PopulationLearner",)
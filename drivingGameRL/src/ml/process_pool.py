@@ -0,0 +1,647 @@
+"""Long-lived worker processes that advance greedy population members.
+
+Environment physics, sensor fans and reward bookkeeping are pure Python, so
+threads cannot run them concurrently.  :class:`PopulationProcessPool` instead
+gives each member's simulation to one spawned worker process for the life of
+the pool.  Member genomes travel through one shared-memory matrix and each
+chunk returns compact per-tick records; the coordinator rebuilds ordinary
+step results from them and merges ticks exactly as the thread backend does.
+
+Workers act greedily from the same NumPy kernel as
+:meth:`DrivingQNetwork.acting_values`, so a process-backed ``genetic``
+generation is bit-identical to the in-process one.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+import pickle
+import traceback
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from ..circuits import Circuit
+from ..environment import (
+    DrivingEnv,
+    DrivingEnvSnapshot,
+    LapPose,
+    LapRecord,
+    StepInfo,
+    StepResult,
+    _StepSnapshot,
+)
+from ..math2d import Vec2
+from ..sensor_clearance import SensorClearanceDecision, SensorClearancePolicy
+from ..vehicle import VehicleTelemetry
+from .network import DrivingQNetwork, stacked_layer
+
+
+_TELEMETRY_FIELD = _StepSnapshot._fields.index("telemetry")
+
+
+class MemberTick(NamedTuple):
+    """One worker decision, rebuilt on the coordinator."""
+
+    q_values: np.ndarray
+    safety_decision: SensorClearanceDecision
+    env_result: StepResult
+    budget_reached: bool
+    done: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _LayerLayout:
+    """Genome offsets and shape of one linear layer."""
+
+    weight_start: int
+    weight_stop: int
+    bias_start: int
+    bias_stop: int
+    input_size: int
+    output_size: int
+
+
+def _values(value: Any) -> tuple[Any, ...]:
+    """Field values of a frozen dataclass, which pickle far faster than it."""
+
+    return tuple(getattr(value, name) for name in value.__dataclass_fields__)
+
+
+def _flat_poses(poses: Sequence[LapPose]) -> tuple[float, ...]:
+    return tuple(
+        value
+        for pose in poses
+        for value in (pose.elapsed, pose.position.x, pose.position.y, pose.heading)
+    )
+
+
+def _poses(values: Sequence[float]) -> tuple[LapPose, ...]:
+    return tuple(
+        LapPose(
+            values[offset],
+            Vec2(values[offset + 1], values[offset + 2]),
+            values[offset + 3],
+        )
+        for offset in range(0, len(values), 4)
+    )
+
+
+def encode_snapshot(
+    snapshot: DrivingEnvSnapshot, circuit: Circuit
+) -> tuple[Any, ...]:
+    """Flatten *snapshot* into plain values for a pipe.
+
+    The shared *circuit* is sent as ``None`` and substituted on arrival.  The
+    pose-keyed caches travel too, so cache statistics continue seamlessly;
+    their keys start with the circuit's ``id()``, which is rewritten to the
+    receiving process's copy.
+    """
+
+    (
+        ray_key,
+        rays,
+        projection_key,
+        projection,
+        terrain,
+    ) = snapshot.caches
+    caches = None
+    if (ray_key is None or ray_key[0] == id(snapshot.circuit)) and (
+        projection_key is None or projection_key[0] == id(snapshot.circuit)
+    ):
+        caches = (
+            None if ray_key is None else ray_key[1:],
+            rays,
+            None if projection_key is None else projection_key[1:],
+            projection,
+            terrain,
+        )
+
+    return (
+        None if snapshot.circuit is circuit else snapshot.circuit,
+        snapshot.build,
+        snapshot.fixed_dt,
+        snapshot.max_steps,
+        snapshot.random_start_curriculum,
+        snapshot.sensor_engine,
+        snapshot.info_level,
+        snapshot.decision_interval,
+        snapshot.vehicle_state,
+        _values(snapshot.vehicle_telemetry),
+        snapshot.random_state,
+        snapshot.episode,
+        snapshot.episode_lap_times,
+        _flat_poses(snapshot.lap_trajectory),
+        tuple(
+            (slug, record.circuit, record.duration, _flat_poses(record.trajectory))
+            for slug, record in snapshot.best_laps
+        ),
+        snapshot.collision_entry_steps,
+        snapshot.reward_terms,
+        caches,
+    )
+
+
+def decode_snapshot(values: Sequence[Any], circuit: Circuit) -> DrivingEnvSnapshot:
+    """Rebuild the snapshot flattened by :func:`encode_snapshot`."""
+
+    (
+        snapshot_circuit,
+        build,
+        fixed_dt,
+        max_steps,
+        random_start_curriculum,
+        sensor_engine,
+        info_level,
+        decision_interval,
+        vehicle_state,
+        vehicle_telemetry,
+        random_state,
+        episode,
+        episode_lap_times,
+        lap_trajectory,
+        best_laps,
+        collision_entry_steps,
+        reward_terms,
+        caches,
+    ) = values
+    circuit = circuit if snapshot_circuit is None else snapshot_circuit
+    if caches is None:
+        caches = (None, None, None, None, None)
+    else:
+        ray_key, rays, projection_key, projection, terrain = caches
+        caches = (
+            None if ray_key is None else (id(circuit), *ray_key),
+            rays,
+            None if projection_key is None else (id(circuit), *projection_key),
+            projection,
+            terrain,
+        )
+    return DrivingEnvSnapshot(
+        circuit=circuit,
+        build=build,
+        fixed_dt=fixed_dt,
+        max_steps=max_steps,
+        random_start_curriculum=random_start_curriculum,
+        sensor_engine=sensor_engine,
+        info_level=info_level,
+        decision_interval=decision_interval,
+        vehicle_state=vehicle_state,
+        vehicle_telemetry=VehicleTelemetry(*vehicle_telemetry),
+        random_state=random_state,
+        episode=episode,
+        episode_lap_times=episode_lap_times,
+        lap_trajectory=_poses(lap_trajectory),
+        best_laps=tuple(
+            (slug, LapRecord(record_circuit, duration, _poses(trajectory)))
+            for slug, record_circuit, duration, trajectory in best_laps
+        ),
+        collision_entry_steps=collision_entry_steps,
+        reward_terms=reward_terms,
+        caches=caches,
+    )
+
+
+def _encode_info(info: Mapping[str, object]) -> object:
+    if isinstance(info, StepInfo):
+        values = list(info._snapshot)
+        values[_TELEMETRY_FIELD] = _values(values[_TELEMETRY_FIELD])
+        return tuple(values)
+    return dict(info)
+
+
+def _decode_info(values: object) -> Mapping[str, object]:
+    if isinstance(values, dict):
+        return values
+    assert isinstance(values, tuple)
+    snapshot = list(values)
+    snapshot[_TELEMETRY_FIELD] = VehicleTelemetry(*snapshot[_TELEMETRY_FIELD])
+    return StepInfo(_StepSnapshot(*snapshot), DrivingEnv)
+
+
+class _WorkerMember:
+    """Environment and cached acting weights owned by one worker process."""
+
+    __slots__ = ("env", "genome_version", "weights", "biases")
+
+    def __init__(self, env: DrivingEnv) -> None:
+        self.env = env
+        self.genome_version = -1
+        self.weights: tuple[np.ndarray, ...] = ()
+        self.biases: tuple[np.ndarray, ...] = ()
+
+
+class _Worker:
+    """Command loop state inside one spawned worker process."""
+
+    def __init__(
+        self,
+        memory_name: str,
+        shape: tuple[int, int],
+        layers: tuple[_LayerLayout, ...],
+        circuit: Circuit,
+        clearance_policy: SensorClearancePolicy,
+    ) -> None:
+        # Spawned workers share the coordinator's resource tracker, which
+        # releases the block when the coordinator unlinks it.
+        self.memory = SharedMemory(name=memory_name)
+        self.genomes = np.ndarray(shape, dtype=np.float32, buffer=self.memory.buf)
+        self.layers = layers
+        self.circuit = circuit
+        self.clearance_policy = clearance_policy
+        self.members: dict[int, _WorkerMember] = {}
+
+    def close(self) -> None:
+        del self.genomes
+        self.memory.close()
+
+    def advance(
+        self,
+        requests: Sequence[tuple[Any, ...]],
+        max_ticks: int,
+        step_budget: int,
+    ) -> list[tuple[int, list[tuple[Any, ...]], tuple[Any, ...] | None]]:
+        members = []
+        states = []
+        completed_steps = []
+        for index, state, steps, genome_version, snapshot in requests:
+            member = self.members.get(index)
+            if snapshot is not None:
+                restored = decode_snapshot(snapshot, self.circuit)
+                if member is None:
+                    member = self.members[index] = _WorkerMember(
+                        DrivingEnv(restored.circuit, build=restored.build)
+                    )
+                member.env.restore(restored)
+            if member is None:
+                raise RuntimeError(f"population worker has no environment {index}")
+            if member.genome_version != genome_version:
+                self._load_genome(member, self.genomes[index])
+                member.genome_version = genome_version
+            members.append(member)
+            states.append(np.frombuffer(state, dtype=np.float32).copy())
+            completed_steps.append(int(steps))
+
+        weights = tuple(np.stack(layer) for layer in zip(*(m.weights for m in members)))
+        biases = tuple(np.stack(layer) for layer in zip(*(m.biases for m in members)))
+        records: list[list[tuple[Any, ...]]] = [[] for _ in members]
+        finals: list[tuple[Any, ...] | None] = [None] * len(members)
+        running = list(range(len(members)))
+        for _ in range(max_ticks):
+            if not running:
+                break
+            index = None if len(running) == len(members) else running
+            values = np.stack([states[row] for row in running])
+            for layer, (layer_weights, layer_biases) in enumerate(
+                zip(weights, biases)
+            ):
+                if index is not None:
+                    layer_weights = layer_weights[index]
+                    layer_biases = layer_biases[index]
+                values = stacked_layer(values, layer_weights, layer_biases)
+                if layer < len(weights) - 1:
+                    values = np.maximum(values, 0.0)
+            if not np.isfinite(values).all():
+                raise FloatingPointError("driving policy produced non-finite Q-values")
+            decisions = self.clearance_policy.decide_many(
+                [states[row] for row in running], values.argmax(axis=1)
+            )
+            still_running = []
+            for position, (row, decision) in enumerate(zip(running, decisions)):
+                q_values = values[position]
+                env = members[row].env
+                result = env.step(decision.executed_action)
+                completed_steps[row] += int(result.info.get("decision_ticks", 1))
+                budget_reached = completed_steps[row] >= step_budget
+                done = bool(result.terminated or result.truncated or budget_reached)
+                records[row].append(
+                    (
+                        q_values.tobytes(),
+                        _values(decision),
+                        result.observation,
+                        result.reward,
+                        result.terminated,
+                        result.truncated,
+                        _encode_info(result.info),
+                        budget_reached,
+                        done,
+                    )
+                )
+                states[row] = np.asarray(result.observation, dtype=np.float32)
+                if done:
+                    finals[row] = encode_snapshot(env.snapshot(), self.circuit)
+                else:
+                    still_running.append(row)
+            running = still_running
+        return [
+            (request[0], member_records, final)
+            for request, member_records, final in zip(requests, records, finals)
+        ]
+
+    def pull(self, indices: Sequence[int]) -> list[tuple[Any, ...]]:
+        return [
+            encode_snapshot(self.members[index].env.snapshot(), self.circuit)
+            for index in indices
+        ]
+
+    def _load_genome(self, member: _WorkerMember, genome: np.ndarray) -> None:
+        member.weights = tuple(
+            np.ascontiguousarray(
+                genome[layer.weight_start : layer.weight_stop]
+                .reshape(layer.output_size, layer.input_size)
+                .T
+            )
+            for layer in self.layers
+        )
+        member.biases = tuple(
+            genome[layer.bias_start : layer.bias_stop].copy() for layer in self.layers
+        )
+
+
+def _portable_error(error: BaseException) -> BaseException:
+    """Return *error*, or a stand-in when it cannot cross the pipe."""
+
+    detail = "".join(traceback.format_exception(error))
+    try:
+        pickle.loads(pickle.dumps(error))
+    except Exception:
+        error = RuntimeError(f"{type(error).__name__}: {error}")
+    error.add_note("population worker traceback:\n" + detail)
+    return error
+
+
+def _worker_main(connection: Connection, *arguments: Any) -> None:
+    worker = _Worker(*arguments)
+    try:
+        while True:
+            command, *payload = connection.recv()
+            if command == "close":
+                return
+            try:
+                if command == "advance":
+                    reply = worker.advance(*payload)
+                elif command == "pull":
+                    reply = worker.pull(*payload)
+                else:
+                    raise ValueError(f"unknown population worker command {command!r}")
+            except BaseException as error:
+                connection.send(("error", _portable_error(error)))
+            else:
+                connection.send(("ok", reply))
+    finally:
+        worker.close()
+        connection.close()
+
+
+class PopulationProcessPool:
+    """Spawned workers that own member environments across many chunks.
+
+    Member ``i`` always lives on worker ``i % workers``.  The coordinator
+    keeps its own ``DrivingEnv`` per member as the authoritative copy between
+    calls: a member's worker environment is seeded from it after
+    :meth:`invalidate`, a finished member's final state is written back
+    immediately, and :meth:`sync_environments` writes back every member that
+    is still running.  A member genome is copied into shared memory only when
+    its network object or :attr:`DrivingQNetwork.parameter_version` changes.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        population_size: int,
+        network: DrivingQNetwork,
+        circuit: Circuit,
+        clearance_policy: SensorClearancePolicy,
+    ) -> None:
+        if isinstance(workers, bool) or not isinstance(workers, int) or workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        if population_size <= 0:
+            raise ValueError("population_size must be positive")
+        spans = network.genome_spans
+        architecture = network.architecture
+        self._architecture = architecture
+        self._circuit = circuit
+        self.workers = min(workers, population_size)
+        layers = tuple(
+            _LayerLayout(
+                *spans[2 * layer],
+                *spans[2 * layer + 1],
+                architecture[layer],
+                architecture[layer + 1],
+            )
+            for layer in range(len(architecture) - 1)
+        )
+        shape = (population_size, network.parameter_count)
+        self._memory = SharedMemory(
+            create=True, size=max(1, shape[0] * shape[1] * 4)
+        )
+        self._genomes = np.ndarray(shape, dtype=np.float32, buffer=self._memory.buf)
+        self._networks: list[DrivingQNetwork | None] = [None] * population_size
+        self._network_versions: list[tuple[int, ...] | None] = [
+            None
+        ] * population_size
+        self._genome_versions = [0] * population_size
+        self._seeded: set[int] = set()
+        self._running: dict[int, DrivingEnv] = {}
+        self._connections: list[Connection] = []
+        self._processes: list[Any] = []
+        self._closed = False
+        context = multiprocessing.get_context("spawn")
+        try:
+            for worker in range(self.workers):
+                parent, child = context.Pipe()
+                process = context.Process(
+                    target=_worker_main,
+                    args=(
+                        child,
+                        self._memory.name,
+                        shape,
+                        layers,
+                        circuit,
+                        clearance_policy,
+                    ),
+                    name=f"driving-population-{worker}",
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+        except BaseException:
+            self.close()
+            raise
+
+    def invalidate(self) -> None:
+        """Reseed every worker environment from the coordinator copies."""
+
+        self._seeded.clear()
+        self._running.clear()
+
+    def advance(
+        self,
+        members: Sequence[tuple[int, DrivingQNetwork, DrivingEnv, np.ndarray, int]],
+        *,
+        max_ticks: int,
+        step_budget: int,
+    ) -> tuple[tuple[MemberTick, ...], ...]:
+        """Advance ``(index, network, env, state, completed_steps)`` members.
+
+        Every worker is waited for before an error is raised, so no chunk is
+        still in flight when the caller decides to fail stop.
+        """
+
+        self._require_open()
+        requests: list[list[tuple[Any, ...]]] = [[] for _ in self._connections]
+        environments = {}
+        for index, network, env, state, completed_steps in members:
+            self._write_genome(index, network)
+            snapshot = None
+            if index not in self._seeded:
+                snapshot = encode_snapshot(env.snapshot(), self._circuit)
+                self._seeded.add(index)
+            environments[index] = env
+            requests[index % self.workers].append(
+                (
+                    index,
+                    np.asarray(state, dtype=np.float32).tobytes(),
+                    completed_steps,
+                    self._genome_versions[index],
+                    snapshot,
+                )
+            )
+        replies = self._exchange(
+            {
+                worker: ("advance", worker_requests, max_ticks, step_budget)
+                for worker, worker_requests in enumerate(requests)
+                if worker_requests
+            }
+        )
+        chunks: dict[int, tuple[MemberTick, ...]] = {}
+        for reply in replies.values():
+            for index, records, final in reply:
+                chunks[index] = tuple(self._tick(record) for record in records)
+                if final is None:
+                    self._running[index] = environments[index]
+                else:
+                    environments[index].restore(decode_snapshot(final, self._circuit))
+                    self._running.pop(index, None)
+        return tuple(chunks[index] for index, *_ in members)
+
+    def sync_environments(self) -> None:
+        """Write every still-running worker environment back to the coordinator."""
+
+        if not self._running:
+            return
+        self._require_open()
+        pulled: dict[int, list[int]] = {}
+        for index in sorted(self._running):
+            pulled.setdefault(index % self.workers, []).append(index)
+        replies = self._exchange(
+            {worker: ("pull", indices) for worker, indices in pulled.items()}
+        )
+        for worker, snapshots in replies.items():
+            for index, snapshot in zip(pulled[worker], snapshots):
+                self._running.pop(index).restore(
+                    decode_snapshot(snapshot, self._circuit)
+                )
+
+    def close(self) -> None:
+        """Stop the workers and release shared memory; safe to call repeatedly."""
+
+        if self._closed:
+            return
+        self._closed = True
+        for connection in self._connections:
+            try:
+                connection.send(("close",))
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for connection in self._connections:
+            connection.close()
+        del self._genomes
+        self._memory.close()
+        self._memory.unlink()
+
+    def _require_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("population process pool is closed")
+
+    def _write_genome(self, index: int, network: DrivingQNetwork) -> None:
+        version = network.parameter_version
+        if (
+            self._networks[index] is network
+            and self._network_versions[index] == version
+        ):
+            return
+        if network.architecture != self._architecture:
+            raise ValueError(
+                "population process pool requires one shared network architecture"
+            )
+        self._genomes[index] = network.genome.detach().cpu().numpy()
+        self._networks[index] = network
+        self._network_versions[index] = version
+        self._genome_versions[index] += 1
+
+    def _exchange(self, messages: Mapping[int, tuple[Any, ...]]) -> dict[int, Any]:
+        sent = []
+        first_error: BaseException | None = None
+        for worker, message in messages.items():
+            try:
+                self._connections[worker].send(message)
+                sent.append(worker)
+            except BaseException as error:
+                first_error = first_error or error
+                break
+        replies = {}
+        for worker in sent:
+            try:
+                status, reply = self._connections[worker].recv()
+            except EOFError:
+                status, reply = "error", RuntimeError(
+                    f"population worker {worker} exited unexpectedly"
+                )
+            except BaseException as error:
+                status, reply = "error", error
+            if status == "ok":
+                replies[worker] = reply
+            elif first_error is None:
+                first_error = reply
+        if first_error is not None:
+            raise first_error
+        return replies
+
+    @staticmethod
+    def _tick(record: tuple[Any, ...]) -> MemberTick:
+        (
+            q_values,
+            decision,
+            observation,
+            reward,
+            terminated,
+            truncated,
+            info,
+            budget_reached,
+            done,
+        ) = record
+        return MemberTick(
+            q_values=np.frombuffer(q_values, dtype=np.float32).copy(),
+            safety_decision=SensorClearanceDecision(*decision),
+            env_result=StepResult(
+                observation, reward, terminated, truncated, _decode_info(info)
+            ),
+            budget_reached=budget_reached,
+            done=done,
+        )
+
+
+__all__ = ("MemberTick", "PopulationProcessPool")
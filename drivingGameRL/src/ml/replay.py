@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
 import math
 import random
-from typing import Iterator
+from typing import Any, Iterator, NamedTuple
 
 import numpy as np
 
@@ -20,8 +19,123 @@ class Transition:
     done: bool
 
 
+class ReplayBatch(NamedTuple):
+    """Contiguous per-field arrays for one sampled minibatch."""
+
+    states: np.ndarray
+    actions: np.ndarray
+    rewards: np.ndarray
+    next_states: np.ndarray
+    dones: np.ndarray
+
+
+class PrioritizedReplayBatch(NamedTuple):
+    """A prioritized minibatch plus its ring slots and importance weights."""
+
+    states: np.ndarray
+    actions: np.ndarray
+    rewards: np.ndarray
+    next_states: np.ndarray
+    dones: np.ndarray
+    slots: np.ndarray
+    weights: np.ndarray
+
+
+class SumTree:
+    """Binary sum and min tree over a fixed number of non-negative leaves.
+
+    Leaves sit in the second half of power-of-two arrays, so updating or
+    searching a whole batch of leaves walks the tree one level at a time
+    with vectorized NumPy operations: ``O(batch * log n)`` per call.
+    """
+
+    def __init__(self, capacity: int):
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self._leaves = 1 << max(0, (capacity - 1).bit_length())
+        self._sums = np.zeros(2 * self._leaves, dtype=np.float64)
+        self._mins = np.full(2 * self._leaves, np.inf, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return float(self._sums[1])
+
+    @property
+    def minimum(self) -> float:
+        """Smallest stored leaf, or ``inf`` while every leaf is empty."""
+
+        return float(self._mins[1])
+
+    def values(self, indices: np.ndarray) -> np.ndarray:
+        return self._sums[np.asarray(indices, dtype=np.int64) + self._leaves]
+
+    def update(self, indices: np.ndarray, values: np.ndarray) -> None:
+        """Set leaves; later duplicates in *indices* win, like assignment."""
+
+        positions = np.asarray(indices, dtype=np.int64) + self._leaves
+        priorities = np.asarray(values, dtype=np.float64)
+        if positions.shape != priorities.shape:
+            raise ValueError("indices and values must have the same shape")
+        if priorities.size and (
+            not np.isfinite(priorities).all() or (priorities < 0.0).any()
+        ):
+            raise ValueError("priorities must be finite and non-negative")
+        self._sums[positions] = priorities
+        self._mins[positions] = np.where(priorities > 0.0, priorities, np.inf)
+        # Every leaf sits at the same depth; a repeated parent simply gets the
+        # same recomputed value twice.
+        positions = positions // 2
+        while positions.size and positions[0] >= 1:
+            left = 2 * positions
+            self._sums[positions] = self._sums[left] + self._sums[left + 1]
+            self._mins[positions] = np.minimum(self._mins[left], self._mins[left + 1])
+            positions //= 2
+
+    def set(self, index: int, value: float) -> None:
+        """Scalar :meth:`update` for the one-leaf append path."""
+
+        if not math.isfinite(value) or value < 0.0:
+            raise ValueError("priorities must be finite and non-negative")
+        sums = self._sums
+        mins = self._mins
+        position = index + self._leaves
+        sums[position] = value
+        mins[position] = value if value > 0.0 else math.inf
+        position //= 2
+        while position:
+            left = 2 * position
+            sums[position] = sums[left] + sums[left + 1]
+            mins[position] = min(mins[left], mins[left + 1])
+            position //= 2
+
+    def find(self, targets: np.ndarray) -> np.ndarray:
+        """Return the leaf whose cumulative interval contains each target."""
+
+        values = np.asarray(targets, dtype=np.float64).copy()
+        positions = np.ones(values.shape, dtype=np.int64)
+        while positions.size and positions[0] < self._leaves:
+            left = 2 * positions
+            left_sums = self._sums[left]
+            right = values > left_sums
+            values = np.where(right, values - left_sums, values)
+            positions = left + right
+        return np.minimum(positions - self._leaves, self.capacity - 1)
+
+    def clear(self) -> None:
+        self._sums.fill(0.0)
+        self._mins.fill(np.inf)
+
+
 class ReplayBuffer:
-    """FIFO replay memory whose sampling does not touch global RNG state."""
+    """FIFO replay memory whose sampling does not touch global RNG state.
+
+    Transitions live in preallocated ring arrays (float32 observations,
+    int64 actions, bool terminal flags), so appending and sampling cost
+    O(1) and O(batch) respectively.  Sampling draws logical indices with the
+    same ``random.Random.sample`` call the original deque implementation
+    used, which keeps seeded minibatches identical.
+    """
 
     def __init__(
         self, capacity: int, observation_size: int = 16, *, seed: int | None = None
@@ -36,7 +150,15 @@ class ReplayBuffer:
             raise ValueError("observation_size must be a positive integer")
         self.capacity = capacity
         self.observation_size = observation_size
-        self._items: deque[Transition] = deque(maxlen=capacity)
+        self._states = np.zeros((capacity, observation_size), dtype=np.float32)
+        self._next_states = np.zeros((capacity, observation_size), dtype=np.float32)
+        self._actions = np.zeros(capacity, dtype=np.int64)
+        # Rewards keep full precision so Transition views and statistics are
+        # unchanged; minibatches are converted to float32 on the way out.
+        self._rewards = np.zeros(capacity, dtype=np.float64)
+        self._dones = np.zeros(capacity, dtype=np.bool_)
+        self._start = 0
+        self._size = 0
         self._rng = random.Random(seed)
         self._reward_sum = 0.0
         self._terminal_count = 0
@@ -62,12 +184,20 @@ class ReplayBuffer:
             state = source.state
         else:
             state = transition_or_state
-        transition = self._validated_transition(state, action, reward, next_state, done)
-        if len(self._items) == self.capacity:
-            removed = self._items[0]
-            self._reward_sum -= removed.reward
-            self._terminal_count -= int(removed.done)
-        self._items.append(transition)
+        transition = self.validate_transition(state, action, reward, next_state, done)
+        if self._size == self.capacity:
+            slot = self._start
+            self._reward_sum -= float(self._rewards[slot])
+            self._terminal_count -= int(self._dones[slot])
+            self._start = (self._start + 1) % self.capacity
+        else:
+            slot = (self._start + self._size) % self.capacity
+            self._size += 1
+        self._states[slot] = transition.state
+        self._next_states[slot] = transition.next_state
+        self._actions[slot] = transition.action
+        self._rewards[slot] = transition.reward
+        self._dones[slot] = transition.done
         self._reward_sum += transition.reward
         self._terminal_count += int(transition.done)
         return transition
@@ -75,25 +205,45 @@ class ReplayBuffer:
     add = append
 
     def sample(self, batch_size: int) -> tuple[Transition, ...]:
-        if (
-            isinstance(batch_size, bool)
-            or not isinstance(batch_size, int)
-            or batch_size <= 0
-        ):
-            raise ValueError("batch_size must be a positive integer")
-        if batch_size > len(self._items):
-            raise ValueError(
-                "batch_size cannot exceed the number of stored transitions"
-            )
-        return tuple(self._rng.sample(tuple(self._items), batch_size))
+        return tuple(
+            self._transition(slot) for slot in self._sample_slots(batch_size)
+        )
+
+    def sample_batch(self, batch_size: int) -> ReplayBatch:
+        """Sample like :meth:`sample` but return contiguous field arrays.
+
+        The arrays are fresh copies, ready for ``torch.from_numpy``; rewards
+        are float32 to match the network's dtype.
+        """
+
+        slots = np.fromiter(
+            self._sample_slots(batch_size), dtype=np.int64, count=batch_size
+        )
+        return ReplayBatch(
+            self._states[slots],
+            self._actions[slots],
+            self._rewards[slots].astype(np.float32),
+            self._next_states[slots],
+            self._dones[slots],
+        )
+
+    def tail(self, size: int) -> tuple[Transition, ...]:
+        """Return up to *size* of the newest transitions, oldest first."""
+
+        count = max(0, min(int(size), self._size))
+        return tuple(
+            self._transition(self._slot(index))
+            for index in range(self._size - count, self._size)
+        )
 
     def clear(self) -> None:
-        self._items.clear()
+        self._start = 0
+        self._size = 0
         self._reward_sum = 0.0
         self._terminal_count = 0
 
     def stats(self) -> dict[str, float | int]:
-        size = len(self._items)
+        size = self._size
         return {
             "size": size,
             "capacity": self.capacity,
@@ -103,12 +253,42 @@ class ReplayBuffer:
         }
 
     def __len__(self) -> int:
-        return len(self._items)
+        return self._size
 
     def __iter__(self) -> Iterator[Transition]:
-        return iter(self._items)
+        for index in range(self._size):
+            yield self._transition(self._slot(index))
 
-    def _validated_transition(
+    def _slot(self, index: int) -> int:
+        return (self._start + index) % self.capacity
+
+    def _sample_slots(self, batch_size: int) -> Iterator[int]:
+        self._check_batch_size(batch_size)
+        indices = self._rng.sample(range(self._size), batch_size)
+        return (self._slot(index) for index in indices)
+
+    def _check_batch_size(self, batch_size: int) -> None:
+        if (
+            isinstance(batch_size, bool)
+            or not isinstance(batch_size, int)
+            or batch_size <= 0
+        ):
+            raise ValueError("batch_size must be a positive integer")
+        if batch_size > self._size:
+            raise ValueError(
+                "batch_size cannot exceed the number of stored transitions"
+            )
+
+    def _transition(self, slot: int) -> Transition:
+        return Transition(
+            self._states[slot].copy(),
+            int(self._actions[slot]),
+            float(self._rewards[slot]),
+            self._next_states[slot].copy(),
+            bool(self._dones[slot]),
+        )
+
+    def validate_transition(
         self,
         state: object,
         action: object,
@@ -116,6 +296,12 @@ class ReplayBuffer:
         next_state: object,
         done: object,
     ) -> Transition:
+        """Check one transition against this buffer and return a copy.
+
+        Nothing is stored, so callers that hold decisions back (n-step
+        folding) reject bad input at the step that produced it.
+        """
+
         state_array = self._observation("state", state)
         next_array = self._observation("next_state", next_state)
         if isinstance(action, bool) or not isinstance(action, (int, np.integer)):
@@ -149,3 +335,134 @@ class ReplayBuffer:
         if not np.isfinite(array).all():
             raise ValueError(f"{name} values must be finite")
         return array.copy()
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """Proportional prioritized replay over the same ring storage.
+
+    Slot ``i`` is drawn with probability ``p_i / sum(p)``, where
+    ``p_i = (|td_error_i| + epsilon) ** alpha``.  New transitions enter with
+    the largest priority seen so far so that each one is replayed at least
+    once soon after it arrives.  Batches are stratified across the priority
+    mass and carry importance-sampling weights ``(N * P(i)) ** -beta``
+    normalized by the largest possible weight.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        observation_size: int = 16,
+        *,
+        seed: int | None = None,
+        alpha: float = 0.6,
+        epsilon: float = 1e-3,
+    ):
+        super().__init__(capacity, observation_size, seed=seed)
+        if (
+            isinstance(alpha, bool)
+            or not isinstance(alpha, (int, float))
+            or not math.isfinite(float(alpha))
+            or float(alpha) < 0.0
+        ):
+            raise ValueError("alpha must be a finite non-negative number")
+        if (
+            isinstance(epsilon, bool)
+            or not isinstance(epsilon, (int, float))
+            or not math.isfinite(float(epsilon))
+            or float(epsilon) <= 0.0
+        ):
+            raise ValueError("epsilon must be a finite positive number")
+        self.alpha = float(alpha)
+        self.epsilon = float(epsilon)
+        self._tree = SumTree(capacity)
+        self._max_priority = 1.0
+        self.priority_updates = 0
+        self.last_beta = 1.0
+        self._last_weight_mean = 1.0
+
+    def append(
+        self,
+        transition_or_state: Transition | np.ndarray | tuple[float, ...],
+        action: int | None = None,
+        reward: float | None = None,
+        next_state: np.ndarray | tuple[float, ...] | None = None,
+        done: bool | None = None,
+    ) -> Transition:
+        transition = super().append(
+            transition_or_state, action, reward, next_state, done
+        )
+        self._tree.set(self._slot(self._size - 1), self._max_priority)
+        return transition
+
+    add = append
+
+    def sample_batch(  # type: ignore[override]
+        self, batch_size: int, *, beta: float = 1.0
+    ) -> PrioritizedReplayBatch:
+        """Draw one stratified prioritized batch with importance weights."""
+
+        if isinstance(beta, bool) or not isinstance(beta, (int, float)):
+            raise ValueError("beta must be in the [0, 1] interval")
+        if not math.isfinite(float(beta)) or not 0.0 <= float(beta) <= 1.0:
+            raise ValueError("beta must be in the [0, 1] interval")
+        self._check_batch_size(batch_size)
+        total = self._tree.total
+        segment = total / batch_size
+        targets = np.asarray(
+            [
+                self._rng.uniform(segment * index, segment * (index + 1))
+                for index in range(batch_size)
+            ],
+            dtype=np.float64,
+        )
+        slots = self._tree.find(np.minimum(targets, np.nextafter(total, 0.0)))
+        if self._size < self.capacity:
+            # Only rounding at the top of the mass can reach an empty leaf.
+            slots = np.minimum(slots, self._size - 1)
+        probabilities = self._tree.values(slots) / total
+        largest = (self._size * self._tree.minimum / total) ** -beta
+        weights = (self._size * probabilities) ** -beta / largest
+        self.last_beta = float(beta)
+        self._last_weight_mean = float(weights.mean())
+        return PrioritizedReplayBatch(
+            self._states[slots],
+            self._actions[slots],
+            self._rewards[slots].astype(np.float32),
+            self._next_states[slots],
+            self._dones[slots],
+            slots,
+            weights.astype(np.float32),
+        )
+
+    def update_priorities(self, slots: np.ndarray, td_errors: np.ndarray) -> None:
+        """Re-prioritize sampled slots from their latest absolute TD errors."""
+
+        errors = np.abs(np.asarray(td_errors, dtype=np.float64))
+        if not np.isfinite(errors).all():
+            raise ValueError("td_errors must be finite")
+        priorities = (errors + self.epsilon) ** self.alpha
+        self._tree.update(np.asarray(slots, dtype=np.int64), priorities)
+        if priorities.size:
+            self._max_priority = max(self._max_priority, float(priorities.max()))
+        self.priority_updates += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self._tree.clear()
+        self._max_priority = 1.0
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = dict(super().stats())
+        size = self._size
+        total = self._tree.total
+        stats["priority"] = {
+            "alpha": self.alpha,
+            "beta": self.last_beta,
+            "total": total,
+            "mean": total / size if size else 0.0,
+            "max_seen": self._max_priority,
+            "min": self._tree.minimum if size else 0.0,
+            "updates": self.priority_updates,
+            "mean_weight": self._last_weight_mean,
+        }
+        return stats
@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 
 from .environment import DrivingEnv
-from .ml import DrivingDQNAgent
+from .ml import DrivingDQNAgent, PopulationInference
 
 if TYPE_CHECKING:
     from .learning_runtime import DrivingLearningSession
@@ -58,6 +58,7 @@ class PopulationRolloutManager:
         self.max_cars = min(max_cars, self.HARD_MAX_CARS)
         self._generation = -1
         self._rollouts: list[_PolicyRollout] = []
+        self._inference = PopulationInference()
         self.refresh(force=True)
 
     @property
@@ -124,22 +125,29 @@ class PopulationRolloutManager:
             else int(getattr(self.session.config, "seed", 0))
         )
         curriculum_state = source_env.curriculum_state()
+        template_env: DrivingEnv | None = None
         rollouts: list[_PolicyRollout] = []
         for index, (member_id, agent) in enumerate(policies):
-            env = DrivingEnv(
-                source_env.circuit,
-                build=source_env.vehicle.build,
-                seed=rollout_seed,
-                fixed_dt=source_env.fixed_dt,
-                max_steps=source_env.max_steps,
-                random_start_curriculum=source_env.random_start_curriculum,
-            )
-            # The constructor starts a fresh curriculum. Copy only its tiny
-            # readiness latch, then replay the shared seed so every displayed
-            # genome receives the same scenario as its peers.
-            env.load_curriculum_state(curriculum_state)
-            observation = env.reset(seed=rollout_seed)
-            q_values = agent.q_values(observation)
+            if template_env is None:
+                env = template_env = DrivingEnv(
+                    source_env.circuit,
+                    build=source_env.vehicle.build,
+                    seed=rollout_seed,
+                    fixed_dt=source_env.fixed_dt,
+                    max_steps=source_env.max_steps,
+                    random_start_curriculum=source_env.random_start_curriculum,
+                    decision_interval=source_env.decision_interval,
+                )
+                # The constructor starts a fresh curriculum. Copy only its tiny
+                # readiness latch, then replay the shared seed so every
+                # displayed genome receives the same scenario as its peers.
+                env.load_curriculum_state(curriculum_state)
+                observation = env.reset(seed=rollout_seed)
+            else:
+                # Peers start from the identical scenario; forking the first
+                # car before it moves skips a constructor, reset and ray fan.
+                env = template_env.fork()
+                observation = env.observation()
             rollouts.append(
                 _PolicyRollout(
                     index=index,
@@ -147,11 +155,12 @@ class PopulationRolloutManager:
                     agent=agent,
                     env=env,
                     observation=observation,
-                    action=int(np.argmax(q_values)),
-                    q_values=tuple(float(value) for value in q_values),
+                    action=0,
+                    q_values=(),
                 )
             )
 
+        self._decide(rollouts)
         self._rollouts = rollouts
         self._generation = generation
         return True
@@ -172,8 +181,7 @@ class PopulationRolloutManager:
                 # ``action`` is always the greedy decision for the observation
                 # currently stored on the rollout.  After moving, refresh the
                 # decision so every telemetry field describes the same instant.
-                action = rollout.action
-                result = rollout.env.step(action)
+                result = rollout.env.step(rollout.action)
                 rollout.observation = result.observation
                 if result.terminated or result.truncated:
                     # Restart only this car.  Other cars retain their position,
@@ -182,9 +190,20 @@ class PopulationRolloutManager:
                     # here would replay one identical spawn forever.
                     rollout.observation = rollout.env.reset()
                     rollout.episodes += 1
-                q_values = rollout.agent.q_values(rollout.observation)
-                rollout.action = int(np.argmax(q_values))
-                rollout.q_values = tuple(float(value) for value in q_values)
+            self._decide(self._rollouts)
+
+    def _decide(self, rollouts: list[_PolicyRollout]) -> None:
+        """Refresh every car's greedy decision with one batched forward pass."""
+
+        if not rollouts:
+            return
+        q_values = self._inference.q_values(
+            [rollout.agent for rollout in rollouts],
+            [rollout.observation for rollout in rollouts],
+        )
+        for rollout, values in zip(rollouts, q_values):
+            rollout.action = int(np.argmax(values))
+            rollout.q_values = tuple(float(value) for value in values)
 
     def telemetry(self, *, include_rays: bool = True) -> list[dict[str, Any]]:
         """Return JSON-friendly poses, policy decisions, and real sensor rays."""
@@ -4,6 +4,10 @@ The prior is intentionally a transparent action filter rather than a reward
 source. It reads only features already available to the learner, leaves clear
 road decisions unchanged, and reports both the neural policy's proposal and
 the action that actually reached the environment.
+
+:meth:`SensorClearancePolicy.decide_batch` applies the same rules to a whole
+``(rows, 16)`` observation array and returns one row of
+:data:`DECISION_DTYPE` per decision instead of a Python object.
 """
 
 from __future__ import annotations
@@ -13,9 +17,47 @@ from dataclasses import dataclass
 import math
 from typing import Any
 
+import numpy as np
+
 from .environment import DrivingAction, DrivingEnv
 
 
+# ``reason`` codes of DECISION_DTYPE, in the priority order of the rules.
+DECISION_REASONS = (
+    "clear_road",
+    "critical_brake",
+    "blocked_reverse_recovery",
+    "danger_steer_left",
+    "danger_steer_right",
+    "danger_steer_left_tiebreak",
+    "danger_steer_right_tiebreak",
+    "danger_equal_space_keep_steer",
+    "danger_equal_space_left_tiebreak",
+)
+
+# One batched decision.  Floats stay float64 so a row converts back to the
+# exact SensorClearanceDecision that ``decide`` returns for its observation.
+DECISION_DTYPE = np.dtype(
+    [
+        ("proposed_action", np.int8),
+        ("executed_action", np.int8),
+        ("intervened", np.bool_),
+        ("dangerous", np.bool_),
+        ("reason", np.uint8),
+        ("speed_ratio", np.float64),
+        ("forward_clearance", np.float64),
+        ("danger_threshold", np.float64),
+        ("boundary_threshold", np.float64),
+        ("projected_offset", np.float64),
+        ("left_open_space", np.float64),
+        ("right_open_space", np.float64),
+        ("left_utility", np.float64),
+        ("right_utility", np.float64),
+        ("ray_clearances", np.float64, (9,)),
+    ]
+)
+
+
 @dataclass(frozen=True, slots=True)
 class SensorClearanceDecision:
     """One immutable proposed-to-executed action decision."""
@@ -57,6 +99,29 @@ class SensorClearanceDecision:
             "ray_clearances": list(self.ray_clearances),
         }
 
+    @classmethod
+    def from_records(
+        cls, decisions: np.ndarray
+    ) -> tuple["SensorClearanceDecision", ...]:
+        """Rebuild the decisions stored in a :data:`DECISION_DTYPE` array."""
+
+        return tuple(
+            cls(
+                proposed,
+                executed,
+                intervened,
+                dangerous,
+                DECISION_REASONS[reason],
+                *metrics[:3],
+                SensorClearancePolicy.CRITICAL_CLEARANCE,
+                *metrics[3:],
+                tuple(rays),
+            )
+            for proposed, executed, intervened, dangerous, reason, *metrics, rays in (
+                decisions.tolist()
+            )
+        )
+
 
 class SensorClearancePolicy:
     """Look ahead with speed and steer toward the safest green corridor."""
@@ -79,9 +144,13 @@ class SensorClearancePolicy:
     BOUNDARY_THRESHOLD = 0.58
     BOUNDARY_SPEED_TIGHTENING = 0.08
     SCORE_EPSILON = 1e-9
+    # Below this many rows NumPy call overhead outweighs the per-row Python.
+    BATCH_MIN_ROWS = 8
     # Outer-to-inner weights. Near-forward visibility matters most, while all
     # four rays on each side still contribute to the chosen escape corridor.
     SIDE_WEIGHTS = (0.10, 0.18, 0.28, 0.44)
+    # Per-ray weights of the fan, left to right; the forward ray is unused.
+    _RAY_WEIGHTS = np.array((*SIDE_WEIGHTS, 0.0, *reversed(SIDE_WEIGHTS)))
 
     def __init__(self) -> None:
         expected = self.BASE_FEATURE_COUNT + self.RAY_COUNT
@@ -236,6 +305,159 @@ class SensorClearancePolicy:
 
     __call__ = decide
 
+    def decide_many(
+        self,
+        observations: Sequence[Sequence[float]] | np.ndarray,
+        proposed_actions: Sequence[int] | np.ndarray,
+    ) -> tuple[SensorClearanceDecision, ...]:
+        """Return :meth:`decide` for each row, batching large requests."""
+
+        if len(observations) != len(proposed_actions):
+            raise ValueError("proposed_actions must match the observations")
+        if len(observations) < self.BATCH_MIN_ROWS:
+            return tuple(
+                self.decide(observation, action)
+                for observation, action in zip(observations, proposed_actions)
+            )
+        return SensorClearanceDecision.from_records(
+            self.decide_batch(observations, proposed_actions)
+        )
+
+    def decide_batch(
+        self,
+        observations: Sequence[Sequence[float]] | np.ndarray,
+        proposed_actions: Sequence[int] | np.ndarray,
+    ) -> np.ndarray:
+        """Filter many proposals at once; return a :data:`DECISION_DTYPE` array.
+
+        Every row follows exactly the rules of :meth:`decide`, evaluated
+        column-wise over the batch, and converts back to the same decision
+        through :meth:`SensorClearanceDecision.from_records`.
+        """
+
+        values = self._validated_observations(observations)
+        proposed = np.asarray(proposed_actions)
+        if (
+            proposed.shape != (len(values),)
+            or proposed.dtype == np.bool_
+            or not np.issubdtype(proposed.dtype, np.integer)
+        ):
+            raise ValueError(
+                "proposed_actions must be one integer action per observation"
+            )
+        action_count = len(DrivingAction)
+        if len(proposed) and (proposed.min() < 0 or proposed.max() >= action_count):
+            raise ValueError(
+                f"proposed driving actions must be in [0, {action_count})"
+            )
+
+        decisions = np.empty(len(values), dtype=DECISION_DTYPE)
+        columns = values.T
+        speed_ratio = np.maximum(columns[0], 0.0)
+        lateral_speed = columns[2]
+        heading_error = columns[3]
+        track_offset = columns[4]
+        rays = values[:, -self.RAY_COUNT :]
+        middle = self.BASE_FEATURE_COUNT + self.RAY_COUNT // 2
+        front_fan = columns[middle - 1 : middle + 2]
+        forward_clearance = front_fan.min(axis=0)
+        front_fan_max = front_fan.max(axis=0)
+        # Weighted side sums accumulate in the order ``decide`` adds them, so
+        # every float rounds identically.  Green bonuses sum selected weights.
+        weighted = columns[self.BASE_FEATURE_COUNT :] * self._RAY_WEIGHTS[:, None]
+        green = columns[self.BASE_FEATURE_COUNT :] >= (
+            DrivingEnv.CLEARANCE_GREEN_THRESHOLD
+        )
+        green_weights = np.where(green, self._RAY_WEIGHTS[:, None], 0.0)
+        left_open_space = weighted[0] + weighted[1] + weighted[2] + weighted[3]
+        right_open_space = weighted[5] + weighted[6] + weighted[7] + weighted[8]
+        left_green = green_weights[0] + green_weights[1] + green_weights[2]
+        left_green += green_weights[3]
+        right_green = green_weights[5] + green_weights[6] + green_weights[7]
+        right_green += green_weights[8]
+        lookahead_speed = np.minimum(speed_ratio, 1.0)
+        projected_offset = (
+            track_offset
+            + heading_error
+            * (self.LOOKAHEAD_BASE + self.LOOKAHEAD_SPEED_GAIN * lookahead_speed)
+            + self.LATERAL_PROJECTION_WEIGHT * lateral_speed
+        )
+        left_utility = (
+            left_open_space
+            + self.GREEN_BONUS * left_green
+            + self.CENTERING_UTILITY_WEIGHT * np.maximum(0.0, projected_offset)
+        )
+        right_utility = (
+            right_open_space
+            + self.GREEN_BONUS * right_green
+            + self.CENTERING_UTILITY_WEIGHT * np.maximum(0.0, -projected_offset)
+        )
+        danger_threshold = (
+            self.DANGER_CLEARANCE + self.SPEED_LOOKAHEAD_GAIN * lookahead_speed
+        )
+        boundary_threshold = (
+            self.BOUNDARY_THRESHOLD
+            - self.BOUNDARY_SPEED_TIGHTENING * lookahead_speed
+        )
+        dangerous = (forward_clearance <= danger_threshold) | (
+            np.abs(projected_offset) >= boundary_threshold
+        )
+        critical = (front_fan_max <= self.CRITICAL_CLEARANCE) & (
+            speed_ratio >= self.BRAKE_SPEED_RATIO
+        )
+        # ``decide`` treats a centred car as aligned, but such a car never
+        # passes the release-offset test, so no special case is needed here.
+        inward_alignment = np.cos(
+            heading_error * math.pi + np.copysign(math.pi / 2.0, track_offset)
+        )
+        nose_faces_outward = (
+            np.abs(track_offset) >= self.RECOVERY_RELEASE_OFFSET
+        ) & (inward_alignment <= self.RECOVERY_INWARD_ALIGNMENT)
+        reverse_recovery = (
+            (front_fan_max <= self.RECOVERY_CLEARANCE) | nose_faces_outward
+        ) & (speed_ratio <= self.RECOVERY_SPEED_RATIO)
+
+        # Apply the rules of ``decide`` and _open_side_action from the lowest
+        # priority up, so each later rule overrides the earlier ones.  Reason
+        # codes index DECISION_REASONS.
+        steer_left = int(DrivingAction.STEER_LEFT)
+        steer_right = int(DrivingAction.STEER_RIGHT)
+        brake = int(DrivingAction.BRAKE)
+        left_near = columns[middle - 1]
+        right_near = columns[middle + 1]
+        rules = (
+            ((proposed == steer_left) | (proposed == steer_right), proposed, 7),
+            (right_near > left_near + self.SCORE_EPSILON, steer_right, 6),
+            (left_near > right_near + self.SCORE_EPSILON, steer_left, 5),
+            (right_utility > left_utility + self.SCORE_EPSILON, steer_right, 4),
+            (left_utility > right_utility + self.SCORE_EPSILON, steer_left, 3),
+            (reverse_recovery, brake, 2),
+            (critical, brake, 1),
+            (~dangerous, proposed, 0),
+        )
+        executed = np.full(len(values), steer_left)
+        reason = np.full(len(values), len(DECISION_REASONS) - 1)
+        for condition, action, code in rules:
+            executed = np.where(condition, action, executed)
+            reason[condition] = code
+
+        decisions["proposed_action"] = proposed
+        decisions["executed_action"] = executed
+        decisions["intervened"] = executed != proposed
+        decisions["dangerous"] = dangerous
+        decisions["reason"] = reason
+        decisions["speed_ratio"] = speed_ratio
+        decisions["forward_clearance"] = forward_clearance
+        decisions["danger_threshold"] = danger_threshold
+        decisions["boundary_threshold"] = boundary_threshold
+        decisions["projected_offset"] = projected_offset
+        decisions["left_open_space"] = left_open_space
+        decisions["right_open_space"] = right_open_space
+        decisions["left_utility"] = left_utility
+        decisions["right_utility"] = right_utility
+        decisions["ray_clearances"] = rays
+        return decisions
+
     def _open_side_action(
         self,
         proposed: DrivingAction,
@@ -281,6 +503,27 @@ class SensorClearancePolicy:
             raise ValueError("ray clearances must be normalized to [0, 1]")
         return values
 
+    @classmethod
+    def _validated_observations(
+        cls, observations: Sequence[Sequence[float]] | np.ndarray
+    ) -> np.ndarray:
+        expected = cls.BASE_FEATURE_COUNT + cls.RAY_COUNT
+        try:
+            values = np.asarray(observations, dtype=np.float64)
+        except (TypeError, ValueError) as error:
+            raise ValueError("observations must be a numeric array") from error
+        if values.ndim != 2 or values.shape[1] != expected:
+            raise ValueError(
+                f"observations must have shape (rows, {expected}) "
+                f"({cls.BASE_FEATURE_COUNT} base features and {cls.RAY_COUNT} rays)"
+            )
+        if not np.isfinite(values).all():
+            raise ValueError("observation values must be finite")
+        rays = values[:, -cls.RAY_COUNT :]
+        if ((rays < 0.0) | (rays > 1.0)).any():
+            raise ValueError("ray clearances must be normalized to [0, 1]")
+        return values
+
 
 @dataclass(slots=True)
 class SensorClearanceStats:
@@ -297,6 +540,19 @@ class SensorClearanceStats:
         self.interventions += int(decision.intervened)
         self.last = decision
 
+    def observe_batch(self, decisions: np.ndarray) -> None:
+        """Count a :data:`DECISION_DTYPE` array in order; its last row is kept."""
+
+        if not isinstance(decisions, np.ndarray) or decisions.dtype != DECISION_DTYPE:
+            raise TypeError("decisions must be a DECISION_DTYPE array")
+        if decisions.ndim != 1:
+            raise ValueError("decisions must be one-dimensional")
+        if not len(decisions):
+            return
+        self.decisions += len(decisions)
+        self.interventions += int(np.count_nonzero(decisions["intervened"]))
+        self.last = SensorClearanceDecision.from_records(decisions[-1:])[0]
+
     def snapshot(self) -> dict[str, Any]:
         last: Mapping[str, Any]
         if self.last is None:
@@ -348,6 +604,8 @@ class SensorClearanceStats:
 
 
 __all__ = (
+    "DECISION_DTYPE",
+    "DECISION_REASONS",
     "SensorClearanceDecision",
     "SensorClearancePolicy",
     "SensorClearanceStats",
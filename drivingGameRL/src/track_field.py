@@ -0,0 +1,452 @@
+"""Rasterized distance-to-centerline field for constant-time track queries."""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+from pathlib import Path
+import tempfile
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .terrain import TerrainKind
+
+if TYPE_CHECKING:
+    from .circuits import Circuit
+
+
+FIELD_FORMAT_VERSION = 2
+DEFAULT_CELL_SIZE = 4.0
+# Sensor fans reach 150 units beyond a car that can itself sit on the
+# barrier, so the default raster covers every sensor sample on every circuit.
+DEFAULT_MARGIN = 200.0
+_BUILD_CHUNK = 16_384
+
+
+class ClearanceField:
+    """Bilinear distance lookup with an exact band around query thresholds.
+
+    Distance to a polyline is 1-Lipschitz, so a bilinear blend of the four
+    surrounding grid nodes is within ``cell_size * sqrt(2)`` of the true
+    value.  Interpolated readings inside that band of a caller's threshold
+    are replaced by the exact segment distance, which makes every
+    ``reading >= threshold`` comparison identical to the exact geometry while
+    the vast majority of samples cost one table gather.
+
+    ``road_kind_codes`` stores, per grid cell, the road surface that every
+    point of the cell would project onto, or ``-1`` when a sector boundary or
+    competing segment makes the cell ambiguous.  ``candidate_ids`` indexes
+    ``candidate_table``, whose rows mark every segment that can be nearest
+    to some point of the cell; it is the spatial index behind
+    :meth:`Circuit.project`.
+    """
+
+    __slots__ = (
+        "cell_size",
+        "origin_x",
+        "origin_y",
+        "distances",
+        "road_kind_codes",
+        "candidate_ids",
+        "candidate_table",
+        "exact_band",
+        "_candidate_segments",
+        "_circuit",
+    )
+
+    def __init__(
+        self,
+        circuit: "Circuit",
+        *,
+        cell_size: float,
+        origin_x: float,
+        origin_y: float,
+        distances: np.ndarray,
+        road_kind_codes: np.ndarray,
+        candidate_ids: np.ndarray,
+        candidate_table: np.ndarray,
+    ):
+        if not math.isfinite(cell_size) or cell_size <= 0.0:
+            raise ValueError("cell_size must be finite and positive")
+        if distances.ndim != 2 or min(distances.shape) < 2:
+            raise ValueError("distance grid must be two-dimensional")
+        if road_kind_codes.shape != (
+            distances.shape[0] - 1,
+            distances.shape[1] - 1,
+        ):
+            raise ValueError("road kind grid must have one entry per cell")
+        if candidate_ids.shape != road_kind_codes.shape:
+            raise ValueError("candidate grid must have one entry per cell")
+        if (
+            candidate_table.ndim != 2
+            or candidate_table.shape[1] != len(circuit.points)
+            or not np.all(candidate_table.any(axis=1))
+            or np.any(candidate_ids < 0)
+            or np.any(candidate_ids >= candidate_table.shape[0])
+        ):
+            raise ValueError("candidate table must list segments for every cell")
+        self._circuit = circuit
+        self.cell_size = float(cell_size)
+        self.origin_x = float(origin_x)
+        self.origin_y = float(origin_y)
+        self.distances = distances
+        self.road_kind_codes = road_kind_codes
+        self.candidate_ids = candidate_ids
+        self.candidate_table = candidate_table
+        self._candidate_segments = tuple(
+            tuple(int(index) for index in np.flatnonzero(row))
+            for row in candidate_table
+        )
+        # sqrt(2) bounds the interpolation error; the extra slack absorbs
+        # floating-point rounding in both the raster and the blend.
+        self.exact_band = self.cell_size * math.sqrt(2.0) + 1e-6
+        for array in (
+            self.distances,
+            self.road_kind_codes,
+            self.candidate_ids,
+            self.candidate_table,
+        ):
+            array.setflags(write=False)
+
+    @classmethod
+    def build(
+        cls,
+        circuit: "Circuit",
+        *,
+        cell_size: float = DEFAULT_CELL_SIZE,
+        margin: float = DEFAULT_MARGIN,
+        cache_dir: str | os.PathLike[str] | None = None,
+    ) -> "ClearanceField":
+        """Rasterize *circuit*, reusing a compatible on-disk cache if present."""
+
+        if not math.isfinite(cell_size) or cell_size <= 0.0:
+            raise ValueError("cell_size must be finite and positive")
+        if not math.isfinite(margin) or margin < 0.0:
+            raise ValueError("margin must be finite and non-negative")
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir) / (
+                f"{circuit.slug}-{cls.geometry_digest(circuit, cell_size, margin)}.npz"
+            )
+            loaded = cls._load(circuit, cache_path, cell_size)
+            if loaded is not None:
+                return loaded
+
+        xs = [point.x for point in circuit.points]
+        ys = [point.y for point in circuit.points]
+        origin_x = min(xs) - margin
+        origin_y = min(ys) - margin
+        columns = int(math.ceil((max(xs) + margin - origin_x) / cell_size)) + 1
+        rows = int(math.ceil((max(ys) + margin - origin_y) / cell_size)) + 1
+        grid_x = origin_x + np.arange(columns, dtype=np.float64) * cell_size
+        grid_y = origin_y + np.arange(rows, dtype=np.float64) * cell_size
+        nodes = np.stack(np.meshgrid(grid_x, grid_y), axis=-1).reshape(-1, 2)
+        distances = np.concatenate(
+            [
+                circuit.distances_to_centerline_array(
+                    nodes[start : start + _BUILD_CHUNK]
+                )
+                for start in range(0, nodes.shape[0], _BUILD_CHUNK)
+            ]
+        ).reshape(rows, columns)
+        centers_x = grid_x[:-1] + cell_size * 0.5
+        centers_y = grid_y[:-1] + cell_size * 0.5
+        codes, candidate_ids, candidate_table = cls._classify_cells(
+            circuit, centers_x, centers_y, cell_size
+        )
+        field = cls(
+            circuit,
+            cell_size=cell_size,
+            origin_x=origin_x,
+            origin_y=origin_y,
+            distances=distances,
+            road_kind_codes=codes,
+            candidate_ids=candidate_ids,
+            candidate_table=candidate_table,
+        )
+        if cache_path is not None:
+            field.save(cache_path)
+        return field
+
+    @staticmethod
+    def geometry_digest(circuit: "Circuit", cell_size: float, margin: float) -> str:
+        """Stable key covering every input that changes the raster."""
+
+        description = repr(
+            (
+                FIELD_FORMAT_VERSION,
+                tuple((point.x, point.y) for point in circuit.points),
+                circuit.track_width,
+                tuple(
+                    (sector.start, sector.end, sector.kind.value)
+                    for sector in circuit.sectors
+                ),
+                float(cell_size),
+                float(margin),
+            )
+        )
+        return hashlib.sha256(description.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def _classify_cells(
+        circuit: "Circuit",
+        centers_x: np.ndarray,
+        centers_y: np.ndarray,
+        cell_size: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find each cell's candidate segments and certain road surface.
+
+        A point of the cell can only project onto a segment whose distance
+        from the cell center is within one cell diagonal of the nearest
+        segment's; those segments are the cell's projection candidates.
+        Projection onto one segment is affine before clamping, so each
+        candidate's progress range over the cell is spanned by the four
+        corners.  A cell's surface is certain when all candidate ranges avoid
+        every sector boundary and agree on the surface kind.
+        """
+
+        kind_codes = {kind: code for code, kind in enumerate(TerrainKind)}
+        boundaries = sorted(
+            {
+                value
+                for sector in circuit.sectors
+                for value in (sector.start, sector.end)
+            }
+        )
+        (
+            start_x,
+            start_y,
+            segment_x,
+            segment_y,
+            length_squared,
+            _tangent_x,
+            _tangent_y,
+            traversed,
+            segment_length,
+        ) = circuit._projection_arrays
+        total = circuit.length
+        half = cell_size * 0.5
+        diagonal = cell_size * math.sqrt(2.0)
+        slack = 1e-9 * max(1.0, total)
+        center_x = np.tile(centers_x, centers_y.size)[:, None]
+        center_y = np.repeat(centers_y, centers_x.size)[:, None]
+
+        def along_at(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+            along = ((x - start_x) * segment_x + (y - start_y) * segment_y) / (
+                length_squared
+            )
+            return np.clip(along, 0.0, 1.0, out=along)
+
+        along = along_at(center_x, center_y)
+        delta_x = center_x - (start_x + segment_x * along)
+        delta_y = center_y - (start_y + segment_y * along)
+        distance = np.sqrt(delta_x * delta_x + delta_y * delta_y)
+        candidates = distance <= (
+            distance.min(axis=1, keepdims=True) + diagonal + 1e-6
+        )
+        corners = np.stack(
+            [
+                along_at(center_x + offset_x, center_y + offset_y)
+                for offset_x, offset_y in (
+                    (-half, -half),
+                    (half, -half),
+                    (-half, half),
+                    (half, half),
+                )
+            ]
+        )
+        low = (traversed + corners.min(axis=0) * segment_length - slack) / total
+        high = (traversed + corners.max(axis=0) * segment_length + slack) / total
+        ambiguous = (low < 0.0) | (high >= 1.0)
+        for boundary in boundaries:
+            ambiguous |= (low < boundary) & (boundary <= high)
+        kinds = np.full(low.shape, kind_codes[TerrainKind.ASPHALT], dtype=np.int8)
+        # Sectors never overlap, so reverse writes keep first-match order.
+        for sector in reversed(circuit.sectors):
+            if sector.start < sector.end:
+                inside = (sector.start <= low) & (low < sector.end)
+            else:
+                inside = (low >= sector.start) | (low < sector.end)
+            kinds[inside] = kind_codes[sector.kind]
+        ambiguous &= candidates
+        first_kind = np.where(candidates, kinds, np.int8(127)).min(axis=1)
+        last_kind = np.where(candidates, kinds, np.int8(-1)).max(axis=1)
+        certain = ~ambiguous.any(axis=1) & (first_kind == last_kind)
+        codes = np.where(certain, first_kind, np.int8(-1)).astype(np.int8)
+        candidate_table, candidate_ids = np.unique(
+            candidates, axis=0, return_inverse=True
+        )
+        shape = (centers_y.size, centers_x.size)
+        return (
+            codes.reshape(shape),
+            candidate_ids.astype(np.int32).reshape(shape),
+            candidate_table,
+        )
+
+    @classmethod
+    def _load(
+        cls, circuit: "Circuit", path: Path, cell_size: float
+    ) -> "ClearanceField | None":
+        try:
+            with np.load(path, allow_pickle=False) as payload:
+                header = payload["header"]
+                distances = np.array(payload["distances"], dtype=np.float64)
+                codes = np.array(payload["road_kind_codes"], dtype=np.int8)
+                candidate_ids = np.array(payload["candidate_ids"], dtype=np.int32)
+                candidate_table = np.array(payload["candidate_table"], dtype=bool)
+        except (OSError, KeyError, ValueError):
+            return None
+        if header.shape != (4,) or int(header[0]) != FIELD_FORMAT_VERSION:
+            return None
+        if float(header[1]) != float(cell_size):
+            return None
+        try:
+            return cls(
+                circuit,
+                cell_size=float(header[1]),
+                origin_x=float(header[2]),
+                origin_y=float(header[3]),
+                distances=distances,
+                road_kind_codes=codes,
+                candidate_ids=candidate_ids,
+                candidate_table=candidate_table,
+            )
+        except ValueError:
+            return None
+
+    def save(self, path: str | os.PathLike[str]) -> Path:
+        """Atomically write the raster so later processes skip the build."""
+
+        destination = Path(path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        header = np.asarray(
+            (FIELD_FORMAT_VERSION, self.cell_size, self.origin_x, self.origin_y),
+            dtype=np.float64,
+        )
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f".{destination.name}.", suffix=".tmp", dir=destination.parent
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                np.savez(
+                    handle,
+                    header=header,
+                    distances=self.distances,
+                    road_kind_codes=self.road_kind_codes,
+                    candidate_ids=self.candidate_ids,
+                    candidate_table=self.candidate_table,
+                )
+            os.replace(temporary, destination)
+        except BaseException:
+            try:
+                os.unlink(temporary)
+            except FileNotFoundError:
+                pass
+            raise
+        return destination
+
+    def _cells(self, points: np.ndarray) -> tuple[np.ndarray, ...]:
+        grid_x = (points[:, 0] - self.origin_x) / self.cell_size
+        grid_y = (points[:, 1] - self.origin_y) / self.cell_size
+        column = np.floor(grid_x)
+        row = np.floor(grid_y)
+        rows, columns = self.distances.shape
+        inside = (
+            (column >= 0.0)
+            & (row >= 0.0)
+            & (column < columns - 1)
+            & (row < rows - 1)
+        )
+        column = np.where(inside, column, 0.0).astype(np.int64)
+        row = np.where(inside, row, 0.0).astype(np.int64)
+        return inside, row, column, grid_x - column, grid_y - row
+
+    def distances_at(self, points: np.ndarray, threshold: float) -> np.ndarray:
+        """Return centerline distances whose comparison with *threshold* is exact.
+
+        Readings farther than :attr:`exact_band` from *threshold*, inside the
+        raster, are bilinear estimates; every other reading is the exact
+        segment distance used by :meth:`Circuit.project`.
+        """
+
+        values = np.asarray(points, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != 2:
+            raise ValueError("Projected positions must have shape (N, 2)")
+        if not np.all(np.isfinite(values)):
+            raise ValueError("Projected positions must be finite")
+        inside, row, column, fraction_x, fraction_y = self._cells(values)
+        grid = self.distances
+        top = grid[row, column] + (
+            grid[row, column + 1] - grid[row, column]
+        ) * fraction_x
+        bottom = grid[row + 1, column] + (
+            grid[row + 1, column + 1] - grid[row + 1, column]
+        ) * fraction_x
+        estimate = top + (bottom - top) * fraction_y
+        uncertain = ~inside | (np.abs(estimate - threshold) <= self.exact_band)
+        if np.any(uncertain):
+            estimate[uncertain] = self._circuit.distances_to_centerline_array(
+                values[uncertain]
+            )
+        return estimate
+
+    def road_kind_code_at(self, x: float, y: float) -> int:
+        """Return the certain road-surface code for a point, or ``-1``."""
+
+        column = math.floor((x - self.origin_x) / self.cell_size)
+        row = math.floor((y - self.origin_y) / self.cell_size)
+        rows, columns = self.road_kind_codes.shape
+        if not (0 <= row < rows and 0 <= column < columns):
+            return -1
+        return int(self.road_kind_codes[row, column])
+
+    def candidate_segments_at(self, x: float, y: float) -> tuple[int, ...] | None:
+        """Return ascending segment indices that can be nearest to a point.
+
+        ``None`` means the point lies outside the raster and every segment
+        must be considered.
+        """
+
+        column = math.floor((x - self.origin_x) / self.cell_size)
+        row = math.floor((y - self.origin_y) / self.cell_size)
+        rows, columns = self.candidate_ids.shape
+        if not (0 <= row < rows and 0 <= column < columns):
+            return None
+        return self._candidate_segments[self.candidate_ids[row, column]]
+
+    def distance_at(self, x: float, y: float, threshold: float) -> float:
+        """Scalar :meth:`distances_at` for a single hot-path query."""
+
+        grid_x = (x - self.origin_x) / self.cell_size
+        grid_y = (y - self.origin_y) / self.cell_size
+        column = math.floor(grid_x)
+        row = math.floor(grid_y)
+        rows, columns = self.distances.shape
+        if 0 <= column < columns - 1 and 0 <= row < rows - 1:
+            fraction_x = grid_x - column
+            fraction_y = grid_y - row
+            grid = self.distances
+            top_left = float(grid[row, column])
+            top_right = float(grid[row, column + 1])
+            bottom_left = float(grid[row + 1, column])
+            bottom_right = float(grid[row + 1, column + 1])
+            top = top_left + (top_right - top_left) * fraction_x
+            bottom = bottom_left + (bottom_right - bottom_left) * fraction_x
+            estimate = top + (bottom - top) * fraction_y
+            if abs(estimate - threshold) > self.exact_band:
+                return estimate
+        return float(
+            self._circuit.distances_to_centerline_array(
+                np.asarray(((x, y),), dtype=np.float64)
+            )[0]
+        )
+
+
+__all__ = (
+    "ClearanceField",
+    "DEFAULT_CELL_SIZE",
+    "DEFAULT_MARGIN",
+    "FIELD_FORMAT_VERSION",
+)
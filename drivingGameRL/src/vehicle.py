@@ -67,6 +67,12 @@ class DriverControls:
     brake: float = 0.0
 
     def clamped(self) -> "DriverControls":
+        throttle, steering, brake = self.clamped_values()
+        return DriverControls(throttle=throttle, steering=steering, brake=brake)
+
+    def clamped_values(self) -> tuple[float, float, float]:
+        """Return clamped ``(throttle, steering, brake)`` without a new instance."""
+
         try:
             finite = all(
                 math.isfinite(value)
@@ -76,24 +82,103 @@ class DriverControls:
             raise ValueError("Driver controls must be finite numbers") from error
         if not finite:
             raise ValueError("Driver controls must be finite numbers")
-        return DriverControls(
-            throttle=clamp(self.throttle, -1.0, 1.0),
-            steering=clamp(self.steering, -1.0, 1.0),
-            brake=clamp(self.brake, 0.0, 1.0),
+        return (
+            clamp(self.throttle, -1.0, 1.0),
+            clamp(self.steering, -1.0, 1.0),
+            clamp(self.brake, 0.0, 1.0),
         )
 
 
-@dataclass(slots=True)
 class VehicleState:
-    position: Vec2 = ZERO
-    velocity: Vec2 = ZERO
-    heading: float = 0.0
-    steering_angle: float = 0.0
-    damage: float = 0.0
+    """Mutable vehicle pose stored as plain floats.
+
+    The physics kernel updates the scalar slots in place every tick; the
+    ``position`` and ``velocity`` properties expose the same values as
+    immutable :class:`Vec2` views for rendering, sensors and tests.
+    """
+
+    __slots__ = ("x", "y", "vx", "vy", "heading", "steering_angle", "damage")
+
+    def __init__(
+        self,
+        position: Vec2 = ZERO,
+        velocity: Vec2 = ZERO,
+        heading: float = 0.0,
+        steering_angle: float = 0.0,
+        damage: float = 0.0,
+    ) -> None:
+        self.x = position.x
+        self.y = position.y
+        self.vx = velocity.x
+        self.vy = velocity.y
+        self.heading = heading
+        self.steering_angle = steering_angle
+        self.damage = damage
+
+    @property
+    def position(self) -> Vec2:
+        return Vec2(self.x, self.y)
+
+    @position.setter
+    def position(self, value: Vec2) -> None:
+        self.x = value.x
+        self.y = value.y
+
+    @property
+    def velocity(self) -> Vec2:
+        return Vec2(self.vx, self.vy)
+
+    @velocity.setter
+    def velocity(self, value: Vec2) -> None:
+        self.vx = value.x
+        self.vy = value.y
 
     @property
     def speed(self) -> float:
-        return self.velocity.length()
+        return math.sqrt(self.vx * self.vx + self.vy * self.vy)
+
+    def values(self) -> tuple[float, ...]:
+        """Return the scalar slots in constructor order, position first."""
+
+        return (
+            self.x,
+            self.y,
+            self.vx,
+            self.vy,
+            self.heading,
+            self.steering_angle,
+            self.damage,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not VehicleState:
+            return NotImplemented
+        return self.values() == other.values()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @classmethod
+    def from_values(cls, values: tuple[float, ...]) -> "VehicleState":
+        """Rebuild a state from the tuple returned by :meth:`values`."""
+
+        state = cls()
+        (
+            state.x,
+            state.y,
+            state.vx,
+            state.vy,
+            state.heading,
+            state.steering_angle,
+            state.damage,
+        ) = values
+        return state
+
+    def __repr__(self) -> str:
+        return (
+            f"VehicleState(position={self.position!r}, velocity={self.velocity!r}, "
+            f"heading={self.heading!r}, steering_angle={self.steering_angle!r}, "
+            f"damage={self.damage!r})"
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -108,7 +193,14 @@ class VehicleTelemetry:
 
 
 class Vehicle:
-    """A compact bicycle-inspired model designed for stable fixed steps."""
+    """A compact bicycle-inspired model designed for stable fixed steps.
+
+    ``step`` and ``resolve_collision`` work on the scalar slots of
+    :class:`VehicleState` and keep the motion telemetry as plain attributes.
+    The arithmetic follows the original ``Vec2`` formulation operation by
+    operation, so trajectories are bit-for-bit identical; the immutable
+    :class:`VehicleTelemetry` record is only built when someone reads it.
+    """
 
     LENGTH = 34.0
     WIDTH = 18.0
@@ -116,68 +208,110 @@ class Vehicle:
     def __init__(self, build: CarBuild | None = None):
         self.build = build or CarBuild()
         self.state = VehicleState()
-        self.last_telemetry = VehicleTelemetry(
-            0.0, 0.0, 0.0, 0.0, 0.0, 0.0, self.build.max_speed
-        )
+        self._clear_telemetry()
 
     def reset(self, position: Vec2, heading: float) -> VehicleState:
         if not all(math.isfinite(value) for value in (position.x, position.y, heading)):
             raise ValueError("Vehicle reset pose must be finite")
         self.state = VehicleState(position=position, heading=wrap_angle(heading))
-        self.last_telemetry = VehicleTelemetry(
-            0.0, 0.0, 0.0, 0.0, 0.0, 0.0, self.build.max_speed
-        )
+        self._clear_telemetry()
         return self.state
 
     def set_build(self, build: CarBuild) -> None:
         self.build = build
 
+    @property
+    def last_telemetry(self) -> VehicleTelemetry:
+        telemetry = self._telemetry
+        if telemetry is None:
+            telemetry = VehicleTelemetry(
+                speed=self._speed,
+                longitudinal_speed=self._longitudinal_speed,
+                lateral_speed=self._lateral_speed,
+                slip_angle=self._slip_angle,
+                acceleration=self._acceleration,
+                effective_grip=self._effective_grip,
+                max_speed=self._max_speed,
+            )
+            self._telemetry = telemetry
+        return telemetry
+
+    def load_telemetry(self, telemetry: VehicleTelemetry) -> None:
+        """Adopt a previously captured telemetry record, e.g. from a snapshot."""
+
+        self._speed = telemetry.speed
+        self._longitudinal_speed = telemetry.longitudinal_speed
+        self._lateral_speed = telemetry.lateral_speed
+        self._slip_angle = telemetry.slip_angle
+        self._acceleration = telemetry.acceleration
+        self._effective_grip = telemetry.effective_grip
+        self._max_speed = telemetry.max_speed
+        self._telemetry = telemetry
+
+    def _clear_telemetry(self) -> None:
+        self._speed = 0.0
+        self._longitudinal_speed = 0.0
+        self._lateral_speed = 0.0
+        self._slip_angle = 0.0
+        self._acceleration = 0.0
+        self._effective_grip = 0.0
+        self._max_speed = self.build.max_speed
+        self._telemetry: VehicleTelemetry | None = None
+
     def step(
         self, controls: DriverControls, terrain: Terrain, dt: float
     ) -> VehicleTelemetry:
+        self.advance(controls, terrain, dt)
+        return self.last_telemetry
+
+    def advance(self, controls: DriverControls, terrain: Terrain, dt: float) -> None:
+        """Integrate one tick in place without materializing telemetry."""
+
         if not 0.0 < dt <= 0.1:
             raise ValueError("Vehicle time step must be in the (0, 0.1] interval")
-        controls = controls.clamped()
+        throttle, steering, brake = controls.clamped_values()
         state = self.state
-        forward = Vec2.from_angle(state.heading)
-        right = forward.perpendicular()
-        longitudinal = state.velocity.dot(forward)
-        lateral = state.velocity.dot(right)
-        effective_grip = terrain.grip * self.build.grip_multiplier
-
-        target_steering = controls.steering * self.build.steering_rate
-        steering_blend = min(1.0, self.build.steering_response * dt)
+        build = self.build
+        max_speed = build.max_speed
+        stability = build.stability
+        vx = state.vx
+        vy = state.vy
+        cos_heading = math.cos(state.heading)
+        sin_heading = math.sin(state.heading)
+        longitudinal = vx * cos_heading + vy * sin_heading
+        effective_grip = terrain.grip * build.grip_multiplier
+
+        target_steering = steering * build.steering_rate
+        steering_blend = min(1.0, build.steering_response * dt)
         state.steering_angle += (
             target_steering - state.steering_angle
         ) * steering_blend
 
-        speed_ratio = clamp(
-            abs(longitudinal) / max(1.0, self.build.max_speed), 0.0, 1.0
-        )
+        speed_ratio = clamp(abs(longitudinal) / max(1.0, max_speed), 0.0, 1.0)
         direction_sign = -1.0 if longitudinal < -1.0 else 1.0
         motion_factor = clamp(abs(longitudinal) / 35.0, 0.0, 1.0)
         high_speed_stability = 1.0 - 0.35 * speed_ratio
-        yaw_scale = (
-            motion_factor * high_speed_stability * effective_grip * self.build.stability
-        )
+        yaw_scale = motion_factor * high_speed_stability * effective_grip * stability
         state.heading = wrap_angle(
             state.heading + state.steering_angle * yaw_scale * direction_sign * dt
         )
 
-        forward = Vec2.from_angle(state.heading)
-        right = forward.perpendicular()
-        longitudinal = state.velocity.dot(forward)
-        lateral = state.velocity.dot(right)
+        cos_heading = math.cos(state.heading)
+        sin_heading = math.sin(state.heading)
+        # The right-hand axis is the forward axis rotated by +90 degrees.
+        right_x = -sin_heading
+        longitudinal = vx * cos_heading + vy * sin_heading
+        lateral = vx * right_x + vy * cos_heading
 
         engine_acceleration = (
-            self.build.acceleration
+            build.acceleration
             * terrain.engine_efficiency
             * min(1.0, 0.50 + effective_grip * 0.65)
-            * controls.throttle
+            * throttle
         )
         brake_acceleration = 0.0
-        if controls.brake > 0.0 and abs(longitudinal) > 0.05:
-            brake_acceleration = -math.copysign(190.0 * controls.brake, longitudinal)
+        if brake > 0.0 and abs(longitudinal) > 0.05:
+            brake_acceleration = -math.copysign(190.0 * brake, longitudinal)
 
         aerodynamic_drag = 0.0018 * longitudinal * abs(longitudinal)
         rolling_drag = terrain.rolling_resistance * 115.0
@@ -190,43 +324,41 @@ class Vehicle:
         )
         next_longitudinal = longitudinal + acceleration * dt
         if longitudinal * next_longitudinal < 0.0 and (
-            controls.brake > 0.0 or controls.throttle == 0.0
+            brake > 0.0 or throttle == 0.0
         ):
             next_longitudinal = 0.0
-        reverse_limit = self.build.max_speed * 0.34
-        next_longitudinal = clamp(
-            next_longitudinal, -reverse_limit, self.build.max_speed
-        )
+        reverse_limit = max_speed * 0.34
+        next_longitudinal = clamp(next_longitudinal, -reverse_limit, max_speed)
 
         # Tires and suspension dissipate lateral movement.  Low grip leaves a
         # visible, measurable slip angle rather than snapping onto the heading.
-        lateral_recovery = 3.4 * effective_grip * self.build.stability
+        lateral_recovery = 3.4 * effective_grip * stability
         next_lateral = lateral * max(0.0, 1.0 - lateral_recovery * dt)
-        state.velocity = forward * next_longitudinal + right * next_lateral
-        state.position = state.position + state.velocity * dt
-
-        values = (
-            state.position.x,
-            state.position.y,
-            state.velocity.x,
-            state.velocity.y,
-            state.heading,
-            state.steering_angle,
-        )
-        if not all(math.isfinite(value) for value in values):
+        vx = cos_heading * next_longitudinal + right_x * next_lateral
+        vy = sin_heading * next_longitudinal + cos_heading * next_lateral
+        state.vx = vx
+        state.vy = vy
+        state.x = state.x + vx * dt
+        state.y = state.y + vy * dt
+
+        if not (
+            math.isfinite(state.x)
+            and math.isfinite(state.y)
+            and math.isfinite(vx)
+            and math.isfinite(vy)
+            and math.isfinite(state.heading)
+            and math.isfinite(state.steering_angle)
+        ):
             raise FloatingPointError("Vehicle physics produced a non-finite state")
 
-        slip_angle = math.atan2(next_lateral, max(1.0, abs(next_longitudinal)))
-        self.last_telemetry = VehicleTelemetry(
-            speed=state.velocity.length(),
-            longitudinal_speed=next_longitudinal,
-            lateral_speed=next_lateral,
-            slip_angle=slip_angle,
-            acceleration=acceleration,
-            effective_grip=effective_grip,
-            max_speed=self.build.max_speed,
-        )
-        return self.last_telemetry
+        self._speed = math.sqrt(vx * vx + vy * vy)
+        self._longitudinal_speed = next_longitudinal
+        self._lateral_speed = next_lateral
+        self._slip_angle = math.atan2(next_lateral, max(1.0, abs(next_longitudinal)))
+        self._acceleration = acceleration
+        self._effective_grip = effective_grip
+        self._max_speed = max_speed
+        self._telemetry = None
 
     def resolve_collision(self, track_point: Vec2, collision_radius: float) -> float:
         """Clamp to a track barrier and reflect outward velocity.
@@ -235,47 +367,48 @@ class Vehicle:
         rendering state.
         """
 
-        delta = self.state.position - track_point
-        distance = delta.length()
+        state = self.state
+        delta_x = state.x - track_point.x
+        delta_y = state.y - track_point.y
+        distance = math.sqrt(delta_x * delta_x + delta_y * delta_y)
         if distance <= collision_radius:
             return 0.0
-        outward = delta.normalized()
-        self.state.position = track_point + outward * collision_radius
-        outward_speed = self.state.velocity.dot(outward)
+        outward_x = delta_x / distance
+        outward_y = delta_y / distance
+        state.x = track_point.x + outward_x * collision_radius
+        state.y = track_point.y + outward_y * collision_radius
+        outward_speed = state.vx * outward_x + state.vy * outward_y
         if outward_speed <= 0.0:
             return 0.0
         impact_speed = outward_speed
-        self.state.velocity = self.state.velocity - outward * (1.28 * outward_speed)
-        self.state.velocity = self.state.velocity * 0.68
+        reflection = 1.28 * outward_speed
+        state.vx = (state.vx - outward_x * reflection) * 0.68
+        state.vy = (state.vy - outward_y * reflection) * 0.68
         self._refresh_motion_telemetry()
-        values = (
-            self.state.position.x,
-            self.state.position.y,
-            self.state.velocity.x,
-            self.state.velocity.y,
-            self.state.damage,
-        )
-        if not all(math.isfinite(value) for value in values):
+        if not (
+            math.isfinite(state.x)
+            and math.isfinite(state.y)
+            and math.isfinite(state.vx)
+            and math.isfinite(state.vy)
+            and math.isfinite(state.damage)
+        ):
             raise FloatingPointError("Collision resolution produced a non-finite state")
         return impact_speed
 
     def _refresh_motion_telemetry(self) -> None:
         """Synchronize observable motion after an instantaneous impulse."""
 
-        forward = Vec2.from_angle(self.state.heading)
-        right = forward.perpendicular()
-        longitudinal = self.state.velocity.dot(forward)
-        lateral = self.state.velocity.dot(right)
-        previous = self.last_telemetry
-        self.last_telemetry = VehicleTelemetry(
-            speed=self.state.speed,
-            longitudinal_speed=longitudinal,
-            lateral_speed=lateral,
-            slip_angle=math.atan2(lateral, max(1.0, abs(longitudinal))),
-            acceleration=previous.acceleration,
-            effective_grip=previous.effective_grip,
-            max_speed=self.build.max_speed,
-        )
+        state = self.state
+        cos_heading = math.cos(state.heading)
+        sin_heading = math.sin(state.heading)
+        longitudinal = state.vx * cos_heading + state.vy * sin_heading
+        lateral = state.vx * -sin_heading + state.vy * cos_heading
+        self._speed = state.speed
+        self._longitudinal_speed = longitudinal
+        self._lateral_speed = lateral
+        self._slip_angle = math.atan2(lateral, max(1.0, abs(longitudinal)))
+        self._max_speed = self.build.max_speed
+        self._telemetry = None
 
     def apply_impact_damage(self, impact_speed: float) -> None:
         """Apply damage once for a new contact episode."""
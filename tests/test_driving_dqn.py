@@ -1,8 +1,10 @@
 """Deterministic CPU coverage for the Driving Lab DQN stack."""
 
+from copy import deepcopy
 from pathlib import Path
 import tempfile
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 import torch
@@ -11,7 +13,11 @@ from drivingGameRL.src.ml import (
     DQNConfig,
     DrivingDQNAgent,
     DrivingQNetwork,
+    PopulationInference,
+    PopulationLearner,
+    PrioritizedReplayBuffer,
     ReplayBuffer,
+    SumTree,
     default_population_dqn_config,
 )
 
@@ -102,14 +108,98 @@ class DrivingQNetworkTests(unittest.TestCase):
         snapshot = network.snapshot([3.0, 1.0])
 
         self.assertEqual(snapshot["architecture"], [2, 2, 2])
-        self.assertEqual(snapshot["layers"][1]["pre_activations"], [2.0, 3.0])
-        self.assertEqual(snapshot["layers"][1]["activations"], [2.0, 3.0])
+        self.assertEqual(snapshot["layers"][1]["pre_activations"].tolist(), [2.0, 3.0])
+        self.assertEqual(snapshot["layers"][1]["activations"].tolist(), [2.0, 3.0])
         self.assertEqual(snapshot["q_values"], [4.0, -3.0])
         self.assertEqual(
-            snapshot["layers"][2]["weights"],
+            snapshot["layers"][2]["weights"].tolist(),
             network.layers[1].weight.detach().tolist(),
         )
 
+    def test_sampled_snapshot_slices_exact_weights_and_reuses_them_per_version(self):
+        network = DrivingQNetwork(16, 5, (32,))
+        observation = np.linspace(-1.0, 1.0, 16, dtype=np.float32)
+        full = network.snapshot(observation)
+
+        sampled = network.snapshot(observation, max_neurons_per_layer=8)
+
+        hidden = sampled["layers"][1]
+        self.assertEqual([layer["size"] for layer in sampled["layers"]], [8, 8, 5])
+        self.assertEqual(hidden["full_size"], 32)
+        self.assertTrue(hidden["sampled"])
+        self.assertFalse(sampled["layers"][2]["sampled"])
+        rows = hidden["selected_indices"]
+        columns = sampled["layers"][0]["selected_indices"]
+        np.testing.assert_array_equal(
+            hidden["weights"], full["layers"][1]["weights"][np.ix_(rows, columns)]
+        )
+        np.testing.assert_array_equal(
+            hidden["activations"], full["layers"][1]["activations"][rows]
+        )
+        self.assertEqual(sampled["q_values"], full["q_values"])
+        self.assertFalse(hidden["weights"].flags.writeable)
+
+        again = network.snapshot(-observation, max_neurons_per_layer=8)
+        self.assertIs(again["layers"][1]["weights"], hidden["weights"])
+        with torch.no_grad():
+            network.layers[0].weight.mul_(2.0)
+        updated = network.snapshot(observation, max_neurons_per_layer=8)
+        self.assertNotEqual(updated["parameter_version"], sampled["parameter_version"])
+        np.testing.assert_allclose(
+            updated["layers"][1]["weights"], hidden["weights"] * 2.0
+        )
+        with self.assertRaisesRegex(ValueError, "max_neurons_per_layer"):
+            network.snapshot(observation, max_neurons_per_layer=0)
+
+
+    def test_parameters_are_views_of_one_flat_genome(self):
+        network = DrivingQNetwork(6, 3, (4,))
+        genome = network.genome
+        self.assertEqual(genome.dtype, torch.float32)
+        self.assertEqual(genome.numel(), network.parameter_count)
+        self.assertEqual(network.genome_spans, ((0, 24), (24, 28), (28, 40), (40, 43)))
+        for parameter, (start, stop) in zip(network.parameters(), network.genome_spans):
+            self.assertEqual(parameter.data_ptr(), genome[start:stop].data_ptr())
+
+        cached = network.acting_parameters()
+        with torch.no_grad():
+            genome[24:28].fill_(0.5)
+        self.assertEqual(network.layers[0].bias.tolist(), [0.5] * 4)
+        self.assertIsNot(network.acting_parameters(), cached)
+
+        copied = deepcopy(network)
+        self.assertTrue(torch.equal(copied.genome, genome))
+        self.assertNotEqual(copied.genome.data_ptr(), genome.data_ptr())
+        with torch.no_grad():
+            copied.layers[1].weight.add_(1.0)
+        self.assertTrue(torch.equal(copied.genome[28:40], genome[28:40] + 1.0))
+
+        restored = DrivingQNetwork(6, 3, (4,))
+        restored.load_state_dict(network.state_dict())
+        self.assertTrue(torch.equal(restored.genome, genome))
+
+    def test_parameter_version_tracks_loads_and_genome_writes(self):
+        network = DrivingQNetwork(6, 3, (4,))
+        version = network.parameter_version
+        network.acting_parameters()
+        network.snapshot(np.zeros(6, dtype=np.float32))
+        self.assertEqual(network.parameter_version, version)
+
+        with torch.no_grad():
+            network.genome[0].add_(1.0)
+        written = network.parameter_version
+        self.assertTrue(all(after > before for after, before in zip(written, version)))
+
+        with torch.no_grad():
+            network.genome.copy_(torch.zeros_like(network.genome))
+        zeroed = network.parameter_version
+        self.assertTrue(all(after > before for after, before in zip(zeroed, written)))
+
+        network.load_state_dict(DrivingQNetwork(6, 3, (4,)).state_dict())
+        loaded = network.parameter_version
+        self.assertTrue(all(after > before for after, before in zip(loaded, zeroed)))
+        self.assertFalse(torch.equal(network.genome, torch.zeros_like(network.genome)))
+
 
 class ReplayBufferTests(unittest.TestCase):
     def test_buffer_is_bounded_and_defensively_copies_observations(self):
@@ -125,6 +215,17 @@ class ReplayBufferTests(unittest.TestCase):
         self.assertEqual(replay.stats()["terminal"], 1)
         self.assertAlmostEqual(replay.stats()["mean_reward"], 1.5)
 
+    def test_validate_transition_copies_without_storing(self):
+        replay = ReplayBuffer(2, observation_size=2, seed=2)
+        state = np.zeros(2, dtype=np.float32)
+        transition = replay.validate_transition(state, 1, 0.5, state, False)
+        state[:] = 5.0
+
+        self.assertEqual(len(replay), 0)
+        np.testing.assert_array_equal(transition.state, np.zeros(2))
+        with self.assertRaisesRegex(ValueError, "reward"):
+            replay.validate_transition(state, 1, float("nan"), state, False)
+
     def test_sampling_is_reproducible_and_independent(self):
         first = ReplayBuffer(10, observation_size=2, seed=7)
         second = ReplayBuffer(10, observation_size=2, seed=7)
@@ -140,6 +241,82 @@ class ReplayBufferTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             first.sample(11)
 
+    def test_ring_batches_match_transition_samples_after_wrapping(self):
+        first = ReplayBuffer(6, observation_size=2, seed=4)
+        second = ReplayBuffer(6, observation_size=2, seed=4)
+        for action in range(15):
+            state = np.full(2, action, dtype=np.float32)
+            for replay in (first, second):
+                replay.append(state, action, action * 0.5, state + 1.0, action % 4 == 0)
+
+        self.assertEqual([item.action for item in first], list(range(9, 15)))
+        self.assertEqual([item.action for item in first.tail(2)], [13, 14])
+        self.assertEqual(first.stats()["terminal"], 1)
+        self.assertAlmostEqual(first.stats()["mean_reward"], 5.75)
+        for _ in range(3):
+            expected = first.sample(4)
+            batch = second.sample_batch(4)
+            np.testing.assert_array_equal(
+                batch.states, np.stack([item.state for item in expected])
+            )
+            np.testing.assert_array_equal(
+                batch.next_states, np.stack([item.next_state for item in expected])
+            )
+            self.assertEqual(batch.actions.tolist(), [item.action for item in expected])
+            self.assertEqual(batch.dones.tolist(), [item.done for item in expected])
+            np.testing.assert_array_equal(
+                batch.rewards,
+                np.asarray([item.reward for item in expected], dtype=np.float32),
+            )
+        self.assertEqual(
+            (batch.states.dtype, batch.actions.dtype, batch.dones.dtype),
+            (np.float32, np.int64, np.bool_),
+        )
+        self.assertTrue(batch.states.flags.c_contiguous)
+        first.clear()
+        self.assertEqual((len(first), list(first)), (0, []))
+
+    def test_sum_tree_updates_and_searches_cumulative_priority(self):
+        tree = SumTree(5)
+        tree.update(np.arange(5), np.asarray([1.0, 0.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(tree.total, 10.0)
+        self.assertEqual(tree.minimum, 1.0)
+        self.assertEqual(
+            tree.find(np.asarray([0.0, 1.0, 1.5, 3.5, 9.99])).tolist(),
+            [0, 0, 2, 3, 4],
+        )
+        tree.update(np.asarray([0, 4, 0]), np.asarray([9.0, 0.5, 0.25]))
+        self.assertEqual(tree.total, 5.75)
+        self.assertEqual(tree.minimum, 0.25)
+        with self.assertRaisesRegex(ValueError, "non-negative"):
+            tree.update(np.asarray([1]), np.asarray([-1.0]))
+
+    def test_prioritized_batches_follow_td_errors_with_importance_weights(self):
+        replay = PrioritizedReplayBuffer(8, observation_size=2, seed=3, alpha=1.0)
+        for action in range(10):
+            state = np.full(2, action, dtype=np.float32)
+            replay.append(state, action, float(action), state, False)
+        batch = replay.sample_batch(4, beta=0.5)
+        np.testing.assert_array_equal(batch.weights, np.ones(4, dtype=np.float32))
+        # Actions 8 and 9 overwrote ring slots 0 and 1.
+        np.testing.assert_array_equal(
+            batch.actions, batch.slots + 8 * (batch.slots < 2)
+        )
+
+        slots = np.arange(8)
+        replay.update_priorities(slots, np.where(slots == 5, 9.0, 0.0))
+        batch = replay.sample_batch(8, beta=1.0)
+        self.assertGreaterEqual(batch.slots.tolist().count(5), 7)
+        # Weights are normalized by the rarest slot's weight, which is one.
+        self.assertAlmostEqual(
+            float(batch.weights[batch.slots == 5][0]), 0.001 / 9.001, places=6
+        )
+        stats = replay.stats()["priority"]
+        self.assertAlmostEqual(stats["total"], 9.001 + 7 * 0.001)
+        self.assertEqual(stats["updates"], 1)
+        with self.assertRaisesRegex(ValueError, "beta"):
+            replay.sample_batch(2, beta=1.5)
+
 
 class DrivingDQNAgentTests(unittest.TestCase):
     def test_seed_controls_initial_weights_and_exploration(self):
@@ -177,6 +354,129 @@ class DrivingDQNAgentTests(unittest.TestCase):
         self.assertEqual(agent.gradient_steps, 1)
         self.assertFalse(np.array_equal(before, agent.q_values(state)))
 
+    def test_prioritized_replay_trains_from_weighted_batches(self):
+        agent = DrivingDQNAgent(
+            tiny_config(replay_strategy="prioritized", priority_beta=0.2)
+        )
+        self.assertIsInstance(agent.replay, PrioritizedReplayBuffer)
+        state = np.linspace(-0.5, 0.5, 16, dtype=np.float32)
+        losses = [
+            agent.observe(state * step, step % 5, float(step), state, step == 5)
+            for step in range(6)
+        ]
+
+        self.assertTrue(all(np.isfinite(loss) for loss in losses[1:]))
+        self.assertEqual(agent.replay.priority_updates, agent.gradient_steps)
+        self.assertAlmostEqual(agent.priority_beta, 0.2 + 0.6 * 0.8)
+        telemetry = agent.telemetry(state)
+        self.assertEqual(telemetry["replay_strategy"], "prioritized")
+        self.assertGreater(telemetry["replay"]["priority"]["max_seen"], 1.0)
+        with self.assertRaisesRegex(ValueError, "replay_strategy"):
+            tiny_config(replay_strategy="rank")
+
+    def test_n_step_entries_fold_discounted_rewards_and_flush_on_done(self):
+        agent = DrivingDQNAgent(
+            tiny_config(n_step=3, gamma=0.5, warmup_steps=100)
+        )
+        states = [np.full(16, float(step), dtype=np.float32) for step in range(6)]
+        for step in range(4):
+            agent.observe(states[step], step, 1.0, states[step + 1], step == 3)
+        replay = tuple(agent.replay)
+
+        self.assertEqual([transition.action for transition in replay], [0, 1, 2, 3])
+        self.assertEqual(
+            [transition.reward for transition in replay], [1.75, 1.75, 1.5, 1.0]
+        )
+        self.assertEqual(
+            [transition.done for transition in replay], [False, True, True, True]
+        )
+        np.testing.assert_array_equal(replay[0].next_state, states[3])
+        np.testing.assert_array_equal(replay[3].next_state, states[4])
+        self.assertEqual(agent._bootstrap_discount, 0.125)
+
+        agent.observe(states[0], 0, 1.0, states[1], False)
+        self.assertEqual(agent.telemetry()["pending_n_step"], 1)
+        agent.discard_pending_steps()
+        self.assertEqual(agent.telemetry()["pending_n_step"], 0)
+        with self.assertRaisesRegex(ValueError, "n_step"):
+            tiny_config(n_step=0)
+
+    def test_parallel_actors_share_one_forward_pass_and_separate_windows(self):
+        agent = DrivingDQNAgent(tiny_config(n_step=2, gamma=0.5, warmup_steps=100))
+        states = [np.full(16, value, dtype=np.float32) for value in (0.1, 0.2, 0.3)]
+
+        batched = agent.q_values_many(states)
+        for row, state in zip(batched, states):
+            np.testing.assert_array_equal(row, agent.q_values(state))
+        agent.observe(states[0], 1, 1.0, states[1], False, stream=0)
+        agent.observe(states[2], 2, 4.0, states[0], False, stream=1)
+        agent.observe(states[1], 1, 2.0, states[2], False, stream=0)
+        agent.observe(states[0], 2, 8.0, states[1], False, stream=1)
+
+        replay = tuple(agent.replay)
+        self.assertEqual([item.reward for item in replay], [2.0, 8.0])
+        np.testing.assert_array_equal(replay[0].next_state, states[2])
+        np.testing.assert_array_equal(replay[1].next_state, states[1])
+        agent.discard_pending_steps(stream=1)
+        self.assertEqual(agent.telemetry()["pending_n_step"], 1)
+
+    def test_population_learner_matches_independent_train_steps(self):
+        for algorithm, strategy in (
+            ("dqn", "uniform"),
+            ("double_dqn", "prioritized"),
+        ):
+            def agents():
+                return [
+                    DrivingDQNAgent(
+                        tiny_config(
+                            algorithm=algorithm,
+                            replay_strategy=strategy,
+                            gradient_clip=0.05,
+                            seed=seed,
+                        )
+                    )
+                    for seed in (3, 4, 5)
+                ]
+
+            solo = agents()
+            batched = agents()
+            learner = PopulationLearner()
+            rng = np.random.default_rng(9)
+            for step in range(12):
+                for first, second in zip(solo, batched):
+                    transition = (
+                        rng.normal(size=16).astype(np.float32),
+                        int(rng.integers(5)),
+                        float(rng.normal()),
+                        rng.normal(size=16).astype(np.float32),
+                        step % 5 == 4,
+                    )
+                    first.observe(*transition)
+                    self.assertIsNone(second.observe(*transition, train=False))
+                learner.train_steps([agent for agent in batched if agent.training_due])
+
+            with self.subTest(algorithm=algorithm, strategy=strategy):
+                self.assertEqual(learner.member_updates, 3 * 11)
+                for first, second in zip(solo, batched):
+                    torch.testing.assert_close(
+                        first.online_network.genome, second.online_network.genome
+                    )
+                    torch.testing.assert_close(
+                        first.target_network.genome, second.target_network.genome
+                    )
+                    self.assertEqual(first.gradient_steps, second.gradient_steps)
+                    self.assertEqual(
+                        first.gradient_clip_events, second.gradient_clip_events
+                    )
+                    self.assertAlmostEqual(first.last_loss, second.last_loss, places=6)
+        with self.assertRaisesRegex(ValueError, "update configuration"):
+            learner.train_steps(
+                [
+                    DrivingDQNAgent(tiny_config()),
+                    DrivingDQNAgent(tiny_config(gamma=0.5)),
+                ]
+            )
+
     def test_dqn_and_double_dqn_use_distinct_bootstrap_rules(self):
         dqn = DrivingDQNAgent(tiny_config(algorithm="dqn"))
         double = DrivingDQNAgent(tiny_config(algorithm="double_dqn"))
@@ -226,6 +526,72 @@ class DrivingDQNAgentTests(unittest.TestCase):
             )
         )
 
+    def test_numpy_acting_mirror_matches_torch_and_follows_weight_writes(self):
+        agent = DrivingDQNAgent(tiny_config(seed=12))
+        donor = DrivingDQNAgent(tiny_config(seed=13))
+        states = np.random.default_rng(4).normal(size=(64, 16)).astype(np.float32)
+        network = agent.online_network
+
+        def assert_mirrors_torch():
+            with torch.no_grad():
+                expected = network(torch.from_numpy(states)).numpy()
+            actual = np.stack([agent.q_values(state) for state in states])
+            np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+            np.testing.assert_array_equal(actual.argmax(axis=1), expected.argmax(1))
+
+        assert_mirrors_torch()
+        cached = network.acting_parameters()
+        self.assertIs(network.acting_parameters(), cached)
+        agent.select_action(states[0], explore=False)
+        self.assertIs(network.acting_parameters(), cached)
+
+        for state, next_state in zip(states[:3], states[1:4]):
+            agent.observe(state, 1, 1.0, next_state, False)
+        self.assertGreater(agent.gradient_steps, 0)
+        self.assertIsNot(network.acting_parameters(), cached)
+        assert_mirrors_torch()
+
+        agent.copy_weights_from(donor)
+        np.testing.assert_array_equal(
+            agent.q_values(states[5]), donor.q_values(states[5])
+        )
+        with torch.no_grad():
+            network.layers[0].bias.add_(0.25)
+        assert_mirrors_torch()
+
+    def test_population_inference_matches_each_agent_and_tracks_weight_edits(self):
+        agents = [DrivingDQNAgent(tiny_config(seed=seed)) for seed in (3, 4, 5)]
+        rng = np.random.default_rng(9)
+        states = rng.normal(size=(3, 16)).astype(np.float32)
+        inference = PopulationInference()
+
+        batched = inference.q_values(agents, states)
+        for agent, state, values in zip(agents, states, batched):
+            np.testing.assert_array_equal(values, agent.q_values(state))
+        subset = inference.q_values(agents, states[[2, 0]], rows=(2, 0))
+        np.testing.assert_array_equal(subset, batched[[2, 0]])
+        self.assertEqual(inference.refreshes, 3)
+
+        agents[1].observe(states[1], 2, 1.0, states[0], False)
+        agents[1].observe(states[0], 1, 0.0, states[2], True)
+        with torch.no_grad():
+            next(agents[2].online_network.parameters()).add_(0.5)
+        refreshed = inference.q_values(agents, states)
+        self.assertEqual(inference.refreshes, 5)
+        for agent, state, values in zip(agents, states, refreshed):
+            np.testing.assert_array_equal(values, agent.q_values(state))
+
+        greedy = agents[0].select_action_from_values(refreshed[0], explore=False)
+        self.assertEqual(greedy, int(np.argmax(agents[0].q_values(states[0]))))
+        self.assertEqual(agents[0].last_policy, "greedy")
+        with self.assertRaisesRegex(ValueError, "rows"):
+            inference.q_values(agents, states[:1], rows=(3,))
+        with self.assertRaisesRegex(ValueError, "architecture"):
+            inference.q_values(
+                [agents[0], DrivingDQNAgent(tiny_config(hidden_sizes=(4,)))],
+                states[:2],
+            )
+
     def test_telemetry_and_network_snapshot_expose_live_learning_state(self):
         agent = DrivingDQNAgent(tiny_config())
         state = np.zeros(16, dtype=np.float32)
@@ -240,6 +606,21 @@ class DrivingDQNAgentTests(unittest.TestCase):
         self.assertEqual(snapshot["q_values"], telemetry["q_values"])
         self.assertEqual(len(snapshot["layers"]), 3)
 
+    def test_telemetry_reruns_the_forward_pass_only_after_weights_change(self):
+        agent = DrivingDQNAgent(tiny_config(learning_rate=0.01))
+        state = np.zeros(16, dtype=np.float32)
+        before = agent.telemetry(state)
+
+        with patch.object(agent, "q_values", wraps=agent.q_values) as q_values:
+            self.assertEqual(agent.telemetry(state)["q_values"], before["q_values"])
+            q_values.assert_not_called()
+            agent.observe(state, 0, 3.0, state, True)
+            agent.observe(state, 0, 3.0, state, True)
+            after = agent.telemetry(state)
+        q_values.assert_called_once()
+        self.assertEqual(after["q_values"], agent.q_values(state).tolist())
+        self.assertNotEqual(after["parameter_norm"], before["parameter_norm"])
+
     def test_atomic_checkpoint_round_trip_restores_policy_and_counters(self):
         agent = DrivingDQNAgent(tiny_config(seed=22))
         state = np.arange(16, dtype=np.float32) / 16.0
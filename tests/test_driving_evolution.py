@@ -1,9 +1,11 @@
+from dataclasses import replace
 import tempfile
 import unittest
 from pathlib import Path
 
 import torch
 
+from drivingGameRL.src.environment import DrivingEnv
 from drivingGameRL.src.ml import DQNConfig
 from drivingGameRL.src.ml.evolution import (
     EvaluationResult,
@@ -268,6 +270,75 @@ class DrivingEvolutionTests(unittest.TestCase):
             all(member.birth_generation == 1 for member in trainer.population[2:])
         )
 
+    def test_unchanged_greedy_genomes_reuse_identical_rollouts(self):
+        def run(cache_size):
+            env = DrivingEnv("harbor_loop", random_start_curriculum=True)
+            env.load_curriculum_state({"unlocked": True})
+            trainer = PopulationTrainer(
+                _evolution_config(evaluation_steps=3, fitness_cache_size=cache_size),
+                _dqn_config(),
+                env=env,
+                parallel_workers=1,
+            )
+            self.addCleanup(trainer.close)
+            while trainer.generation < 5:
+                trainer.step()
+            return trainer
+
+        cached = run(256)
+        uncached = run(0)
+
+        hits = [record.cached_evaluations for record in cached.history]
+        self.assertGreater(sum(hits), 0)
+        cache = cached.telemetry()["fitness_cache"]
+        self.assertEqual(cache["hits"], sum(hits) + cache["generation_hits"])
+        self.assertLess(cached.environment_decisions, uncached.environment_decisions)
+        for first, second in zip(cached.history, uncached.history):
+            self.assertEqual(replace(first, cached_evaluations=0), second)
+        for first, second in zip(cached.population, uncached.population):
+            self.assertTrue(
+                torch.equal(_parameters(first.agent), _parameters(second.agent))
+            )
+
+    def test_racing_rungs_stop_dominated_members_and_rank_them_last(self):
+        trainer = PopulationTrainer(
+            _evolution_config(
+                population_size=6,
+                evaluation_steps=12,
+                racing_rungs=(0.25, 0.5),
+                fitness_cache_size=0,
+            ),
+            _dqn_config(),
+            parallel_workers=1,
+            auto_evolve=False,
+        )
+        self.addCleanup(trainer.close)
+        self.assertEqual(trainer.racing_rung_steps, (3, 6))
+        while not trainer.generation_complete:
+            trainer.step()
+
+        stopped = [
+            member.result
+            for member in trainer.population
+            if member.result.early_stopped
+        ]
+        # Six contenders keep three at the first rung and two at the second.
+        self.assertEqual(len(stopped), 4)
+        for result in stopped:
+            self.assertEqual(result.end_reason, "early_stopped")
+            self.assertLessEqual(result.steps, trainer.racing_rung_steps[1])
+        self.assertEqual(
+            sorted(result.racing_rung for result in stopped), [0, 0, 0, 1]
+        )
+        ranked = trainer.ranked_members
+        self.assertTrue(all(m.result.racing_rung is None for m in ranked[:2]))
+        self.assertEqual([m.result.racing_rung for m in ranked[2:3]], [1])
+        self.assertFalse(trainer.champion_snapshot.result.early_stopped)
+        self.assertLess(trainer.environment_decisions, 6 * 12)
+        self.assertEqual(trainer.evolve().early_stopped, 4)
+        with self.assertRaisesRegex(ValueError, "strictly increasing"):
+            _evolution_config(racing_rungs=(0.5, 0.5))
+
     def test_champion_race_clone_is_isolated_from_population(self):
         trainer = PopulationTrainer(
             _evolution_config(), _dqn_config(), auto_evolve=False
@@ -1,5 +1,6 @@
 import math
 import os
+import random
 import unittest
 
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -11,6 +12,7 @@ from drivingGameRL.src.environment import (
     DrivingEnv,
     LapPose,
     LapRecord,
+    StepInfo,
 )
 from drivingGameRL.src.game import DrivingGame
 from drivingGameRL.src.math2d import Vec2
@@ -140,6 +142,87 @@ class DrivingLapTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             env.ghost_pose_at(-0.1)
 
+    def test_info_levels_report_the_same_values_as_the_full_dict(self):
+        full = DrivingEnv("harbor_loop", lap_target=3)
+        lean = DrivingEnv("harbor_loop", lap_target=3, info_level="training")
+        silent = DrivingEnv("harbor_loop", lap_target=3, info_level="none")
+        full_infos = []
+        lean_infos = []
+        for dwell_steps in (8, 1):
+            for _ in range(dwell_steps):
+                for env in (full, lean, silent):
+                    env.step(DrivingAction.COAST)
+            for index in range(1, 21):
+                results = [
+                    drive_to_progress(env, (index % 20) / 20.0)
+                    for env in (full, lean, silent)
+                ]
+                self.assertEqual(results[1].observation, results[0].observation)
+                self.assertEqual(results[1].reward, results[0].reward)
+                self.assertEqual(dict(results[2].info), {})
+                self.assertIsInstance(results[1].info, StepInfo)
+                full_infos.append(results[0].info)
+                lean_infos.append(results[1].info)
+
+        self.assertEqual(lean.laps, 2)
+        self.assertNotEqual(
+            lean_infos[20]["episode_mean_lap_time"],
+            lean_infos[-1]["episode_mean_lap_time"],
+        )
+        self.assertEqual(
+            lean_infos[-1].training_dict(),
+            {key: full_infos[-1][key] for key in StepInfo.TRAINING_KEYS},
+        )
+        # Expanding after later ticks still reports each tick's own values.
+        for full_info, lean_info in zip(full_infos, lean_infos):
+            self.assertEqual(
+                lean_info["episode_mean_lap_time"],
+                full_info["episode_mean_lap_time"],
+            )
+            self.assertEqual(lean_info.to_dict(), full_info)
+            self.assertEqual(dict(lean_info), full_info)
+        self.assertIsNot(lean_infos[-1]["reward_terms"], lean.last_reward_terms)
+        with self.assertRaises(KeyError):
+            lean_infos[-1]["missing"]
+        self.assertIsNone(lean_infos[-1].get("missing"))
+        with self.assertRaisesRegex(ValueError, "info_level"):
+            DrivingEnv("harbor_loop", info_level="minimal")
+
+    def test_snapshot_restore_and_fork_replay_identical_branches(self):
+        env = DrivingEnv("canyon_maze", seed=6, random_start_curriculum=True)
+        env.load_curriculum_state({"unlocked": True, "lap_target": 2})
+        complete_lap(env)
+        for _ in range(40):
+            env.step(DrivingAction.STEER_LEFT)
+
+        def branch(target, ticks=600):
+            rng = random.Random(2)
+            results = []
+            collisions = 0
+            for _ in range(ticks):
+                result = target.step(rng.randrange(len(DrivingAction)))
+                results.append(result)
+                collisions += result.info["collision_started"]
+                if result.terminated or result.truncated:
+                    results.append(target.reset())
+            return results, collisions, target.telemetry()
+
+        snapshot = env.snapshot()
+        fork = env.fork()
+        self.assertEqual(set(vars(fork)), set(vars(env)))
+        self.assertEqual(fork.telemetry(), env.telemetry())
+        expected = branch(env)
+        self.assertGreater(expected[1], 0)
+        self.assertTrue(any(type(item) is tuple for item in expected[0]))
+        self.assertEqual(branch(fork), expected)
+
+        env.restore(snapshot)
+        self.assertEqual(branch(env), expected)
+        self.assertEqual(fork.best_lap_record, env.best_lap_record)
+        self.assertIsNot(fork.vehicle.state, env.vehicle.state)
+        with self.assertRaisesRegex(TypeError, "DrivingEnvSnapshot"):
+            env.restore(env.curriculum_state())
+
     def test_trajectory_sampling_is_approximately_30hz_and_bounded(self):
         env = DrivingEnv("harbor_loop")
         for _ in range(60):
@@ -1,8 +1,11 @@
 """Integration tests for learning sessions and the playable champion race."""
 
+from dataclasses import replace
 import os
 from pathlib import Path
 import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch
 
@@ -19,7 +22,7 @@ from drivingGameRL.src.learning_runtime import (
     DrivingLearningSession,
     LearningRuntimeConfig,
 )
-from drivingGameRL.src.ml import DQNConfig, DrivingDQNAgent
+from drivingGameRL.src.ml import DQNConfig, DrivingDQNAgent, checkpoint_writer
 from drivingGameRL.src.population_rollout import PopulationRolloutManager
 from drivingGameRL.src.vehicle import DriverControls
 
@@ -53,6 +56,26 @@ class LearningRuntimeConfigTests(unittest.TestCase):
             with self.subTest(parallel_workers=invalid):
                 with self.assertRaises(ValueError):
                     LearningRuntimeConfig(parallel_workers=invalid)
+        for invalid in (True, 0, 31, 2.0):
+            with self.subTest(decision_interval=invalid):
+                with self.assertRaisesRegex(ValueError, "decision_interval"):
+                    LearningRuntimeConfig(decision_interval=invalid)
+        args = build_parser().parse_args(["--learn", "--decision-interval", "4"])
+        self.assertEqual(args.decision_interval, 4)
+
+    def test_autosave_requires_a_path_and_a_non_negative_interval(self):
+        with self.assertRaisesRegex(ValueError, "autosave_generations"):
+            LearningRuntimeConfig(autosave_generations=-1)
+        with self.assertRaisesRegex(ValueError, "autosave_path"):
+            LearningRuntimeConfig(autosave_generations=2)
+        config = LearningRuntimeConfig(
+            autosave_generations=2, autosave_path="driving.pth"
+        )
+        self.assertEqual(config.autosave_generations, 2)
+        args = build_parser().parse_args(
+            ["--learn", "--checkpoint", "driving.pth", "--autosave-generations", "3"]
+        )
+        self.assertEqual(args.autosave_generations, 3)
 
 
 class DrivingLearningSessionTests(unittest.TestCase):
@@ -282,6 +305,75 @@ class DrivingLearningSessionTests(unittest.TestCase):
             ):
                 self.assertTrue(torch.equal(source_parameter, restored_parameter))
 
+    def test_background_checkpoints_coalesce_and_autosave_every_n_generations(self):
+        with tempfile.TemporaryDirectory() as directory:
+            autosave = Path(directory) / "autosave.pth"
+            session = DrivingLearningSession(
+                LearningRuntimeConfig(
+                    algorithm="genetic",
+                    evaluation_steps=2,
+                    population_size=2,
+                    elite_count=1,
+                    parallel_workers=1,
+                    initial_lap_target=1,
+                    max_lap_target=1,
+                    seed=113,
+                    autosave_generations=2,
+                    autosave_path=autosave,
+                )
+            )
+            self.addCleanup(session.close)
+
+            session.step_many(64, stop_after_generation=True)
+            session.flush_checkpoints()
+            self.assertEqual(session.completed_generations, 1)
+            self.assertFalse(autosave.exists())
+            session.step_many(64, stop_after_generation=True)
+            session.flush_checkpoints()
+            self.assertEqual(session.completed_generations, 2)
+            checkpoint = session.telemetry(sections=())["checkpoint"]
+            self.assertEqual(checkpoint["autosaves"], 1)
+            self.assertEqual(checkpoint["writes"], 1)
+            self.assertEqual(checkpoint["last_written"], str(autosave.resolve()))
+            self.assertEqual(torch.load(autosave, weights_only=False)["generation"], 2)
+
+            manual = Path(directory) / "manual.pth"
+            release = threading.Event()
+            write = checkpoint_writer.write_checkpoint
+
+            def held_write(payload, path):
+                release.wait(timeout=10)
+                return write(payload, path)
+
+            with patch.object(checkpoint_writer, "write_checkpoint", held_write):
+                session.save(manual, background=True)
+                deadline = time.monotonic() + 10
+                while session.telemetry(sections=())["checkpoint"]["writing"] is None:
+                    self.assertLess(time.monotonic(), deadline)
+                    time.sleep(0.001)
+                session.step()
+                session.save(manual, background=True)
+                session.step()
+                output = session.save(manual, background=True)
+                queued = session.telemetry(sections=())
+                release.set()
+                session.flush_checkpoints()
+
+            self.assertEqual(queued["event"], "checkpoint_queued")
+            self.assertEqual(queued["checkpoint"]["pending"], 2)
+            checkpoint = session.telemetry(sections=())["checkpoint"]
+            self.assertEqual(checkpoint["pending"], 0)
+            self.assertEqual(checkpoint["coalesced"], 1)
+            self.assertEqual(checkpoint["writes"], 3)
+            self.assertEqual(checkpoint["last_written"], str(output))
+            restored = DrivingLearningSession(session.config)
+            self.addCleanup(restored.close)
+            restored.load(manual)
+            self.assertEqual(
+                restored.environment_decisions, session.environment_decisions
+            )
+            self.assertEqual(list(Path(directory).glob(".*.tmp")), [])
+
     def test_population_step_many_stops_exactly_and_counts_all_car_decisions(self):
         session = DrivingLearningSession(
             LearningRuntimeConfig(
@@ -309,6 +401,34 @@ class DrivingLearningSessionTests(unittest.TestCase):
         self.assertEqual(telemetry["last_batch_ticks"], 3)
         self.assertEqual(telemetry["last_batch_decisions"], 12)
 
+    def test_decision_interval_spends_the_budget_in_physics_ticks(self):
+        session = DrivingLearningSession(
+            LearningRuntimeConfig(
+                algorithm="genetic",
+                evaluation_steps=6,
+                population_size=4,
+                elite_count=1,
+                tournament_size=2,
+                parallel_workers=1,
+                initial_lap_target=1,
+                max_lap_target=1,
+                seed=8,
+                decision_interval=3,
+            ),
+            dqn_config=tiny_dqn(seed=8),
+        )
+        self.addCleanup(session.close)
+        trainer = session._population_trainer
+        self.assertEqual(
+            {env.decision_interval for env in trainer.member_environments}, {3}
+        )
+
+        results = session.step_many(20, stop_after_generation=True)
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[-1].evolved)
+        self.assertEqual(session.environment_decisions, 8)
+
     def test_dqn_episode_trains_and_advances_generation(self):
         session = DrivingLearningSession(
             LearningRuntimeConfig(
@@ -340,6 +460,115 @@ class DrivingLearningSessionTests(unittest.TestCase):
         self.assertEqual(episode["target_finishers"], 0)
         self.assertIn("best_target_progress", episode)
 
+    def test_learner_thread_trains_at_the_replay_ratio_off_the_actor(self):
+        session = DrivingLearningSession(
+            LearningRuntimeConfig(
+                algorithm="dqn",
+                evaluation_steps=40,
+                population_size=2,
+                elite_count=1,
+                initial_lap_target=1,
+                max_lap_target=1,
+                seed=13,
+                learner_thread=True,
+                replay_ratio=0.5,
+                publish_interval=2,
+            ),
+            dqn_config=tiny_dqn(),
+        )
+        self.addCleanup(session.close)
+
+        for _ in range(12):
+            loss = session.agent.observe(
+                session.observation, 0, 0.0, session.observation, False
+            )
+            self.assertIsNone(loss)
+        deadline = time.monotonic() + 10.0
+        while (
+            session.telemetry()["async_learner"]["updates"] < 6
+            and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        learner = session.telemetry()["async_learner"]
+
+        self.assertEqual(learner["decisions"], 12)
+        self.assertEqual(learner["updates"], 6)
+        self.assertEqual(learner["achieved_replay_ratio"], 0.5)
+        self.assertEqual(learner["publishes"], 4)
+        self.assertEqual(learner["staleness_updates"], 0)
+        self.assertEqual(session.agent.gradient_steps, 6)
+        np.testing.assert_array_equal(
+            session.agent.q_values(session.observation),
+            session.agent.online_network.acting_values(
+                np.asarray(session.observation, dtype=np.float32)[None, :]
+            )[0],
+        )
+
+        session.close()
+        self.assertIsNone(session.agent.telemetry()["async_learner"])
+        loss = session.agent.observe(
+            session.observation, 0, 0.0, session.observation, False
+        )
+        self.assertIsNotNone(loss)
+        with self.assertRaisesRegex(ValueError, "learner_thread"):
+            LearningRuntimeConfig(algorithm="genetic", learner_thread=True)
+
+    def test_extra_actors_feed_the_single_agent_replay(self):
+        session = DrivingLearningSession(
+            LearningRuntimeConfig(
+                algorithm="double_dqn",
+                evaluation_steps=2,
+                population_size=2,
+                elite_count=1,
+                initial_lap_target=1,
+                max_lap_target=1,
+                seed=13,
+                actor_count=3,
+            ),
+            dqn_config=tiny_dqn(),
+        )
+
+        session.step()
+        self.assertEqual(session.environment_decisions, 3)
+        self.assertEqual(len(session.agent.replay), 3)
+        self.assertEqual(sum(session.agent.action_counts), 3)
+        session.step()
+        telemetry = session.telemetry()
+
+        self.assertEqual(session.completed_generations, 1)
+        self.assertEqual(telemetry["actor_count"], 3)
+        self.assertEqual(telemetry["replay_size"], 6)
+        self.assertEqual(
+            [transition.done for transition in session.agent.replay],
+            [False, False, False, True, True, True],
+        )
+        self.assertTrue(all(env.steps == 0 for env in session._actor_envs))
+        with self.assertRaisesRegex(ValueError, "actor_count"):
+            LearningRuntimeConfig(algorithm="genetic", actor_count=2)
+
+    def test_evaluation_reset_keeps_extra_actor_n_step_windows(self):
+        session = DrivingLearningSession(
+            LearningRuntimeConfig(
+                algorithm="double_dqn",
+                evaluation_steps=10,
+                population_size=2,
+                elite_count=1,
+                initial_lap_target=1,
+                max_lap_target=1,
+                seed=13,
+                actor_count=2,
+            ),
+            dqn_config=replace(tiny_dqn(), n_step=3),
+        )
+
+        session.step()
+        session.step()
+        self.assertEqual(len(session.agent._pending_steps[1]), 2)
+        session.reset_current_evaluation()
+
+        self.assertNotIn(0, session.agent._pending_steps)
+        self.assertEqual(len(session.agent._pending_steps[1]), 2)
+
     def test_pure_genetic_population_evolves_after_one_lockstep_tick(self):
         session = DrivingLearningSession(
             LearningRuntimeConfig(
@@ -398,6 +627,47 @@ class DrivingLearningSessionTests(unittest.TestCase):
             all(result.training_updates > 0 for result in completed.member_results)
         )
 
+    def test_telemetry_sections_are_selectable_and_cached_until_sources_change(self):
+        session = DrivingLearningSession(
+            LearningRuntimeConfig(
+                algorithm="genetic_dqn",
+                evaluation_steps=4,
+                population_size=2,
+                elite_count=1,
+                initial_lap_target=1,
+                max_lap_target=1,
+                seed=9,
+            ),
+            dqn_config=tiny_dqn(seed=9),
+        )
+        self.addCleanup(session.close)
+        session.step()
+
+        full = session.telemetry()
+        for key in ("population", "generation_history", "network", "memory_samples"):
+            self.assertIn(key, full)
+        with patch.object(
+            session.agent, "network_snapshot", wraps=session.agent.network_snapshot
+        ) as network_snapshot:
+            overview = session.telemetry(sections=("population", "history"))
+            network = session.telemetry(sections=("network",))
+        network_snapshot.assert_not_called()
+        self.assertNotIn("network", overview)
+        self.assertNotIn("memory_samples", overview)
+        self.assertEqual(overview["population"], full["population"])
+        self.assertNotIn("population", network)
+        self.assertIs(network["network"], full["network"])
+
+        session.step()
+        refreshed = session.telemetry(sections=("network",))["network"]
+        self.assertIsNot(refreshed, full["network"])
+        self.assertEqual(
+            refreshed["q_values"],
+            session.agent.q_values(session._population_trainer.observation).tolist(),
+        )
+        with self.assertRaisesRegex(ValueError, "unknown telemetry sections"):
+            session.telemetry(sections=("weights",))
+
     def test_population_session_exposes_parallel_workers_and_real_scored_cars(self):
         session = DrivingLearningSession(
             LearningRuntimeConfig(
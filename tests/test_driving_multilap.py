@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+import random
 import unittest
 
 from drivingGameRL.src.environment import DrivingAction, DrivingEnv, StepResult
@@ -144,6 +145,58 @@ class DrivingMultiLapTests(unittest.TestCase):
             * env.LAP_TIME_MINIMUM_RATIO,
         )
 
+    def test_decision_interval_accumulates_ticks_and_stops_at_episode_end(self):
+        held = DrivingEnv(
+            "canyon_maze",
+            seed=4,
+            max_steps=250,
+            random_start_curriculum=True,
+            decision_interval=4,
+        )
+        single = DrivingEnv(
+            "canyon_maze", seed=4, max_steps=250, random_start_curriculum=True
+        )
+        rng = random.Random(9)
+        flags = ("collision_started", "collided", "checkpoint_advanced")
+        seen = {name: False for name in flags}
+        tick_counts = []
+        for _ in range(400):
+            action = rng.randrange(len(DrivingAction))
+            result = held.step(action)
+            reward = 0.0
+            terms: dict[str, float] = {}
+            merged = {name: False for name in flags}
+            for ticks in range(1, 5):
+                expected = single.step(action)
+                reward += expected.reward
+                for name, value in expected.info["reward_terms"].items():
+                    terms[name] = terms.get(name, 0.0) + value
+                for name in flags:
+                    merged[name] = merged[name] or expected.info[name]
+                if expected.terminated or expected.truncated:
+                    break
+            self.assertEqual(result.observation, expected.observation)
+            self.assertEqual(result.reward, reward)
+            self.assertEqual(result.info["reward_terms"], terms)
+            self.assertEqual(result.info["decision_ticks"], ticks)
+            self.assertEqual(held.steps, single.steps)
+            for name in flags:
+                self.assertEqual(result.info[name], merged[name], name)
+                seen[name] = seen[name] or merged[name]
+            tick_counts.append(ticks)
+            if result.terminated or result.truncated:
+                self.assertEqual(
+                    (result.terminated, result.truncated),
+                    (expected.terminated, expected.truncated),
+                )
+                held.reset()
+                single.reset()
+
+        self.assertTrue(seen["collision_started"])
+        self.assertIn(2, tick_counts)
+        with self.assertRaisesRegex(ValueError, "decision_interval"):
+            DrivingEnv("harbor_loop", decision_interval=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from copy import deepcopy
+from dataclasses import replace
 import threading
 import time
 import unittest
@@ -417,6 +418,76 @@ class DrivingParallelEvolutionTests(unittest.TestCase):
         self.assertGreater(telemetry["last_batch_ms"], 0.0)
         self.assertGreater(telemetry["decision_throughput"], 0.0)
 
+    def test_serial_lockstep_batches_every_member_policy_per_tick(self):
+        config = _evolution(evaluation_steps=6, mutation_rate=0.2, mutation_std=0.01)
+        serial = self._track(PopulationTrainer(config, _dqn(), parallel_workers=1))
+        parallel = self._track(
+            PopulationTrainer(config, _dqn(), parallel_workers=4)
+        )
+        batched = serial._inference.q_values
+        with (
+            patch.object(
+                serial._inference, "q_values", wraps=batched
+            ) as batched_calls,
+            patch.object(
+                type(serial.population[0].agent),
+                "q_values",
+                side_effect=AssertionError("serial members must be batched"),
+            ),
+        ):
+            serial_steps = serial.step_many(8)
+        parallel_steps = parallel.step_many(8)
+
+        self.assertEqual(batched_calls.call_count, 8)
+        self.assertEqual(
+            [step.action for step in serial_steps],
+            [step.action for step in parallel_steps],
+        )
+        _assert_nested_equal(self, serial.state_dict(), parallel.state_dict())
+        # Replay updates rewrite weights in place, so slots are refreshed.
+        self.assertGreater(serial._inference.refreshes, config.population_size)
+
+    def test_process_workers_match_the_thread_backend_bit_for_bit(self):
+        config = _evolution(
+            algorithm="genetic",
+            evaluation_steps=5,
+            mutation_rate=0.2,
+            mutation_std=0.01,
+        )
+        threaded = self._track(PopulationTrainer(config, _dqn(), parallel_workers=1))
+        processes = self._track(
+            PopulationTrainer(
+                config, _dqn(), parallel_workers=2, worker_backend="process"
+            )
+        )
+
+        threaded_steps = threaded.step_many(13)
+        process_steps = processes.step_many(13)
+
+        self.assertEqual(processes.generation, 2)
+        self.assertEqual(
+            [(step.action, step.reward, step.info) for step in process_steps],
+            [(step.action, step.reward, step.info) for step in threaded_steps],
+        )
+        _assert_nested_equal(self, threaded.state_dict(), processes.state_dict())
+        # Running members' worker state is written back after every call.
+        self.assertEqual(
+            [env.telemetry() for env in processes.member_environments],
+            [env.telemetry() for env in threaded.member_environments],
+        )
+        self.assertEqual(
+            [member.agent.action_counts for member in processes.population],
+            [member.agent.action_counts for member in threaded.population],
+        )
+        self.assertEqual(processes.telemetry()["worker_backend"], "process")
+        processes.close()
+        self.assertIsNone(processes._process_pool)
+
+        with self.assertRaisesRegex(ValueError, "greedy genetic"):
+            PopulationTrainer(_evolution(), _dqn(), worker_backend="process")
+        with self.assertRaisesRegex(ValueError, "worker_backend"):
+            PopulationTrainer(config, _dqn(), worker_backend="fork")
+
     def test_chunk_submits_once_per_member_and_preserves_real_concurrency(self):
         probe = _ConcurrencyProbe(parties=4)
         created = 0
@@ -630,6 +701,74 @@ class DrivingParallelEvolutionTests(unittest.TestCase):
             4,
         )
 
+    def test_hybrid_members_fold_n_step_returns_per_agent(self):
+        trainer = self._track(
+            PopulationTrainer(
+                _evolution(),
+                replace(_dqn(), n_step=2),
+                parallel_workers=2,
+                auto_evolve=False,
+            )
+        )
+
+        trainer.step()
+        self.assertTrue(
+            all(len(member.agent.replay) == 0 for member in trainer.population)
+        )
+        trainer.reset()
+        self.assertTrue(
+            all(
+                member.agent.telemetry()["pending_n_step"] == 0
+                for member in trainer.population
+            )
+        )
+        for _ in range(3):
+            trainer.step()
+
+        for member in trainer.population:
+            replay = tuple(member.agent.replay)
+            self.assertEqual(len(replay), 3)
+            self.assertEqual(
+                [transition.done for transition in replay], [False, True, True]
+            )
+            np.testing.assert_array_equal(replay[1].next_state, replay[2].next_state)
+
+    def test_batched_updates_match_independent_member_updates(self):
+        def run(**options):
+            trainer = self._track(
+                PopulationTrainer(_evolution(), _dqn(), auto_evolve=True, **options)
+            )
+            while trainer.generation < 2:
+                trainer.step_many(8)
+            return trainer
+
+        serial = run(parallel_workers=1)
+        batched = run(parallel_workers=2, batched_updates=True)
+
+        # Stacked kernels may round differently from one member's own matmul.
+        for first, second in zip(serial.history, batched.history, strict=True):
+            self.assertAlmostEqual(first.genome_diversity, second.genome_diversity)
+            self.assertEqual(
+                replace(first, genome_diversity=0.0),
+                replace(second, genome_diversity=0.0),
+            )
+        for first, second in zip(_parameters(serial), _parameters(batched)):
+            for left, right in zip(first, second):
+                torch.testing.assert_close(left, right)
+        self.assertGreater(batched._optimization_updates, 0)
+        self.assertEqual(
+            batched._optimization_updates, serial._optimization_updates
+        )
+        self.assertEqual(
+            batched.telemetry()["batched_updates"]["member_updates"],
+            batched._optimization_updates,
+        )
+        self.assertIsNone(batched._executor)
+        with self.assertRaisesRegex(ValueError, "genetic_dqn"):
+            PopulationTrainer(
+                _evolution(algorithm="genetic"), _dqn(), batched_updates=True
+            )
+
     def test_close_is_idempotent_and_prevents_more_steps(self):
         trainer = PopulationTrainer(
             _evolution(algorithm="genetic"),
@@ -1,4 +1,5 @@
 import math
+import random
 import unittest
 
 from drivingGameRL.src.circuits import (
@@ -9,7 +10,7 @@ from drivingGameRL.src.circuits import (
     get_circuit,
 )
 from drivingGameRL.src.environment import DrivingAction, DrivingEnv
-from drivingGameRL.src.math2d import Vec2
+from drivingGameRL.src.math2d import Vec2, clamp, wrap_angle
 from drivingGameRL.src.terrain import (
     TERRAINS,
     ParticleMode,
@@ -17,7 +18,12 @@ from drivingGameRL.src.terrain import (
     TerrainKind,
     terrain,
 )
-from drivingGameRL.src.vehicle import CarBuild, DriverControls, Vehicle
+from drivingGameRL.src.vehicle import (
+    CarBuild,
+    DriverControls,
+    Vehicle,
+    VehicleState,
+)
 
 
 class DrivingPhysicsTests(unittest.TestCase):
@@ -297,6 +303,112 @@ class DrivingPhysicsTests(unittest.TestCase):
             circuit.terrain_at(runoff_point).grip,
         )
 
+    def test_scalar_physics_kernel_matches_vec2_reference(self):
+        def reference_step(build, pose, controls, surface, dt):
+            position, velocity, heading, steering_angle = pose
+            controls = controls.clamped()
+            forward = Vec2.from_angle(heading)
+            longitudinal = velocity.dot(forward)
+            grip = surface.grip * build.grip_multiplier
+            steering_angle += (
+                controls.steering * build.steering_rate - steering_angle
+            ) * min(1.0, build.steering_response * dt)
+            speed_ratio = clamp(
+                abs(longitudinal) / max(1.0, build.max_speed), 0.0, 1.0
+            )
+            yaw_scale = (
+                clamp(abs(longitudinal) / 35.0, 0.0, 1.0)
+                * (1.0 - 0.35 * speed_ratio)
+                * grip
+                * build.stability
+            )
+            sign = -1.0 if longitudinal < -1.0 else 1.0
+            heading = wrap_angle(heading + steering_angle * yaw_scale * sign * dt)
+            forward = Vec2.from_angle(heading)
+            right = forward.perpendicular()
+            longitudinal = velocity.dot(forward)
+            lateral = velocity.dot(right)
+            engine = (
+                build.acceleration
+                * surface.engine_efficiency
+                * min(1.0, 0.50 + grip * 0.65)
+                * controls.throttle
+            )
+            braking = 0.0
+            if controls.brake > 0.0 and abs(longitudinal) > 0.05:
+                braking = -math.copysign(190.0 * controls.brake, longitudinal)
+            rolling = 0.0
+            if abs(longitudinal) > 0.05:
+                rolling = math.copysign(
+                    surface.rolling_resistance * 115.0, longitudinal
+                )
+            acceleration = (
+                engine + braking - 0.0018 * longitudinal * abs(longitudinal) - rolling
+            )
+            next_longitudinal = longitudinal + acceleration * dt
+            if longitudinal * next_longitudinal < 0.0 and (
+                controls.brake > 0.0 or controls.throttle == 0.0
+            ):
+                next_longitudinal = 0.0
+            next_longitudinal = clamp(
+                next_longitudinal, -build.max_speed * 0.34, build.max_speed
+            )
+            next_lateral = lateral * max(
+                0.0, 1.0 - 3.4 * grip * build.stability * dt
+            )
+            velocity = forward * next_longitudinal + right * next_lateral
+            return (position + velocity * dt, velocity, heading, steering_angle)
+
+        def reference_collision(pose, track_point, radius):
+            position, velocity, heading, steering_angle = pose
+            outward = (position - track_point).normalized()
+            if (position - track_point).length() > radius:
+                position = track_point + outward * radius
+                outward_speed = velocity.dot(outward)
+                if outward_speed > 0.0:
+                    velocity = velocity - outward * (1.28 * outward_speed)
+                    velocity = velocity * 0.68
+            return (position, velocity, heading, steering_angle)
+
+        rng = random.Random(17)
+        surfaces = [terrain(kind) for kind in TerrainKind]
+        for build in (CarBuild(), CarBuild(motor=5, wheels=3, grip=2)):
+            vehicle = Vehicle(build)
+            vehicle.reset(Vec2(12.5, -3.0), 2.9)
+            pose = (Vec2(12.5, -3.0), Vec2(), wrap_angle(2.9), 0.0)
+            for tick in range(600):
+                controls = DriverControls(
+                    throttle=rng.uniform(-1.2, 1.2),
+                    steering=rng.uniform(-1.2, 1.2),
+                    brake=rng.choice((0.0, 0.0, rng.random())),
+                )
+                surface = rng.choice(surfaces)
+                telemetry = vehicle.step(controls, surface, 1.0 / 60.0)
+                pose = reference_step(build, pose, controls, surface, 1.0 / 60.0)
+                if tick % 7 == 0:
+                    track_point = pose[0] + Vec2(
+                        rng.uniform(-20.0, 20.0), rng.uniform(-20.0, 20.0)
+                    )
+                    vehicle.resolve_collision(track_point, 9.0)
+                    pose = reference_collision(pose, track_point, 9.0)
+                    telemetry = vehicle.last_telemetry
+                state = vehicle.state
+                self.assertEqual(
+                    (state.position, state.velocity, state.heading),
+                    pose[:3],
+                )
+                self.assertEqual(state.steering_angle, pose[3])
+                self.assertEqual(telemetry.speed, pose[1].length())
+
+        state = VehicleState(position=Vec2(1.0, 2.0), velocity=Vec2(3.0, 4.0))
+        self.assertEqual((state.x, state.y, state.vx, state.vy), (1.0, 2.0, 3.0, 4.0))
+        self.assertEqual(state.speed, 5.0)
+        state.position = Vec2(-1.0, 0.5)
+        self.assertEqual(state.position, Vec2(-1.0, 0.5))
+        self.assertEqual(state, VehicleState(Vec2(-1.0, 0.5), Vec2(3.0, 4.0)))
+        with self.assertRaises(AttributeError):
+            state.extra = 1.0
+
     def test_motor_upgrade_improves_acceleration_and_max_speed(self):
         base = Vehicle(CarBuild(motor=0))
         upgraded = Vehicle(CarBuild(motor=5))
@@ -618,6 +730,36 @@ class DrivingPhysicsTests(unittest.TestCase):
         self.assertIn(snapshot["terrain"], {kind.value for kind in TerrainKind})
         self.assertGreater(snapshot["capabilities"]["max_speed"], 0.0)
 
+    def test_each_pose_is_projected_once_per_tick(self):
+        env = DrivingEnv("canyon_maze", seed=12)
+        collided_ticks = 0
+        for tick in range(400):
+            action = (
+                DrivingAction.STEER_LEFT if tick % 90 > 60 else DrivingAction.ACCELERATE
+            )
+            misses = env.projection_cache_stats()["misses"]
+            result = env.step(action)
+            # One fresh pose after moving, plus one after a barrier push-out.
+            self.assertEqual(
+                env.projection_cache_stats()["misses"] - misses,
+                1 + result.info["collided"],
+            )
+            collided_ticks += result.info["collided"]
+            state = env.vehicle.state
+            self.assertEqual(env.last_projection, env.circuit.project(state.position))
+            self.assertEqual(
+                env.telemetry()["terrain"],
+                env.circuit.terrain_at(state.position).kind.value,
+            )
+            if result.terminated or result.truncated:
+                env.reset()
+
+        stats = env.projection_cache_stats()
+        self.assertGreater(collided_ticks, 0)
+        self.assertGreater(stats["hit_rate"], 0.5)
+        # Read-only telemetry reuses the cache without perturbing its report.
+        self.assertEqual(env.telemetry()["projection_cache"], stats)
+
     def test_invalid_build_and_action_are_rejected(self):
         with self.assertRaises(ValueError):
             CarBuild(grip=6)
@@ -20,6 +20,9 @@ from drivingGameRL.src.learning_runtime import (
 from drivingGameRL.src.ml import DQNConfig
 from drivingGameRL.src.ml.evolution import EvolutionConfig, PopulationTrainer
 from drivingGameRL.src.sensor_clearance import (
+    DECISION_DTYPE,
+    DECISION_REASONS,
+    SensorClearanceDecision,
     SensorClearancePolicy,
     SensorClearanceStats,
 )
@@ -55,6 +58,13 @@ def _result(observation: tuple[float, ...], reward: float = 0.25) -> StepResult:
     )
 
 
+def _force_action(agent, action: DrivingAction) -> None:
+    # Serial population ticks choose from batched Q-values, worker threads
+    # from the agent's own forward pass; pin both decision entry points.
+    agent.select_action = lambda _state, *, explore=True: int(action)
+    agent.select_action_from_values = lambda _values, *, explore=True: int(action)
+
+
 def _tiny_dqn(seed: int = 11) -> DQNConfig:
     return DQNConfig(
         hidden_sizes=(8,),
@@ -237,6 +247,55 @@ class SensorClearancePolicyTests(unittest.TestCase):
         )
         self.assertEqual(len(snapshot["ray_clearances"]), 9)
 
+    def test_batched_decisions_match_decide_row_for_row(self):
+        # Equal weighted side space with unequal near rays reaches both
+        # near-ray tie breaks; the blocked fan reaches the remaining ones.
+        near_left = (0.0, 0.0, 0.0, 0.3, 0.2, 0.2, 0.0, 0.0, 0.44)
+        rng = np.random.default_rng(5)
+        random_rows = rng.uniform(-1.0, 1.0, size=(64, 16))
+        random_rows[:, -9:] = rng.choice((0.05, 0.2, 0.5, 0.9), size=(64, 9))
+        observations = [
+            _observation(),
+            _observation(speed=0.8, rays=(0.05,) * 9),
+            _observation(speed=0.1, rays=(0.05,) * 9),
+            _observation(speed=0.5, rays=near_left),
+            _observation(speed=0.5, rays=tuple(reversed(near_left))),
+            _observation(rays=(0.2,) * 9),
+            _observation(rays=(0.2,) * 9),
+            *random_rows,
+        ]
+        actions = [
+            DrivingAction.COAST,
+            DrivingAction.ACCELERATE,
+            DrivingAction.ACCELERATE,
+            DrivingAction.COAST,
+            DrivingAction.COAST,
+            DrivingAction.ACCELERATE,
+            DrivingAction.STEER_RIGHT,
+            *rng.integers(0, len(DrivingAction), size=64),
+        ]
+        expected = tuple(
+            self.policy.decide(observation, action)
+            for observation, action in zip(observations, actions)
+        )
+
+        batch = self.policy.decide_batch(observations, actions)
+
+        self.assertEqual(batch.dtype, DECISION_DTYPE)
+        self.assertEqual(SensorClearanceDecision.from_records(batch), expected)
+        self.assertEqual(self.policy.decide_many(observations, actions), expected)
+        self.assertEqual(set(DECISION_REASONS), {item.reason for item in expected})
+        bulk = SensorClearanceStats()
+        bulk.observe_batch(batch)
+        one_by_one = SensorClearanceStats()
+        for decision in expected:
+            one_by_one.observe(decision)
+        self.assertEqual(bulk.snapshot(), one_by_one.snapshot())
+        with self.assertRaisesRegex(ValueError, "normalized"):
+            self.policy.decide_batch([_observation(rays=(1.2,) * 9)], [0])
+        with self.assertRaisesRegex(ValueError, r"\[0, 5\)"):
+            self.policy.decide_batch([_observation()], [99])
+
     def test_invalid_action_and_non_nine_ray_observations_are_rejected(self):
         with self.assertRaisesRegex(ValueError, "exactly 16"):
             self.policy.decide((0.0,) * 15, DrivingAction.COAST)
@@ -328,12 +387,8 @@ class SensorClearanceIntegrationTests(unittest.TestCase):
             parallel_workers=1,
         )
         self.addCleanup(trainer.close)
-        trainer.population[0].agent.select_action = (
-            lambda _state, *, explore=True: int(DrivingAction.COAST)
-        )
-        trainer.population[1].agent.select_action = (
-            lambda _state, *, explore=True: int(DrivingAction.ACCELERATE)
-        )
+        _force_action(trainer.population[0].agent, DrivingAction.COAST)
+        _force_action(trainer.population[1].agent, DrivingAction.ACCELERATE)
         first_env = trainer.member_environments[0]
         original_step = first_env.step
 
@@ -425,11 +480,7 @@ class SensorClearanceIntegrationTests(unittest.TestCase):
                         zip(trainer.population, trainer._member_runtimes)
                     ):
                         runtime.observation = np.asarray(dangerous, dtype=np.float32)
-                        member.agent.select_action = (
-                            lambda _state, explore=True: int(
-                                DrivingAction.ACCELERATE
-                            )
-                        )
+                        _force_action(member.agent, DrivingAction.ACCELERATE)
 
                         def step(
                             action: int,
@@ -495,9 +546,7 @@ class SensorClearanceIntegrationTests(unittest.TestCase):
         self.addCleanup(trainer.close)
         for member, runtime in zip(trainer.population, trainer._member_runtimes):
             runtime.observation = np.asarray(dangerous, dtype=np.float32)
-            member.agent.select_action = lambda _state, explore=True: int(
-                DrivingAction.ACCELERATE
-            )
+            _force_action(member.agent, DrivingAction.ACCELERATE)
             runtime.env.step = lambda _action: _result(dangerous, reward=1.0)
         trainer._sync_focal_aliases(0)
 
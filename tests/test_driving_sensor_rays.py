@@ -5,6 +5,7 @@ from dataclasses import FrozenInstanceError
 from drivingGameRL.src.circuits import all_circuits
 from drivingGameRL.src.environment import DrivingAction, DrivingEnv, SensorRay
 from drivingGameRL.src.math2d import Vec2
+from drivingGameRL.src.track_field import ClearanceField
 
 
 class DrivingSensorRayTests(unittest.TestCase):
@@ -135,16 +136,32 @@ class DrivingSensorRayTests(unittest.TestCase):
                 self.projections = 0
                 self.batch_queries = 0
                 self.batch_samples = 0
+                self.exact_samples = 0
+                # Built over this wrapper so the field's exact fallback is
+                # counted too.
+                self.field = ClearanceField.build(self)
 
-            def project(self, position):
+            def project(self, position, hint=None):
                 self.projections += 1
-                return self.source.project(position)
+                return self.source.project(position, hint)
 
             def distances_to_centerline(self, positions):
                 self.batch_queries += 1
                 self.batch_samples += len(positions)
                 return self.source.distances_to_centerline(positions)
 
+            def distances_to_centerline_array(self, positions):
+                self.exact_samples += len(positions)
+                return self.source.distances_to_centerline_array(positions)
+
+            def clearance_field(self, *, cache_dir=None):
+                return self.field
+
+            def clearances(self, positions, threshold):
+                self.batch_queries += 1
+                self.batch_samples += len(positions)
+                return self.field.distances_at(positions, threshold)
+
             def __getattr__(self, name):
                 return getattr(self.source, name)
 
@@ -154,6 +171,7 @@ class DrivingSensorRayTests(unittest.TestCase):
         circuit.projections = 0
         circuit.batch_queries = 0
         circuit.batch_samples = 0
+        circuit.exact_samples = 0
         env.vehicle.state.heading += 0.001
 
         rays = env.sensor_rays()
@@ -165,7 +183,9 @@ class DrivingSensorRayTests(unittest.TestCase):
         self.assertEqual(len(rays), 9)
         self.assertEqual(circuit.projections, 0)
         self.assertLessEqual(circuit.batch_queries, 1 + env.SENSOR_REFINEMENT_STEPS)
+        self.assertGreater(circuit.batch_queries, 0)
         self.assertLessEqual(circuit.batch_samples, maximum_batched_samples)
+        self.assertLessEqual(circuit.exact_samples, circuit.batch_samples)
 
     def test_batched_centerline_distances_match_scalar_projection(self):
         for circuit in all_circuits():
@@ -231,6 +251,60 @@ class DrivingSensorRayTests(unittest.TestCase):
                 for ray, distance in zip(rays, expected):
                     self.assertAlmostEqual(ray.distance, distance, places=12)
 
+    def test_analytic_engine_reports_exact_barrier_contacts(self):
+        for circuit in all_circuits():
+            sampled = DrivingEnv(circuit, seed=9, random_start_curriculum=True)
+            analytic = DrivingEnv(
+                circuit,
+                seed=9,
+                random_start_curriculum=True,
+                sensor_engine="analytic",
+            )
+            within_refinement = 0
+            total = 0
+            for turn in range(16):
+                for env in (sampled, analytic):
+                    env.vehicle.state.heading += 0.41
+                for coarse, exact in zip(sampled.sensor_rays(), analytic.sensor_rays()):
+                    total += 1
+                    self.assertEqual(coarse.angle, exact.angle)
+                    # Sampling can step over a thin gap the analytic engine
+                    # sees, but it never finds a contact before the true one.
+                    self.assertLessEqual(exact.distance, coarse.distance + 1e-9)
+                    if coarse.distance - exact.distance <= (
+                        analytic.SENSOR_SAMPLE_STEP
+                        / 2**analytic.SENSOR_REFINEMENT_STEPS
+                        + 1e-9
+                    ):
+                        within_refinement += 1
+                    if exact.hit:
+                        clearance = circuit.project(exact.endpoint).distance
+                        self.assertAlmostEqual(
+                            clearance, circuit.collision_radius, places=6
+                        )
+                    else:
+                        self.assertEqual(exact.distance, exact.max_distance)
+            with self.subTest(circuit=circuit.slug):
+                self.assertGreaterEqual(within_refinement / total, 0.95)
+
+    def test_analytic_engine_is_cached_separately_and_validated(self):
+        env = DrivingEnv("canyon_maze", seed=2, sensor_engine="analytic")
+        first = env.sensor_rays()
+        self.assertIs(env.sensor_rays(), first)
+        env.sensor_engine = "sampled"
+        self.assertIsNot(env.sensor_rays(), first)
+        self.assertEqual(
+            env.circuit.barrier_exit_distances(
+                [(env.circuit.points[0].x + 500.0, env.circuit.points[0].y)],
+                [(1.0, 0.0)],
+            ).tolist(),
+            [0.0],
+        )
+        with self.assertRaisesRegex(ValueError, "sensor_engine"):
+            DrivingEnv("canyon_maze", sensor_engine="raster")
+        with self.assertRaisesRegex(ValueError, r"\(N, 2\)"):
+            env.circuit.barrier_exit_distances([(0.0, 0.0)], [(1.0, 0.0, 0.0)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,182 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from drivingGameRL.src.circuits import all_circuits, get_circuit
+from drivingGameRL.src.environment import DrivingEnv
+from drivingGameRL.src.math2d import Vec2
+from drivingGameRL.src.terrain import terrain
+from drivingGameRL.src.track_field import ClearanceField
+
+
+def random_track_points(circuit, rng, count):
+    points = []
+    for _ in range(count):
+        point, tangent = circuit.point_tangent_at(rng.random())
+        offset = rng.uniform(-1.4, 1.4) * circuit.collision_radius
+        point = point + tangent.perpendicular() * offset
+        points.append(
+            (point.x + rng.uniform(-3.0, 3.0), point.y + rng.uniform(-3.0, 3.0))
+        )
+    return np.asarray(points, dtype=np.float64)
+
+
+class ClearanceFieldTests(unittest.TestCase):
+    def test_threshold_comparisons_match_exact_distances(self):
+        rng = random.Random(11)
+        for circuit in all_circuits():
+            points = np.concatenate(
+                (
+                    random_track_points(circuit, rng, 2_000),
+                    # Far outside the raster the field must fall back to exact.
+                    np.asarray(((-5_000.0, 40.0), (9_000.0, 9_000.0))),
+                )
+            )
+            exact = circuit.distances_to_centerline_array(points)
+            for threshold in (circuit.track_width * 0.5, circuit.collision_radius):
+                readings = circuit.clearances(points, threshold)
+                with self.subTest(circuit=circuit.slug, threshold=threshold):
+                    self.assertTrue(
+                        np.array_equal(readings >= threshold, exact >= threshold)
+                    )
+                    self.assertTrue(
+                        np.array_equal(readings > threshold, exact > threshold)
+                    )
+                    self.assertLessEqual(
+                        float(np.max(np.abs(readings - exact))),
+                        circuit.clearance_field().exact_band,
+                    )
+
+    def test_terrain_lookup_matches_projection_reference(self):
+        rng = random.Random(4)
+        for circuit in all_circuits():
+            for x, y in random_track_points(circuit, rng, 1_500):
+                position = Vec2(float(x), float(y))
+                projection = circuit.project(position)
+                if projection.distance <= circuit.track_width * 0.5:
+                    expected = terrain(
+                        circuit.road_kind_at_progress(projection.progress)
+                    )
+                else:
+                    expected = terrain(circuit.runoff)
+                self.assertEqual(circuit.terrain_at(position), expected, position)
+
+    def test_sensor_fan_matches_exact_centerline_distances(self):
+        class ExactCircuit:
+            def __init__(self, source):
+                self.source = source
+
+            def clearances(self, positions, threshold):
+                return self.source.distances_to_centerline_array(positions)
+
+            def __getattr__(self, name):
+                return getattr(self.source, name)
+
+        for slug, seed in (("canyon_maze", 14), ("alpine_gauntlet", 6)):
+            fielded = DrivingEnv(slug, seed=seed, random_start_curriculum=True)
+            exact = DrivingEnv(
+                ExactCircuit(get_circuit(slug)),
+                seed=seed,
+                random_start_curriculum=True,
+            )
+            for turn in range(24):
+                for env in (fielded, exact):
+                    env.vehicle.state.heading += 0.26
+                with self.subTest(circuit=slug, turn=turn):
+                    self.assertEqual(fielded.observation(), exact.observation())
+
+    def test_hinted_and_indexed_projection_match_a_full_scan(self):
+        rng = random.Random(8)
+        for circuit in all_circuits():
+            segments = len(circuit.points)
+            points = [
+                Vec2(float(x), float(y))
+                for x, y in random_track_points(circuit, rng, 600)
+            ]
+            points.extend(
+                Vec2(rng.uniform(-600.0, 1_400.0), rng.uniform(-600.0, 1_300.0))
+                for _ in range(60)
+            )
+            for position in points:
+                expected = circuit._projection_result(
+                    circuit._project_segments(
+                        position.x, position.y, range(segments)
+                    )
+                )
+                self.assertEqual(circuit.project(position), expected)
+                for hint in (
+                    expected.segment_index,
+                    (expected.segment_index + 1) % segments,
+                    rng.randrange(segments),
+                ):
+                    self.assertEqual(circuit.project(position, hint), expected)
+
+    def test_projection_hints_are_validated(self):
+        circuit = get_circuit("canyon_maze")
+        position = circuit.points[2]
+        for hint in (-1, len(circuit.points), True, 1.0):
+            with self.assertRaisesRegex(ValueError, "hint"):
+                circuit.project(position, hint)
+        candidates = circuit.clearance_field().candidate_segments_at(
+            position.x, position.y
+        )
+        self.assertIn(1, candidates)
+        self.assertIn(2, candidates)
+        self.assertIsNone(
+            circuit.clearance_field().candidate_segments_at(-1e6, -1e6)
+        )
+
+    def test_disk_cache_round_trips_and_rebuilds_corrupt_files(self):
+        circuit = get_circuit("pine_sprint")
+        with tempfile.TemporaryDirectory() as directory:
+            built = ClearanceField.build(circuit, cell_size=8.0, cache_dir=directory)
+            files = list(Path(directory).glob("pine_sprint-*.npz"))
+            self.assertEqual(len(files), 1)
+
+            loaded = ClearanceField.build(circuit, cell_size=8.0, cache_dir=directory)
+            self.assertTrue(np.array_equal(loaded.distances, built.distances))
+            self.assertTrue(
+                np.array_equal(loaded.road_kind_codes, built.road_kind_codes)
+            )
+            self.assertTrue(np.array_equal(loaded.candidate_ids, built.candidate_ids))
+            self.assertTrue(
+                np.array_equal(loaded.candidate_table, built.candidate_table)
+            )
+            self.assertEqual(
+                (loaded.origin_x, loaded.origin_y), (built.origin_x, built.origin_y)
+            )
+
+            files[0].write_bytes(b"not a raster")
+            rebuilt = ClearanceField.build(circuit, cell_size=8.0, cache_dir=directory)
+            self.assertTrue(np.array_equal(rebuilt.distances, built.distances))
+            self.assertEqual(
+                ClearanceField.build(circuit, cell_size=8.0, cache_dir=directory)
+                .distances.shape,
+                built.distances.shape,
+            )
+            self.assertNotEqual(
+                ClearanceField.geometry_digest(circuit, 8.0, 200.0),
+                ClearanceField.geometry_digest(get_circuit("harbor_loop"), 8.0, 200.0),
+            )
+
+    def test_field_is_built_once_and_rejects_invalid_input(self):
+        circuit = get_circuit("desert_switchback")
+        self.assertIs(circuit.clearance_field(), circuit.clearance_field())
+        self.assertFalse(circuit.clearance_field().distances.flags.writeable)
+        with self.assertRaisesRegex(ValueError, "cell_size"):
+            ClearanceField.build(circuit, cell_size=0.0)
+        with self.assertRaisesRegex(ValueError, "margin"):
+            ClearanceField.build(circuit, margin=-1.0)
+        with self.assertRaisesRegex(ValueError, r"\(N, 2\)"):
+            circuit.clearances(np.zeros((3, 3)), 1.0)
+        with self.assertRaisesRegex(ValueError, "finite"):
+            circuit.clearances(np.asarray(((np.nan, 0.0),)), 1.0)
+        with self.assertRaisesRegex(ValueError, "finite"):
+            circuit.terrain_at(Vec2(float("inf"), 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()